@@ -74,6 +74,21 @@ class ConfigModel(pydantic.BaseModel):
     If unset, this defaults to exiting synchronously before the app exits.
     """
 
+    instance_warm_pool: pydantic.NonNegativeInt | None = None
+    """How many managed instances to prepare in the background for upcoming builds.
+
+    When building several platforms, this many of the following instances are
+    launched and configured while the current build runs. If unset, each instance
+    is launched when its build starts.
+    """
+
+    parallel_lifecycle: bool = False
+    """Run the lifecycle steps of independent parts concurrently.
+
+    Pulling and building parts that don't depend on each other may overlap, up to
+    the parallel build count. Each step's output is shown once the step finishes.
+    """
+
     experimental_monorepo: bool = False
     """Enable monorepo support, mounting the git working tree root as the build root.
 
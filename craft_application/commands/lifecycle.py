@@ -113,7 +113,9 @@ class _BaseLifecycleCommand(base.ExtensibleCommand):
     def _run_manager_for_build_plan(self, fetch_service_policy: str | None) -> None:
         """Run this command in managed mode, iterating over the generated build plan."""
         provider = self._services.get("provider")
-        for build in self._services.get("build_plan").plan():
+        build_plan = self._services.get("build_plan").plan()
+        provider.warm_instances(build_plan[1:])
+        for build in build_plan:
             provider.run_managed(build, bool(fetch_service_policy))
 
     def _use_provider(self, parsed_args: argparse.Namespace) -> bool:
@@ -721,7 +723,9 @@ class TestCommand(PackCommand):
         parsed_args.shell, parsed_args.shell_after = (False, False)
 
         # This loop allows us to (pack, test) for each platform.
-        for build_info in build_planner.plan():
+        build_plan = build_planner.plan()
+        provider.warm_instances(build_plan[1:])
+        for build_info in build_plan:
             emit.progress(f"Packing platform '{build_info.platform}'")
             parsed_args.platform = build_info.platform
             provider.run_managed(
@@ -774,6 +778,14 @@ class CleanCommand(_BaseLifecycleCommand):
             metavar="name",
             help="Platform to clean",
         )
+        parser.add_argument(
+            "--all-platforms",
+            action="store_true",
+            help=(
+                "Clean the build environments of every platform, including "
+                "platforms that were renamed or removed"
+            ),
+        )
 
     @override
     def _run(
@@ -796,7 +808,9 @@ class CleanCommand(_BaseLifecycleCommand):
         clean_instances = self._should_clean_instances(parsed_args)
 
         if build_managed and clean_instances:
-            self._services.provider.clean_instances()
+            self._services.provider.clean_instances(
+                all_platforms=parsed_args.all_platforms
+            )
         elif build_managed:
             self._run_manager_for_build_plan(fetch_service_policy=None)
         else:
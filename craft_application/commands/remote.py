@@ -13,12 +13,12 @@
 # with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Build a project remotely on Launchpad."""
 
-import argparse
+from __future__ import annotations
+
 import os
 import pathlib
 import time
-from collections.abc import Collection
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from craft_cli import emit
 from typing_extensions import override
@@ -28,6 +28,13 @@ from craft_application.commands import ExtensibleCommand
 from craft_application.launchpad.models import Build, BuildState
 from craft_application.remote.utils import get_build_id
 
+if TYPE_CHECKING:  # pragma: no cover
+    import argparse
+    import concurrent.futures
+    from collections.abc import Collection
+
+    from craft_application.services.remotebuild import BuildOutputs
+
 OVERVIEW = """
 Command remote-build sends the current project to be built
 remotely. After the build is complete, packages for each
@@ -164,6 +171,7 @@ class RemoteBuild(ExtensibleCommand):
         try:
             returncode = self._monitor_and_complete(builds=builds)
         except KeyboardInterrupt:
+            builder.stop_fetching()
             if emit.confirm("Cancel builds?", default=True):
                 emit.progress("Cancelling builds.")
                 builder.cancel_builds()
@@ -171,6 +179,7 @@ class RemoteBuild(ExtensibleCommand):
                 builder.cleanup()
             returncode = 0
         except TimeoutError:
+            builder.stop_fetching()
             resume_command = f"{self._app.name} remote-build --recover"
             emit.message(
                 f"Timed out waiting for build.\nTo resume, run {resume_command!r}"
@@ -184,11 +193,16 @@ class RemoteBuild(ExtensibleCommand):
     def _monitor_and_complete(self, *, builds: Collection[Build]) -> int:
         """Monitor the builds and complete them when done.
 
+        The log and artifacts of each build are downloaded in the background as
+        soon as that build stops, so finished builds don't wait on slower ones.
+
         :param builds: A collection of Builds to monitor.
         :returns: The expected exit code of the application.
         :raises: TimeoutError if a build timeout was reached.
         """
         builder = self._services.remote_build
+        output_dir = pathlib.Path.cwd()
+        fetches: dict[str, concurrent.futures.Future[BuildOutputs]] = {}
         emit.progress("Monitoring build")
         for states in builder.monitor_builds():
             building: set[str] = set()
@@ -219,15 +233,20 @@ class RemoteBuild(ExtensibleCommand):
             if pending:
                 progress_parts.append("Pending: " + ", ".join(sorted(pending)))
             emit.progress("; ".join(progress_parts))
+            fetches.update(
+                (arch, builder.fetch_build_outputs(arch, output_dir))
+                for arch, build_state in states.items()
+                if build_state.is_stopped and arch not in fetches
+            )
 
-        emit.progress("Fetching build artifacts...")
-        artifacts = builder.fetch_artifacts(pathlib.Path.cwd())
-
-        emit.progress(f"Fetching {len(builds)} build logs...")
-        logs = builder.fetch_logs(pathlib.Path.cwd())
+        outputs = self._finish_fetches(
+            builds=builds, fetches=fetches, output_dir=output_dir
+        )
 
-        log_names = sorted(path.name for path in logs.values() if path)
-        artifact_names = sorted(path.name for path in artifacts)
+        log_names = sorted(output.log.name for output in outputs if output.log)
+        artifact_names = sorted(
+            path.name for output in outputs for path in output.artifacts
+        )
 
         emit.message(
             "Build completed.\n"
@@ -235,3 +254,31 @@ class RemoteBuild(ExtensibleCommand):
             f"Artifacts: {', '.join(artifact_names)}"
         )
         return 0
+
+    def _finish_fetches(
+        self,
+        *,
+        builds: Collection[Build],
+        fetches: dict[str, concurrent.futures.Future[BuildOutputs]],
+        output_dir: pathlib.Path,
+    ) -> list[BuildOutputs]:
+        """Wait for the outputs of all builds to finish downloading.
+
+        :param builds: A collection of the monitored Builds.
+        :param fetches: The downloads already started, keyed by architecture.
+        :param output_dir: The directory into which to place the build outputs.
+        :returns: The downloaded outputs of every build.
+        """
+        builder = self._services.remote_build
+        # Builds that ended while cancelling never reach a stopped state during
+        # monitoring, but may still have a log to fetch.
+        for build in builds:
+            if build.arch_tag not in fetches:
+                fetches[build.arch_tag] = builder.fetch_build_outputs(
+                    build.arch_tag, output_dir
+                )
+
+        in_flight = sum(not fetch.done() for fetch in fetches.values())
+        if in_flight:
+            emit.progress(f"Waiting for {in_flight} of {len(fetches)} downloads...")
+        return [fetch.result() for fetch in fetches.values()]
@@ -33,7 +33,7 @@ from craft_application.util.string import humanize_list
 
 if TYPE_CHECKING:  # pragma: no cover
     import pathlib
-    from collections.abc import Collection, Sequence
+    from collections.abc import Collection, Mapping, Sequence
 
     import craft_parts
     import pydantic
@@ -388,6 +388,32 @@ class ArtifactCreationError(CraftError):
     """Errors to do with artifact file generation."""
 
 
+class PackArtifactsError(ArtifactCreationError):
+    """Some artifacts could not be packed.
+
+    :param packed: A mapping of artifact names to whether they were packed.
+    :param failures: A mapping of the names of artifacts that failed to their errors.
+    """
+
+    def __init__(
+        self,
+        packed: Mapping[str | None, bool],
+        failures: Mapping[str | None, BaseException],
+    ) -> None:
+        self.packed = packed
+        self.failures = failures
+        if len(failures) == 1:
+            name = next(iter(failures))
+            artifact = "the default artifact" if name is None else f"artifact {name!r}"
+            message = f"Could not pack {artifact}."
+        else:
+            message = f"Could not pack {len(failures)} artifacts."
+        details = "\n".join(
+            f"{name or 'default'}: {error}" for name, error in failures.items()
+        )
+        super().__init__(message, details=details)
+
+
 class StateServiceError(CraftError):
     """Errors related to the state service."""
 
@@ -17,10 +17,21 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import hashlib
+import http
+import pathlib
+import tempfile
+import threading
+import time
 from typing import TYPE_CHECKING, Any, Literal, overload
 
+import httplib2  # type: ignore[import-untyped]
+import launchpadlib
 import launchpadlib.launchpad
 import launchpadlib.uris
+import lazr.restfulclient
 import lazr.restfulclient.errors
 import platformdirs
 from typing_extensions import Self
@@ -28,9 +39,143 @@ from typing_extensions import Self
 from . import models
 
 if TYPE_CHECKING:
-    import pathlib
+    from collections.abc import Callable
 
 DEFAULT_CACHE_PATH = platformdirs.user_cache_path("launchpad-client")
+SERVICE_ROOT_CACHE_VERSION = 1
+"""The version of the on-disk service root cache. Bump this if its format changes."""
+SERVICE_ROOT_CACHE_MAX_AGE = 24 * 60 * 60
+"""The number of seconds for which a cached service root is reused."""
+
+
+class _ServiceRootCachingHttp(launchpadlib.launchpad.LaunchpadOAuthAwareHttp):
+    """An HTTP client that keeps the service root's representations on disk.
+
+    Every login fetches the service root twice: once for its WADL description and
+    once for its JSON representation. Neither depends on the user and both rarely
+    change, so they're reused across invocations for up to
+    ``SERVICE_ROOT_CACHE_MAX_AGE`` seconds rather than downloaded and validated
+    each time. The cache is keyed on the service root URL, the media type and the
+    versions of launchpadlib and lazr.restfulclient.
+    """
+
+    def request(  # type: ignore[override]
+        self,
+        uri: str,
+        method: str = "GET",
+        body: str | None = None,
+        headers: dict[str, str] | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> tuple[httplib2.Response, bytes]:
+        cache_file = self._get_cache_file(uri, method, headers or {})
+        if cache_file is None:
+            return super().request(uri, method, body, headers, *args, **kwargs)
+
+        with contextlib.suppress(OSError):
+            if time.time() - cache_file.stat().st_mtime < SERVICE_ROOT_CACHE_MAX_AGE:
+                response = httplib2.Response(
+                    {"status": "200", "content-type": (headers or {})["Accept"]}
+                )
+                response.fromcache = True
+                return response, cache_file.read_bytes()
+
+        response, content = super().request(uri, method, body, headers, *args, **kwargs)
+        if response.status == http.HTTPStatus.OK and isinstance(content, bytes):
+            with contextlib.suppress(OSError):
+                _write_atomically(cache_file, content)
+        return response, content
+
+    def _get_cache_file(
+        self, uri: str, method: str, headers: dict[str, str]
+    ) -> pathlib.Path | None:
+        """Get the cache file for a request, or None if it shouldn't be cached."""
+        cache_dir = _get_cache_dir(self.cache)
+        root_uri = getattr(self.launchpad, "_root_uri", None)
+        if (
+            method != "GET"
+            or cache_dir is None
+            or root_uri is None
+            or uri != str(root_uri)
+            or "Accept" not in headers
+        ):
+            return None
+        key = "\0".join(
+            (
+                uri,
+                headers["Accept"],
+                launchpadlib.__version__,
+                lazr.restfulclient.__version__,
+            )
+        )
+        return (
+            pathlib.Path(cache_dir)
+            / f"service-root-v{SERVICE_ROOT_CACHE_VERSION}"
+            / hashlib.sha256(key.encode()).hexdigest()
+        )
+
+
+def _get_cache_dir(cache: object) -> str | None:
+    """Get the directory of lazr.restfulclient's or httplib2's file cache."""
+    return getattr(cache, "_cache_dir", None) or getattr(cache, "cache", None)
+
+
+def _write_atomically(path: pathlib.Path, content: bytes) -> None:
+    """Write a file such that concurrent readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as file:
+        file.write(content)
+    pathlib.Path(file.name).replace(path)
+
+
+class _PerThreadHttp:
+    """Dispatch requests to an HTTP client owned by the calling thread.
+
+    Neither httplib2 clients nor lazr.restfulclient's caches are thread-safe. The
+    client of each thread shares credentials and the cache directory, but has its
+    own connections and cache object.
+    """
+
+    def __init__(self, factory: Callable[[], httplib2.Http]) -> None:
+        self._factory = factory
+        self._local = threading.local()
+
+    @property
+    def http(self) -> httplib2.Http:
+        """The HTTP client of the current thread."""
+        if not hasattr(self._local, "http"):
+            self._local.http = self._factory()
+        return self._local.http
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        return getattr(self.http, name)
+
+
+class _LaunchpadClient(launchpadlib.launchpad.Launchpad):
+    """A launchpadlib client that may be shared between threads.
+
+    It also caches the service root on disk.
+    """
+
+    def httpFactory(  # noqa: N802 (overriding launchpadlib)
+        self, credentials: object, cache: object, timeout: object, proxy_info: object
+    ) -> _PerThreadHttp:
+        cache_dir = _get_cache_dir(cache)
+        # Each thread gets its own file cache of the same type, in the same place.
+        cache_type: Callable[[str], object] = type(cache)
+
+        def _new_http() -> httplib2.Http:
+            thread_cache = cache if cache_dir is None else cache_type(cache_dir)
+            return _ServiceRootCachingHttp(
+                self,
+                self.authorization_engine,
+                credentials,
+                thread_cache,
+                timeout,
+                proxy_info,
+            )
+
+        return _PerThreadHttp(_new_http)
 
 
 class Launchpad:
@@ -41,10 +186,17 @@ class Launchpad:
     ) -> None:
         self.app_name = app_name
         self.lp = launchpad
+
+    @functools.cached_property
+    def username(self) -> str:
+        """The name of the logged-in user, or "anonymous".
+
+        This is only fetched from Launchpad on first use.
+        """
         try:
-            self.username = str(self.lp.me.name)
+            return str(self.lp.me.name)
         except lazr.restfulclient.errors.Unauthorized:
-            self.username = "anonymous"
+            return "anonymous"
 
     @classmethod
     def anonymous(
@@ -61,7 +213,7 @@ class Launchpad:
             cache_dir.expanduser().resolve().mkdir(exist_ok=True, parents=True)
         return cls(
             app_name,
-            launchpadlib.launchpad.Launchpad.login_anonymously(
+            _LaunchpadClient.login_anonymously(
                 consumer_name=app_name,
                 service_root=root,
                 launchpadlib_dir=cache_dir,
@@ -80,7 +232,10 @@ class Launchpad:
         version: str = "devel",
         **kwargs: Any,
     ) -> Self:
-        """Login to Launchpad."""
+        """Login to Launchpad.
+
+        The returned client may be used from multiple threads.
+        """
         if cache_dir:
             cache_dir.expanduser().resolve()
             cache_dir.mkdir(exist_ok=True, parents=True)
@@ -89,7 +244,7 @@ class Launchpad:
             credentials_file.parent.mkdir(mode=0o700, exist_ok=True, parents=True)
         return cls(
             app_name,
-            launchpadlib.launchpad.Launchpad.login_with(
+            _LaunchpadClient.login_with(
                 application_name=app_name,
                 service_root=root,
                 launchpadlib_dir=cache_dir,
@@ -18,7 +18,7 @@
 from __future__ import annotations
 
 import enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar, NamedTuple
 
 import lazr.restfulclient.errors
 from lazr.restfulclient.resource import Entry
@@ -27,7 +27,7 @@ from typing_extensions import Any
 from craft_application.launchpad import errors, util
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Mapping
 
     from craft_application.launchpad import Launchpad
 
@@ -53,12 +53,71 @@ class Pocket(enum.Enum):
     BACKPORTS = "Backports"
 
 
+class _AttributeSpec(NamedTuple):
+    """How to get one of a LaunchpadObject class's declared attributes."""
+
+    path: tuple[str, ...] | None
+    """The attribute path on the Launchpad entry, if mapped in ``_attr_map``."""
+    wrapper: Callable[..., Any] | None
+    """The annotated type used to wrap the raw value, if any."""
+    is_lp_object: bool
+    """Whether the wrapper is a LaunchpadObject class."""
+
+
+class _LaunchpadNames(NamedTuple):
+    """A snapshot of the parameter names of a Launchpad entry."""
+
+    attributes: frozenset[str]
+    entries: frozenset[str]
+    collections: frozenset[str]
+
+
+_INSTANCE_CACHES = frozenset({"_lp_names", "_lp_objects"})
+"""Names of the per-object caches kept in a LaunchpadObject's ``__dict__``."""
+
+
 class LaunchpadObject:
     """A generic Launchpad object."""
 
     _resource_types: enum.EnumMeta
     _attr_map: Mapping[str, str] = {}
     """Mapping of attributes for this object to their paths in Launchpad."""
+    _cache_lp_names: bool = True
+    """Whether to snapshot the entry's attribute names until the next refresh.
+
+    Getting these names from launchpadlib walks the entry's WADL description on
+    every call, so they are cached unless a subclass sets this to False.
+    """
+    _attribute_specs: ClassVar[Mapping[str, _AttributeSpec] | None] = None
+    """The dispatch table for this class's declared attributes, once built."""
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        # Each class builds its own table, rather than using its parent's.
+        cls._attribute_specs = None
+
+    @classmethod
+    def _get_attribute_specs(cls) -> Mapping[str, _AttributeSpec]:
+        """Get the dispatch table for this class's declared attributes.
+
+        Annotations are evaluated on first use rather than at class creation so
+        that they may refer to classes defined later in the same module.
+        """
+        if cls._attribute_specs is not None:
+            return cls._attribute_specs
+        annotations = util.get_annotations(cls)
+        specs: dict[str, _AttributeSpec] = {}
+        for name in {*annotations, *cls._attr_map}:
+            wrapper = annotations.get(name)
+            path = cls._attr_map.get(name)
+            specs[name] = _AttributeSpec(
+                path=None if path is None else tuple(path.split(".")),
+                wrapper=wrapper,
+                is_lp_object=isinstance(wrapper, type)
+                and issubclass(wrapper, LaunchpadObject),
+            )
+        cls._attribute_specs = specs
+        return specs
 
     def __init__(self, lp: Launchpad, lp_obj: Entry) -> None:
         self._lp = lp
@@ -92,56 +151,82 @@ class LaunchpadObject:
         """The resource type of the Launchpad entry."""
         return util.get_resource_type(self._obj)
 
+    def _get_lp_names(self) -> _LaunchpadNames:
+        """Get the attribute, entry and collection names of the Launchpad entry."""
+        names: _LaunchpadNames | None = self.__dict__.get("_lp_names")
+        if names is None:
+            names = _LaunchpadNames(
+                attributes=frozenset(self._obj.lp_attributes),
+                entries=frozenset(self._obj.lp_entries),
+                collections=frozenset(self._obj.lp_collections),
+            )
+            if self._cache_lp_names:
+                self.__dict__["_lp_names"] = names
+        return names
+
+    def _clear_caches(self) -> None:
+        """Forget any cached information about the Launchpad entry."""
+        self.__dict__["_lp_names"] = None
+        self.__dict__["_lp_objects"] = {}
+
     def __dir__(self) -> list[str]:
         """Get the attributes of this object, including Launchpad attrs and entries."""
         return sorted(
             {
                 *super().__dir__(),
-                *util.get_annotations(self.__class__).keys(),
-                *self._attr_map.keys(),
+                *self._get_attribute_specs().keys(),
                 *self.__dict__.keys(),
-                *self._obj.lp_attributes,
+                *self._get_lp_names().attributes,
             }
+            - _INSTANCE_CACHES
         )
 
     def __getattr__(self, item: str) -> Any:  # noqa: ANN401
-        annotations: dict[str, type] = util.get_annotations(self.__class__)
-        if item in self._attr_map:
-            lp_obj = util.getattrs(self._obj, self._attr_map[item])
-        elif item in (*annotations, *self._obj.lp_attributes):
-            lp_obj = getattr(self._obj, item)
-        elif item in self._obj.lp_collections:
-            raise NotImplementedError("Cannot yet return collections")
-        elif item in self._obj.lp_entries and item not in annotations:
-            raise NotImplementedError("Cannot get this item type.")
+        lp_objects: dict[str, LaunchpadObject] = self.__dict__.setdefault(
+            "_lp_objects", {}
+        )
+        if item in lp_objects:
+            return lp_objects[item]
+
+        spec = self._get_attribute_specs().get(item)
+        if spec is not None:
+            if spec.path is not None:
+                lp_obj = util.getattrs(self._obj, spec.path)
+            else:
+                lp_obj = getattr(self._obj, item)
         else:
+            names = self._get_lp_names()
+            if item in names.attributes:
+                return getattr(self._obj, item)
+            if item in names.collections:
+                raise NotImplementedError("Cannot yet return collections")
+            if item in names.entries:
+                raise NotImplementedError("Cannot get this item type.")
             raise AttributeError(
                 f"{self.__class__.__name__!r} has no attribute {item!r}"
             )
 
-        if item in annotations:
-            cls = annotations[item]
-            if isinstance(cls, type) and issubclass(cls, LaunchpadObject):
-                return cls(self._lp, lp_obj)
-            # We expect that this class can take the object.
-            return cls(lp_obj)
-        return lp_obj
+        if spec.wrapper is None:
+            return lp_obj
+        if spec.is_lp_object:
+            wrapped = spec.wrapper(self._lp, lp_obj)
+            lp_objects[item] = wrapped
+            return wrapped
+        # We expect that this class can take the object.
+        return spec.wrapper(lp_obj)
 
     def __setattr__(self, key: str, value: Any) -> None:  # noqa: ANN401
         if key in ("_lp", "_obj"):
             self.__dict__[key] = value
+            self._clear_caches()
+            return
+        spec = self._get_attribute_specs().get(key)
+        if spec is not None:
+            self.__dict__.get("_lp_objects", {}).pop(key, None)
+            util.set_innermost_attr(self._obj, spec.path or (key,), value)
             return
-        annotations = util.get_annotations(self.__class__)
-        if key in annotations:
-            attr_path = self._attr_map.get(key, key)
-            util.set_innermost_attr(self._obj, attr_path, value)
-        elif key in self._attr_map:
-            util.set_innermost_attr(self._obj, self._attr_map[key], value)
-        elif key in (
-            *self._obj.lp_attributes,
-            *self._obj.lp_entries,
-            *self._obj.lp_collections,
-        ):
+        names = self._get_lp_names()
+        if key in names.attributes | names.entries | names.collections:
             setattr(self._obj, key, value)
         else:
             raise AttributeError(
@@ -170,3 +255,4 @@ class LaunchpadObject:
     def lp_refresh(self) -> None:
         """Refresh the underlying Launchpad object."""
         self._obj.lp_refresh()
+        self._clear_caches()
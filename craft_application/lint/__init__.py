@@ -17,26 +17,37 @@
 
 from __future__ import annotations
 
+from ._cache import CacheStats, LintCache
+from ._files import FileEntry, FileIndex
 from ._types import (
     ExitCode,
     IgnoreConfig,
+    IgnoreMatcher,
     IgnoreSpec,
     LintContext,
     LinterIssue,
     Severity,
     Stage,
+    compile_ignore_config,
     should_ignore,
 )
-from .base import AbstractLinter
+from .base import AbstractFileLinter, AbstractLinter
 
 __all__ = [
+    "CacheStats",
     "ExitCode",
+    "FileEntry",
+    "FileIndex",
     "IgnoreConfig",
+    "IgnoreMatcher",
     "IgnoreSpec",
+    "LintCache",
     "LintContext",
     "LinterIssue",
     "Severity",
     "Stage",
+    "compile_ignore_config",
     "should_ignore",
+    "AbstractFileLinter",
     "AbstractLinter",
 ]
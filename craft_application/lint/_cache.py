@@ -0,0 +1,175 @@
+# This file is part of craft-application.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""A cache of the issues found by file linters, keyed by each file's digest."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from craft_cli import emit
+
+from ._types import LinterIssue, Severity
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from ._types import LintContext
+    from .base import AbstractFileLinter
+
+_CACHE_VERSION = 1
+
+
+class CacheStats(NamedTuple):
+    """How many files a linter's cached issues were used for in a run."""
+
+    hits: int
+    misses: int
+
+
+class LintCache:
+    """Issues found by file linters in previous runs.
+
+    Each linter's issues are stored per file, along with the digest of the file's
+    contents. When a file's digest is unchanged, its issues are replayed instead of
+    linting it again. A linter's issues are all discarded when its version or
+    cache key changes.
+
+    Issues are stored before the user's ignore rules apply, so changing the rules
+    doesn't invalidate the cache.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._linters: dict[str, dict[str, Any]] = {}
+        self._stats: dict[str, CacheStats] = {}
+
+    @classmethod
+    def load(cls, path: Path) -> LintCache:
+        """Load the cache from a file, or start an empty cache if it can't be read.
+
+        :param path: The path of the cache file.
+        """
+        cache = cls(path)
+        try:
+            data = json.loads(path.read_text())
+            if data["version"] == _CACHE_VERSION and isinstance(data["linters"], dict):
+                cache._linters = data["linters"]
+        except (OSError, ValueError, LookupError, TypeError):
+            pass
+        return cache
+
+    def save(self) -> None:
+        """Save the cache to its file."""
+        with self._lock:
+            data = {"version": _CACHE_VERSION, "linters": self._linters}
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._path.write_text(json.dumps(data))
+        except OSError as exc:
+            emit.debug(f"Could not save the lint cache: {exc}")
+
+    @property
+    def stats(self) -> dict[str, CacheStats]:
+        """Get the cache hits and misses of each linter run with this cache."""
+        with self._lock:
+            return dict(self._stats)
+
+    def run(
+        self, linter: AbstractFileLinter, ctx: LintContext
+    ) -> Iterator[LinterIssue]:
+        """Run a file linter, replaying cached issues for unchanged files.
+
+        The cache is only updated once the linter has checked all of its files.
+
+        :param linter: The linter to run.
+        :param ctx: The lint context to run the linter with.
+        """
+        key = [linter.version, linter.cache_key(ctx)]
+        roots = linter.roots(ctx)
+        with self._lock:
+            cached = self._linters.get(linter.name)
+        cached_files: dict[str, Any] = {}
+        if isinstance(cached, dict) and cached.get("key") == key:
+            saved_files = cached.get("files")
+            if isinstance(saved_files, dict):
+                cached_files = saved_files
+        files: dict[str, Any] = {}
+        hits = misses = 0
+        for entry in linter.files(ctx):
+            root = next((r for r in roots if entry.path.is_relative_to(r)), None)
+            name = entry.path.relative_to(root).as_posix() if root else str(entry.path)
+            digest = ctx.files.digest(entry.path)
+            issues = _load_issues(cached_files.get(name), digest, root)
+            if issues is None:
+                misses += 1
+                issues = list(linter.lint_file(ctx, entry))
+            else:
+                hits += 1
+            files[name] = {
+                "digest": digest,
+                "issues": [_marshal_issue(issue, root) for issue in issues],
+            }
+            yield from issues
+        with self._lock:
+            self._linters[linter.name] = {"key": key, "files": files}
+            self._stats[linter.name] = CacheStats(hits=hits, misses=misses)
+
+
+def _marshal_issue(issue: LinterIssue, root: Path | None) -> dict[str, Any]:
+    """Marshal an issue, storing its filename relative to the root if it's inside."""
+    filename = issue.filename
+    relative = False
+    if root is not None and filename.startswith(f"{root}{os.sep}"):
+        filename = filename[len(str(root)) + 1 :]
+        relative = True
+    return {
+        "id": issue.id,
+        "message": issue.message,
+        "severity": issue.severity.name,
+        "filename": filename,
+        "relative": relative,
+        "url": issue.url,
+    }
+
+
+def _load_issues(
+    data: object, digest: str, root: Path | None
+) -> list[LinterIssue] | None:
+    """Load a file's cached issues, if they were cached for the same digest."""
+    try:
+        if not isinstance(data, dict) or data["digest"] != digest:
+            return None
+        return [
+            LinterIssue(
+                id=issue["id"],
+                message=issue["message"],
+                severity=Severity[issue["severity"]],
+                filename=(
+                    f"{root}{os.sep}{issue['filename']}"
+                    if issue["relative"] and root is not None
+                    else issue["filename"]
+                ),
+                url=issue["url"],
+            )
+            for issue in data["issues"]
+        ]
+    except (LookupError, TypeError):
+        return None
@@ -0,0 +1,289 @@
+# This file is part of craft-application.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""A file index shared between the linters of a lint run."""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import stat
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+    from pathlib import Path
+
+_T = TypeVar("_T")
+
+DEFAULT_HEAD_SIZE = 4096
+"""The number of bytes read by :meth:`FileIndex.head` by default."""
+
+MAX_MAPPED_FILES = 64
+"""The number of file contents that :class:`FileIndex` keeps mapped at once."""
+
+_DIGEST_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class FileEntry:
+    """A file, directory or symlink found while indexing a directory.
+
+    The metadata is that of the entry itself, not of a symlink's target.
+    """
+
+    path: Path
+    size: int
+    mode: int
+    mtime: float
+
+    @property
+    def is_file(self) -> bool:
+        """Whether the entry is a regular file."""
+        return stat.S_ISREG(self.mode)
+
+    @property
+    def is_dir(self) -> bool:
+        """Whether the entry is a directory."""
+        return stat.S_ISDIR(self.mode)
+
+    @property
+    def is_symlink(self) -> bool:
+        """Whether the entry is a symbolic link."""
+        return stat.S_ISLNK(self.mode)
+
+
+class FileIndex:
+    """A lazily built index of the files that linters inspect.
+
+    Each directory is walked the first time its entries are requested, and each
+    view of a file is read the first time it's requested. The results are then
+    shared by every linter in the run, including linters running in parallel.
+    When several linters request the same view at once, only one of them reads
+    it and the others wait for the result.
+
+    Each memory map holds an open file descriptor, so only the most recently
+    requested :data:`MAX_MAPPED_FILES` contents are kept mapped. Older maps are
+    unmapped once no linter holds them, and the rest when :meth:`close` is called.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: dict[tuple[str, Path], Future[Any]] = {}
+        self._trees: dict[Path, list[FileEntry]] = {}
+        self._entries: dict[Path, FileEntry] = {}
+        # Each head is stored with whether it holds the whole file.
+        self._heads: dict[Path, tuple[bytes, bool]] = {}
+        self._contents: OrderedDict[Path, mmap.mmap | bytes] = OrderedDict()
+        self._digests: dict[Path, str] = {}
+
+    def entries(self, root: Path) -> list[FileEntry]:
+        """Get every entry below a directory, sorted by path.
+
+        Symlinks to directories are listed but not followed. A directory that
+        doesn't exist has no entries.
+
+        :param root: The directory to index.
+        """
+        return self._get_once("tree", root, self._trees, lambda: self._index_tree(root))
+
+    def get(self, path: Path) -> FileEntry:
+        """Get the entry for a single path.
+
+        :param path: The path of the file, directory or symlink.
+        :raises FileNotFoundError: if the path doesn't exist.
+        """
+        return self._get_once(
+            "entry", path, self._entries, lambda: _get_entry(path, path.lstat())
+        )
+
+    def head(self, path: Path, size: int = DEFAULT_HEAD_SIZE) -> bytes:
+        """Get the first bytes of a file, for example to check its magic number.
+
+        If the file's contents are already mapped, the bytes come from the map.
+
+        :param path: The path of the file.
+        :param size: The maximum number of bytes to get.
+        """
+        with self._lock:
+            if path in self._contents:
+                self._contents.move_to_end(path)
+                return bytes(self._contents[path][:size])
+        read_size = max(size, DEFAULT_HEAD_SIZE)
+        head, complete = self._get_once(
+            "head", path, self._heads, lambda: _read_head(path, read_size)
+        )
+        if complete or len(head) >= size:
+            return head[:size]
+        head, complete = _read_head(path, read_size)
+        with self._lock:
+            self._heads[path] = (head, complete)
+        return head[:size]
+
+    def content(self, path: Path) -> mmap.mmap | bytes:
+        """Get the full contents of a file as a read-only memory map.
+
+        Empty files can't be mapped, so their contents are empty bytes.
+
+        :param path: The path of the file.
+        """
+        with self._lock:
+            if path in self._contents:
+                self._contents.move_to_end(path)
+                return self._contents[path]
+        content = self._get_once(
+            "content", path, self._contents, lambda: _map_file(path)
+        )
+        with self._lock:
+            while len(self._contents) > MAX_MAPPED_FILES:
+                # Not closed here, as a linter may still be reading it.
+                self._contents.popitem(last=False)
+        return content
+
+    def digest(self, path: Path) -> str:
+        """Get the SHA-256 hex digest of a file's contents.
+
+        The file is read in chunks rather than mapped, unless it's already mapped.
+
+        :param path: The path of the file.
+        """
+        with self._lock:
+            content = self._contents.get(path)
+        if content is not None:
+            return self._get_once(
+                "digest",
+                path,
+                self._digests,
+                lambda: hashlib.sha256(content).hexdigest(),
+            )
+        return self._get_once(
+            "digest", path, self._digests, lambda: _get_file_digest(path)
+        )
+
+    def close(self) -> None:
+        """Unmap all mapped file contents.
+
+        The index can still be used afterwards. Contents are mapped again when
+        they're next requested.
+        """
+        with self._lock:
+            contents = list(self._contents.values())
+            self._contents.clear()
+        for content in contents:
+            if isinstance(content, mmap.mmap):
+                content.close()
+
+    def _index_tree(self, root: Path) -> list[FileEntry]:
+        """Walk a directory and add its entries to the index."""
+        entries = sorted(_walk(root), key=lambda entry: entry.path)
+        with self._lock:
+            for entry in entries:
+                self._entries.setdefault(entry.path, entry)
+        return entries
+
+    def _get_once(
+        self, kind: str, path: Path, cache: dict[Path, _T], load: Callable[[], _T]
+    ) -> _T:
+        """Get a cached view of a path, loading it if it isn't cached.
+
+        If another thread is already loading the same view, wait for its result
+        instead of loading it again.
+
+        :param kind: The kind of view, which identifies it along with the path.
+        :param path: The path to get the view of.
+        :param cache: Where the view is cached once it's loaded.
+        :param load: A function that loads the view.
+        """
+        key = (kind, path)
+        with self._lock:
+            if path in cache:
+                return cache[path]
+            pending = self._pending.get(key)
+            if pending is None:
+                future: Future[_T] = Future()
+                self._pending[key] = future
+        if pending is not None:
+            return cast("_T", pending.result())
+
+        try:
+            value = load()
+        except BaseException as exc:
+            with self._lock:
+                del self._pending[key]
+            future.set_exception(exc)
+            raise
+        with self._lock:
+            cache[path] = value
+            del self._pending[key]
+        future.set_result(value)
+        return value
+
+
+def _get_entry(path: Path, stat_result: os.stat_result) -> FileEntry:
+    """Create an index entry from the result of a stat call."""
+    return FileEntry(
+        path=path,
+        size=stat_result.st_size,
+        mode=stat_result.st_mode,
+        mtime=stat_result.st_mtime,
+    )
+
+
+def _walk(root: Path) -> list[FileEntry]:
+    """Get the entries below a directory, without following symlinks."""
+    entries: list[FileEntry] = []
+    directories = [root]
+    while directories:
+        directory = directories.pop()
+        try:
+            scan = os.scandir(directory)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with scan:
+            for dir_entry in scan:
+                path = directory / dir_entry.name
+                entries.append(_get_entry(path, dir_entry.stat(follow_symlinks=False)))
+                if dir_entry.is_dir(follow_symlinks=False):
+                    directories.append(path)
+    return entries
+
+
+def _read_head(path: Path, size: int) -> tuple[bytes, bool]:
+    """Read the first bytes of a file, and whether they're the whole file."""
+    with path.open("rb") as file:
+        head = file.read(size)
+    return head, len(head) < size
+
+
+def _map_file(path: Path) -> mmap.mmap | bytes:
+    """Map a file's contents read-only, or get empty bytes for an empty file."""
+    with path.open("rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _get_file_digest(path: Path) -> str:
+    """Get the SHA-256 hex digest of a file, reading it in chunks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as file:
+        while chunk := file.read(_DIGEST_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -17,12 +17,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+import re
+from dataclasses import dataclass, field
 from enum import Enum, IntEnum
-from fnmatch import fnmatch
+from fnmatch import fnmatch, translate
 from typing import TYPE_CHECKING
 
+from ._files import FileIndex
+
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Mapping
     from pathlib import Path
 
     from craft_application.models import Project
@@ -58,11 +63,14 @@ class LintContext:
     - project_dir: the source tree on disk
     - project: the parsed project model (available for pre-lint)
     - artifact_dirs: list of directories with built artifacts (may be empty in pre-stage)
+    - files: a file index shared by all linters, to walk directories and read
+      files only once
     """
 
     project_dir: Path
     artifact_dirs: list[Path]
     project: Project | None = None
+    files: FileIndex = field(default_factory=FileIndex, compare=False, repr=False)
 
 
 @dataclass(frozen=True, slots=True)
@@ -106,3 +114,51 @@ def should_ignore(linter_name: str, issue: LinterIssue, cfg: IgnoreConfig) -> bo
         return True
     globs = spec.by_filename.get(issue.id, set()) or set()
     return any(fnmatch(issue.filename, g) for g in globs)
+
+
+@dataclass(frozen=True, slots=True)
+class IgnoreMatcher:
+    """Suppression rules for one linter, compiled for matching many issues.
+
+    - ignore_all: whether every issue is ignored
+    - ids: issue ids that are always ignored
+    - by_filename: map of issue id -> one regex combining all its filename globs
+    """
+
+    ignore_all: bool = False
+    ids: frozenset[str] = frozenset()
+    by_filename: Mapping[str, re.Pattern[str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_spec(cls, spec: IgnoreSpec) -> IgnoreMatcher:
+        """Compile the suppression rules for one linter."""
+        if spec.ids == "*":
+            return cls(ignore_all=True)
+        by_filename = {
+            issue_id: re.compile(
+                "|".join(translate(os.path.normcase(glob)) for glob in sorted(globs))
+            )
+            for issue_id, globs in spec.by_filename.items()
+            if globs
+        }
+        ids = frozenset(spec.ids) if isinstance(spec.ids, set) else frozenset()
+        return cls(ids=ids, by_filename=by_filename)
+
+    def matches(self, issue: LinterIssue) -> bool:
+        """Return True when `issue` is covered by these rules.
+
+        This gives the same result as :func:`should_ignore`, with at most one
+        regex match per issue.
+        """
+        if self.ignore_all or issue.id in self.ids:
+            return True
+        pattern = self.by_filename.get(issue.id)
+        return (
+            pattern is not None
+            and pattern.match(os.path.normcase(issue.filename)) is not None
+        )
+
+
+def compile_ignore_config(cfg: IgnoreConfig) -> dict[str, IgnoreMatcher]:
+    """Compile an ignore configuration into a matcher per linter name."""
+    return {name: IgnoreMatcher.from_spec(spec) for name, spec in cfg.items()}
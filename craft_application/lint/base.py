@@ -24,8 +24,10 @@ from typing import TYPE_CHECKING
 from ._types import Stage as _Stage
 
 if TYPE_CHECKING:  # pragma: no cover
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
 
+    from ._files import FileEntry
     from ._types import LintContext, LinterIssue, Stage
 
 
@@ -35,10 +37,20 @@ class AbstractLinter(ABC):
     Linters should set:
       - name: stable identifier (used in ignore config)
       - stage: Stage.PRE or Stage.POST
+
+    Linters may set:
+      - parallel_safe: True if the linter can run at the same time as other
+        parallel-safe linters, in another thread
     """
 
     name: str
     stage: Stage
+    parallel_safe: bool = False
+    """Whether this linter can run concurrently with other parallel-safe linters.
+
+    A parallel-safe linter must only read from the lint context and must not
+    share mutable state with other linters.
+    """
 
     def __init_subclass__(cls) -> None:
         """Validate subclass has required attributes."""
@@ -55,3 +67,53 @@ class AbstractLinter(ABC):
     @abstractmethod
     def run(self, ctx: LintContext) -> Iterable[LinterIssue]:
         """Execute the linter and yield issues."""
+
+
+class AbstractFileLinter(AbstractLinter):
+    """Base class for linters that check each file on its own.
+
+    File linters implement :meth:`lint_file` rather than :meth:`run`. Because each
+    file's issues depend only on that file, the linter service can cache them and
+    replay them for files that haven't changed.
+
+    File linters may set:
+      - version: changed whenever the linter's results may change, to invalidate
+        cached issues
+      - cacheable: False if a file's issues depend on more than its contents,
+        its path and :meth:`cache_key`
+    """
+
+    version: str = "1"
+    cacheable: bool = True
+
+    def roots(self, ctx: LintContext) -> list[Path]:
+        """Get the directories whose files this linter checks.
+
+        Defaults to the artifact directories.
+        """
+        return list(ctx.artifact_dirs)
+
+    def files(self, ctx: LintContext) -> Iterator[FileEntry]:
+        """Get every regular file below the linter's roots."""
+        for root in self.roots(ctx):
+            for entry in ctx.files.entries(root):
+                if entry.is_file:
+                    yield entry
+
+    def cache_key(self, ctx: LintContext) -> str:  # noqa: ARG002 (used by overrides)
+        """Get anything other than the files that the linter's results depend on.
+
+        Cached issues are only replayed while the key stays the same. For example,
+        a linter that checks files against the project's base could return the
+        base.
+        """
+        return ""
+
+    def run(self, ctx: LintContext) -> Iterator[LinterIssue]:
+        """Lint each of the linter's files."""
+        for entry in self.files(ctx):
+            yield from self.lint_file(ctx, entry)
+
+    @abstractmethod
+    def lint_file(self, ctx: LintContext, entry: FileEntry) -> Iterable[LinterIssue]:
+        """Check a single file and yield its issues."""
@@ -15,6 +15,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Models representing manifests for projects and fetch-service assets."""
 
+import dataclasses
 import hashlib
 import pathlib
 from datetime import datetime, timezone
@@ -120,37 +121,90 @@ class SessionArtifactManifest(BaseManifestModel):
     @classmethod
     def from_session_report(cls, report: dict[str, Any]) -> list[Self]:
         """Create session manifests from a fetch-session report."""
-        artifacts: list[Self] = []
-
-        for artifact in report["artifacts"]:
-            # Figure out if the artifact was rejected, and for which reasons
-            rejected = artifact.get("result") == "Rejected"
-            reasons: set[str] = set()
-            if rejected:
-                reasons.update(_get_reasons(artifact.get("request-inspection", {})))
-                reasons.update(_get_reasons(artifact.get("response-inspection", {})))
-
-            metadata = artifact["metadata"]
-            data = {
-                "type": metadata["type"],
-                "component-name": metadata["name"],
-                "component-version": metadata["version"],
-                "component-description": metadata["description"],
-                # "architecture" is only present on the metadata if applicable.
-                "architecture": metadata.get("architecture", ""),
-                "component-id": {
-                    "hashes": {"sha1": metadata["sha1"], "sha256": metadata["sha256"]}
-                },
-                "component-author": metadata["author"],
-                "component-vendor": metadata["vendor"],
-                "size": metadata["size"],
-                "url": [d["url"] for d in artifact["downloads"]],
-                "rejected": rejected,
-                "rejection-reasons": sorted(reasons),
-            }
-            artifacts.append(cls.unmarshal(data))
+        return [
+            cls.unmarshal(artifact.marshal(include_rejection=True))
+            for artifact in SessionArtifact.from_session_report(report)
+        ]
+
 
-        return artifacts
+@dataclasses.dataclass(frozen=True, slots=True)
+class SessionArtifact:
+    """A compact record of an artifact downloaded during a fetch-service session.
+
+    Session reports can list tens of thousands of artifacts, so these records are
+    used in place of :class:`SessionArtifactManifest` models until the manifest is
+    written. :meth:`marshal` gives the same data as the model.
+    """
+
+    component_type: str
+    component_name: str
+    component_version: str
+    component_description: str
+    architecture: str
+    sha1: str
+    sha256: str
+    component_author: str
+    component_vendor: str
+    size: int
+    url: tuple[str, ...]
+    rejected: bool
+    rejection_reasons: tuple[str, ...]
+
+    @classmethod
+    def from_report_artifact(cls, artifact: dict[str, Any]) -> Self:
+        """Create a record from one artifact of a fetch-session report."""
+        # Figure out if the artifact was rejected, and for which reasons
+        rejected = artifact.get("result") == "Rejected"
+        reasons: set[str] = set()
+        if rejected:
+            reasons.update(_get_reasons(artifact.get("request-inspection", {})))
+            reasons.update(_get_reasons(artifact.get("response-inspection", {})))
+
+        metadata = artifact["metadata"]
+        return cls(
+            component_type=_as_str(metadata["type"]),
+            component_name=_as_str(metadata["name"]),
+            component_version=_as_str(metadata["version"]),
+            component_description=_as_str(metadata["description"]),
+            # "architecture" is only present on the metadata if applicable.
+            architecture=_as_str(metadata.get("architecture", "")),
+            sha1=_as_str(metadata["sha1"]),
+            sha256=_as_str(metadata["sha256"]),
+            component_author=_as_str(metadata["author"]),
+            component_vendor=_as_str(metadata["vendor"]),
+            size=int(metadata["size"]),
+            url=tuple(_as_str(d["url"]) for d in artifact["downloads"]),
+            rejected=rejected,
+            rejection_reasons=tuple(sorted(reasons)),
+        )
+
+    @classmethod
+    def from_session_report(cls, report: dict[str, Any]) -> list[Self]:
+        """Create records for all the artifacts in a fetch-session report."""
+        return [cls.from_report_artifact(artifact) for artifact in report["artifacts"]]
+
+    def marshal(self, *, include_rejection: bool = False) -> dict[str, Any]:
+        """Convert to a dictionary, as :class:`SessionArtifactManifest` would.
+
+        :param include_rejection: Whether to include the rejection fields, which
+            are excluded from the manifest.
+        """
+        data: dict[str, Any] = {
+            "component-name": self.component_name,
+            "component-version": self.component_version,
+            "component-description": self.component_description,
+            "component-id": {"hashes": {"sha1": self.sha1, "sha256": self.sha256}},
+            "architecture": self.architecture,
+            "type": self.component_type,
+            "component-author": self.component_author,
+            "component-vendor": self.component_vendor,
+            "size": self.size,
+            "url": list(self.url),
+        }
+        if include_rejection:
+            data["rejected"] = self.rejected
+            data["rejection-reasons"] = list(self.rejection_reasons)
+        return data
 
 
 class CraftManifest(ProjectManifest):
@@ -173,6 +227,32 @@ class CraftManifest(ProjectManifest):
         data = {**project.marshal(), "dependencies": session_deps}
         return cls.model_validate(data)
 
+    @classmethod
+    def marshal_craft_manifest(
+        cls,
+        project_manifest_path: pathlib.Path,
+        session_artifacts: list[SessionArtifact],
+    ) -> dict[str, Any]:
+        """Get the marshalled Craft manifest for a project and its session artifacts.
+
+        This gives the same data as marshalling the model returned by
+        :meth:`create_craft_manifest`, without a model for each dependency.
+        """
+        project = ProjectManifest.from_yaml_file(project_manifest_path)
+        return {
+            **project.marshal(),
+            "dependencies": [artifact.marshal() for artifact in session_artifacts],
+        }
+
+
+def _as_str(value: Any) -> str:  # noqa: ANN401
+    """Get a report value as a string, coercing numbers like the models do."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return str(value)
+    raise TypeError(f"Expected a string in the session report, got {value!r}")
+
 
 def _get_reasons(inspections: dict[str, Any]) -> set[str]:
     reasons: set[str] = set()
@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 from typing import TYPE_CHECKING, Any, Literal, final
 
 import craft_platforms
@@ -27,11 +28,64 @@ from craft_application.errors import EmptyBuildPlanError
 from . import base
 
 if TYPE_CHECKING:
-    from collections.abc import Collection, Iterable, Sequence
+    from collections.abc import Collection, Hashable, Iterable, Mapping, Sequence
+
+
+@dataclasses.dataclass
+class _BuildPlanIndex:
+    """An exhaustive build plan, indexed by each of its filter dimensions.
+
+    Each index maps a value to the positions of the build items that have it, in
+    build plan order.
+    """
+
+    project: dict[str, Any]
+    """The raw project data the build plan was generated from."""
+    plan: list[craft_platforms.BuildInfo]
+    platforms: dict[str, list[int]] = dataclasses.field(default_factory=dict)
+    build_for: dict[str, list[int]] = dataclasses.field(default_factory=dict)
+    build_on: dict[str, list[int]] = dataclasses.field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        for position, item in enumerate(self.plan):
+            self.platforms.setdefault(item.platform, []).append(position)
+            self.build_for.setdefault(item.build_for, []).append(position)
+            self.build_on.setdefault(item.build_on, []).append(position)
+
+    def select(
+        self,
+        *,
+        platforms: Collection[str] | None,
+        build_for: Collection[craft_platforms.DebianArchitecture | Literal["all"]]
+        | None,
+        build_on: Collection[craft_platforms.DebianArchitecture] | None,
+    ) -> list[craft_platforms.BuildInfo]:
+        """Get the build items that match all the given filters, in plan order.
+
+        A filter of ``None`` matches every build item.
+        """
+        selected: set[int] | None = None
+        filters: list[tuple[Collection[Hashable] | None, Mapping[Any, list[int]]]] = [
+            (platforms, self.platforms),
+            (build_for, self.build_for),
+            (build_on, self.build_on),
+        ]
+        for values, index in filters:
+            if values is None:
+                continue
+            positions = {pos for value in values for pos in index.get(value, ())}
+            selected = positions if selected is None else selected & positions
+        if selected is None:
+            return list(self.plan)
+        return [self.plan[position] for position in sorted(selected)]
 
 
 class BuildPlanService(base.AppService):
-    """A service for generating and filtering build plans."""
+    """A service for generating and filtering build plans.
+
+    The exhaustive build plan is generated once for the loaded project and
+    indexed by platform, build-for and build-on, so filtering it is a lookup.
+    """
 
     def setup(self) -> None:
         """Set up the build plan service."""
@@ -39,6 +93,7 @@ class BuildPlanService(base.AppService):
         self.__platforms: list[str] = []
         self.__build_for: list[craft_platforms.DebianArchitecture | Literal["all"]] = []
         self.__plan: Sequence[craft_platforms.BuildInfo] | None = None
+        self.__index: _BuildPlanIndex | None = None
 
     def set_platforms(self, *platform: str) -> None:
         """Set the platforms for the build plan."""
@@ -60,7 +115,7 @@ class BuildPlanService(base.AppService):
     @final
     def plan(self) -> Sequence[craft_platforms.BuildInfo]:
         """Plan the current build."""
-        if not self.__plan:
+        if self.__plan is None:
             self.__plan = self.create_build_plan(
                 platforms=self.__platforms or None,
                 build_for=self.__build_for or None,
@@ -139,10 +194,6 @@ class BuildPlanService(base.AppService):
             Defaults to the current architecture.
         :returns: A build plan for the given
         """
-        project_service = self._services.get("project")
-        raw_project = project_service.get_raw()
-        raw_project["platforms"] = project_service.get_platforms()
-
         if build_on:
             build_on_archs = [craft_platforms.DebianArchitecture(on) for on in build_on]
         else:
@@ -158,9 +209,21 @@ class BuildPlanService(base.AppService):
         else:
             build_for_archs = None
 
+        index = self._get_build_plan_index()
+        # The index can only narrow down the input of the default filter, which
+        # also treats a single platform string as a collection of substrings.
+        if (
+            type(self)._filter_plan is BuildPlanService._filter_plan  # noqa: SLF001
+            and not isinstance(platforms, str)
+        ):
+            candidates = index.select(
+                platforms=platforms, build_for=build_for_archs, build_on=build_on_archs
+            )
+        else:
+            candidates = index.plan
         plan = list(
             self._filter_plan(
-                self._gen_exhaustive_build_plan(project_data=raw_project),
+                candidates,
                 platforms=platforms,
                 build_for=build_for_archs,
                 build_on=build_on_archs,
@@ -171,3 +234,21 @@ class BuildPlanService(base.AppService):
         emit.trace(f"Build plan: {str(plan)}")
 
         return plan
+
+    def _get_build_plan_index(self) -> _BuildPlanIndex:
+        """Get the indexed exhaustive build plan for the loaded project.
+
+        The build plan is only generated again if the project service has loaded
+        a different project since it was last generated.
+        """
+        project_service = self._services.get("project")
+        project = project_service._load_raw_project()  # noqa: SLF001
+        if self.__index is None or self.__index.project is not project:
+            raw_project = project_service.get_raw()
+            raw_project["platforms"] = project_service.get_platforms()
+            exhaustive_plan = self._gen_exhaustive_build_plan(project_data=raw_project)
+            self.__index = _BuildPlanIndex(project=project, plan=list(exhaustive_plan))
+            emit.debug(
+                f"Exhaustive build plan contains {len(self.__index.plan)} build(s)."
+            )
+        return self.__index
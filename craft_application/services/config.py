@@ -57,6 +57,17 @@ class ConfigHandler(abc.ABC):
         :raises: KeyError if the item cannot be found.
         """
 
+    def invalidate(self) -> None:  # noqa: B027 (intentionally empty)
+        """Forget any values this handler has cached from its source."""
+
+    def get_environment_variable(self, item: str) -> str | None:  # noqa: ARG002
+        """Get the name of the environment variable an item is read from, if any.
+
+        The :class:`ConfigService` resolves an item again whenever one of its
+        environment variables changes.
+        """
+        return None
+
 
 @final
 class AppEnvironmentHandler(ConfigHandler):
@@ -74,6 +85,10 @@ class AppEnvironmentHandler(ConfigHandler):
     def get_raw(self, item: str) -> str:
         return os.environ[f"{self._environ_prefix}_{item.upper()}"]
 
+    @override
+    def get_environment_variable(self, item: str) -> str:
+        return f"{self._environ_prefix}_{item.upper()}"
+
 
 @final
 class CraftEnvironmentHandler(ConfigHandler):
@@ -92,6 +107,12 @@ class CraftEnvironmentHandler(ConfigHandler):
 
         return os.environ[f"CRAFT_{item.upper()}"]
 
+    @override
+    def get_environment_variable(self, item: str) -> str | None:
+        if item not in self._fields:
+            return None
+        return f"CRAFT_{item.upper()}"
+
 
 class SnapConfigHandler(ConfigHandler):
     """Configuration handler that gets values from snapd.
@@ -99,6 +120,9 @@ class SnapConfigHandler(ConfigHandler):
     Snap configuration values are set with kebab case, so the ``verbosity_level``
     configuration value can be set to ``verbose`` using the command
     ``snap set <snap-name> verbosity-level=verbose``
+
+    The whole snap configuration is read with a single ``snapctl get`` call the
+    first time an item is requested and kept until :meth:`invalidate` is called.
     """
 
     def __init__(self, app: application.AppMetadata) -> None:
@@ -118,15 +142,22 @@ class SnapConfigHandler(ConfigHandler):
                 permanent=True,
             )
             raise OSError("Not running as a snap or with snapd disabled.")
+        self._options: snaphelpers.SnapConfigOptions | None = None
 
     @override
     def get_raw(self, item: str) -> Any:
+        if self._options is None:
+            self._options = self._snap.get_options()
         snap_item = item.replace("_", "-")
         try:
-            return self._snap.get(snap_item)
+            return self._options[snap_item]
         except snaphelpers.UnknownConfigKey as exc:
             raise KeyError(f"unknown snap config item: {item!r}") from exc
 
+    @override
+    def invalidate(self) -> None:
+        self._options = None
+
 
 @final
 class DefaultConfigHandler(ConfigHandler):
@@ -155,7 +186,13 @@ class DefaultConfigHandler(ConfigHandler):
 
 
 class ConfigService(base.AppService):
-    """Application-wide configuration access."""
+    """Application-wide configuration access.
+
+    Resolved values are memoized, so each item is looked up and converted only
+    once. An item is resolved again when an environment variable it can be set
+    with changes. If another configuration source changes while the application
+    is running, call :meth:`invalidate` to resolve items again.
+    """
 
     _handlers: list[ConfigHandler]
 
@@ -169,6 +206,10 @@ class ConfigService(base.AppService):
         super().__init__(app, services)
         self._extra_handlers = extra_handlers
         self._default_handler = DefaultConfigHandler(self._app)
+        self._handlers = []
+        # Each value is stored with the environment variables it was resolved with.
+        self._values: dict[str, tuple[tuple[str | None, ...], Any]] = {}
+        self._type_adapters: dict[Any, pydantic.TypeAdapter[Any]] = {}
 
     @override
     def setup(self) -> None:
@@ -186,11 +227,40 @@ class ConfigService(base.AppService):
             )
         else:
             self._handlers.append(snap_handler)
+        self._values.clear()
+
+    def invalidate(self) -> None:
+        """Forget all resolved configuration values.
+
+        The next call to :meth:`get` or :meth:`get_all` reads each item from the
+        configuration handlers again.
+        """
+        self._values.clear()
+        for handler in self._handlers:
+            handler.invalidate()
 
     def get(self, item: str) -> Any:  # noqa: ANN401
         """Get the given configuration item."""
+        environment = self._get_environment(item)
+        memoized = self._values.get(item)
+        if memoized is not None and memoized[0] == environment:
+            return memoized[1]
         if item not in self._app.ConfigModel.model_fields:
             raise KeyError(f"unknown config item: {item!r}")
+        value = self._resolve(item)
+        self._values[item] = (environment, value)
+        return value
+
+    def _get_environment(self, item: str) -> tuple[str | None, ...]:
+        """Get the values of the environment variables an item can be set with."""
+        return tuple(
+            os.environ.get(name)
+            for handler in self._handlers
+            if (name := handler.get_environment_variable(item)) is not None
+        )
+
+    def _resolve(self, item: str) -> Any:  # noqa: ANN401
+        """Look up a configuration item in the handlers and convert its value."""
         field_info = self._app.ConfigModel.model_fields[item]
 
         for handler in self._handlers:
@@ -217,8 +287,17 @@ class ConfigService(base.AppService):
                     return cast(T, field_type[value])
                 with contextlib.suppress(KeyError):
                     return cast(T, field_type[value.upper()])
-        field_adapter = pydantic.TypeAdapter(field_type)
-        return field_adapter.validate_strings(value)
+        return self._get_type_adapter(field_type).validate_strings(value)
+
+    def _get_type_adapter(self, field_type: type[T]) -> pydantic.TypeAdapter[T]:
+        """Get a (cached) type adapter for a field type."""
+        try:
+            return self._type_adapters[field_type]
+        except KeyError:
+            adapter = self._type_adapters[field_type] = pydantic.TypeAdapter(field_type)
+            return adapter
+        except TypeError:  # Unhashable annotations can't be cached.
+            return pydantic.TypeAdapter(field_type)
 
     def get_all(self) -> dict[str, Any]:
         """Get a dictionary of the complete configuration per the ConfigModel.
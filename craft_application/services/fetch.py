@@ -28,7 +28,11 @@ from craft_cli import emit
 from typing_extensions import override
 
 from craft_application import errors, fetch, util
-from craft_application.models.manifest import CraftManifest, ProjectManifest
+from craft_application.models.manifest import (
+    CraftManifest,
+    ProjectManifest,
+    SessionArtifact,
+)
 from craft_application.services import base
 
 if typing.TYPE_CHECKING:
@@ -316,23 +320,22 @@ class FetchService(base.AppService):
         manifest_path = pathlib.Path(f"{name}_{version}_{platform}.json")
         emit.debug(f"Generating craft manifest at {manifest_path}")
 
-        craft_manifest = CraftManifest.create_craft_manifest(
-            project_manifest, session_report
-        )
-        data = craft_manifest.marshal()
+        deps = SessionArtifact.from_session_report(session_report)
+        data = CraftManifest.marshal_craft_manifest(project_manifest, deps)
 
         with manifest_path.open("w") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
 
-        deps = craft_manifest.dependencies
         rejections = [dep for dep in deps if dep.rejected]
 
         if rejections:
             display = partial(emit.progress, permanent=True)
             items: list[dict[str, typing.Any]] = []
             for rejection in rejections:
-                url = rejection.url[0] if len(rejection.url) == 1 else rejection.url
-                items.append({"url": url, "reasons": rejection.rejection_reasons})
+                url = (
+                    rejection.url[0] if len(rejection.url) == 1 else list(rejection.url)
+                )
+                items.append({"url": url, "reasons": list(rejection.rejection_reasons)})
             text = util.dump_yaml(items)
 
             display(
@@ -18,13 +18,22 @@
 from __future__ import annotations
 
 import contextlib
+import fnmatch
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
 import types
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import IO, TYPE_CHECKING, Any
 
+import craft_parts
 import craft_platforms
 import distro
-from craft_cli import CraftError, emit
+from craft_cli import CraftError, EmitterMode, emit
 from craft_parts import (
     Action,
     ActionType,
@@ -32,6 +41,7 @@ from craft_parts import (
     LifecycleManager,
     PartsError,
     ProjectInfo,
+    ProjectVarInfo,
     Step,
     StepInfo,
     callbacks,
@@ -46,6 +56,9 @@ from craft_application.services import base
 from craft_application.util import repositories
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Mapping, Sequence
+
+    from craft_parts.executor import ExecutionContext
     from craft_parts.plugins import Plugin
 
     from craft_application.application import AppMetadata
@@ -96,6 +109,10 @@ ACTION_MESSAGES = types.MappingProxyType(
     }
 )
 
+_PLAN_CACHE_FILE = ".plan-cache.json"
+_PLAN_CACHE_VERSION = 1
+_STEP_CATEGORIES = ("pull", "overlay", "build", "stage", "prime")
+
 
 def _get_parts_action_message(action: Action) -> str:
     """Get a user-readable message for a particular craft-parts action."""
@@ -105,6 +122,163 @@ def _get_parts_action_message(action: Action) -> str:
     return message
 
 
+def _get_action_dependencies(
+    actions: Sequence[Action],
+    parts: Mapping[str, Mapping[str, Any]],
+    exclusive: Sequence[bool],
+) -> list[set[int]]:
+    """Get the indices of the earlier actions that each action must wait for.
+
+    A part's actions run in their planned order, and every step after pull also
+    waits for the parts listed in the part's ``after`` key. An exclusive action
+    waits for every earlier action and every later action waits for it.
+    """
+    dependencies: list[set[int]] = []
+    last_action: dict[str, int] = {}
+    last_exclusive: int | None = None
+    for index, action in enumerate(actions):
+        if exclusive[index]:
+            start = 0 if last_exclusive is None else last_exclusive
+            action_dependencies = set(range(start, index))
+            last_exclusive = index
+        else:
+            related = [action.part_name]
+            if action.step != Step.PULL:
+                related.extend(parts.get(action.part_name, {}).get("after", []))
+            action_dependencies = {
+                last_action[name] for name in related if name in last_action
+            }
+            if last_exclusive is not None:
+                action_dependencies.add(last_exclusive)
+        last_action[action.part_name] = index
+        dependencies.append(action_dependencies)
+    return dependencies
+
+
+def _show_action_output(action: Action, output: IO[bytes]) -> None:
+    """Show the output an action wrote to a file."""
+    output.seek(0)
+    with emit.open_stream(_get_parts_action_message(action)) as stream:
+        with open(stream, "wb", closefd=False) as pipe:
+            shutil.copyfileobj(output, pipe)
+
+
+def _update_tree_digest(
+    digest: hashlib._Hash,
+    root: Path,
+    *,
+    ignore: Sequence[str],
+    exclude: set[tuple[int, int]],
+) -> None:
+    """Add the name, size and modification time of each file in a tree to a digest.
+
+    :param digest: The digest to update.
+    :param root: The directory to walk.
+    :param ignore: Glob patterns of file and directory names to leave out.
+    :param exclude: The device and inode numbers of directories to leave out.
+    """
+    directories = [str(root)]
+    while directories:
+        directory = directories.pop()
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except OSError:
+            digest.update(f"{directory}\0unreadable\n".encode())
+            continue
+        for entry in entries:
+            if any(fnmatch.fnmatch(entry.name, pattern) for pattern in ignore):
+                continue
+            stat = entry.stat(follow_symlinks=False)
+            if entry.is_dir(follow_symlinks=False):
+                if (stat.st_dev, stat.st_ino) not in exclude:
+                    directories.append(entry.path)
+                digest.update(f"{entry.path}\0dir\n".encode())
+            else:
+                digest.update(
+                    f"{entry.path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode()
+                )
+
+
+def _load_plan(path: Path, fingerprint: str) -> list[Action] | None:
+    """Load a saved plan if it was saved with the given fingerprint."""
+    try:
+        data = json.loads(path.read_text())
+        if data["fingerprint"] != fingerprint:
+            return None
+        return [
+            Action(
+                action["part"],
+                Step[action["step"]],
+                action_type=ActionType.SKIP,
+                reason=action["reason"],
+                project_vars=ProjectVarInfo.unmarshal(action["project-vars"]),
+            )
+            for action in data["actions"]
+        ]
+    except (OSError, ValueError, LookupError, TypeError):
+        return None
+
+
+def _save_plan(path: Path, fingerprint: str, actions: list[Action]) -> None:
+    """Save a plan that skips every action, or forget the saved plan."""
+    try:
+        if not actions or any(a.action_type != ActionType.SKIP for a in actions):
+            path.unlink(missing_ok=True)
+            return
+        data = {
+            "fingerprint": fingerprint,
+            "actions": [
+                {
+                    "part": action.part_name,
+                    "step": action.step.name,
+                    "reason": action.reason,
+                    "project-vars": action.project_vars.marshal(),
+                }
+                for action in actions
+            ],
+        }
+        path.write_text(json.dumps(data))
+    except OSError as exc:
+        emit.debug(f"Could not save the lifecycle plan: {exc}")
+
+
+def _get_timing_summary(spans: Sequence[util.TimingSpan]) -> str:
+    """Get a table of the time spent on each step of each part."""
+    parts: dict[str, dict[str, float]] = {}
+    phases: dict[str, float] = {}
+    for span in spans:
+        if span.category in _STEP_CATEGORIES or span.category == "post-prime":
+            part = parts.setdefault(span.args["part"], {})
+            part[span.category] = part.get(span.category, 0.0) + span.duration
+        elif span.category == "lifecycle":
+            phases[span.name] = phases.get(span.name, 0.0) + span.duration
+
+    columns = [
+        category
+        for category in (*_STEP_CATEGORIES, "post-prime")
+        if any(category in times for times in parts.values())
+    ]
+    name_width = max(len("Part"), *(len(name) for name in parts))
+    rows = [["Part".ljust(name_width), *columns, "total"]]
+    for name, times in sorted(parts.items(), key=lambda item: -sum(item[1].values())):
+        rows.append(
+            [
+                name.ljust(name_width),
+                *(f"{times[c]:.3f}s" if c in times else "-" for c in columns),
+                # Post-prime runs within the prime step, so it's already counted.
+                f"{sum(t for c, t in times.items() if c != 'post-prime'):.3f}s",
+            ]
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = ["Lifecycle timings:"]
+    lines.extend(
+        "  " + "  ".join(cell.rjust(width) for cell, width in zip(row, widths))
+        for row in rows
+    )
+    lines.extend(f"  {name}: {duration:.3f}s" for name, duration in phases.items())
+    return "\n".join(lines)
+
+
 def _get_step(step_name: str) -> Step:
     """Get a lifecycle step by name."""
     if step_name.lower() == "overlay" and not Features().enable_overlay:
@@ -144,6 +318,8 @@ class LifecycleService(base.AppService):
         self._manager_kwargs = lifecycle_kwargs
         self._lcm: LifecycleManager = None  # ty: ignore[invalid-assignment]
         self._requires_repack = False
+        self.timings = util.Timings()
+        """Timings of the last lifecycle run."""
 
     @override
     def setup(self) -> None:
@@ -173,7 +349,7 @@ class LifecycleService(base.AppService):
             )
             set_plugin_group(plugin_group)
         self._lcm = self._init_lifecycle_manager()
-        callbacks.register_post_step(self.post_prime, step_list=[Step.PRIME])
+        callbacks.register_post_step(self._timed_post_prime, step_list=[Step.PRIME])
         callbacks.register_configure_overlay(repositories.enable_overlay_eol)
 
     @staticmethod
@@ -259,19 +435,6 @@ class LifecycleService(base.AppService):
                 self._project.package_repositories
             )
 
-        source_ignore_patterns = [
-            ".craft",  # in case of unmanaged lifecycle run
-            *self._app.source_ignore_patterns,
-        ]
-
-        # Ignore spread.yaml, .spread-reuse.* and spread to prevent repulling sources
-        # when test files are changed.
-        ignore_outdated = (
-            source_ignore_patterns
-            + [".spread-reuse.*"]
-            + (["spread.yaml", "spread"] if Path("spread/.extension").exists() else [])
-        )
-
         try:
             return LifecycleManager(
                 {"parts": self._project.parts},
@@ -279,8 +442,8 @@ class LifecycleService(base.AppService):
                 arch=build_for,
                 cache_dir=self._cache_dir,
                 work_dir=self._work_dir,
-                ignore_local_sources=source_ignore_patterns,
-                ignore_outdated=ignore_outdated,
+                ignore_local_sources=self._get_source_ignore_patterns(),
+                ignore_outdated=self._get_ignore_outdated_patterns(),
                 parallel_build_count=util.get_parallel_build_count(self._app.name),
                 project_vars=project_service.project_vars,
                 track_stage_packages=True,
@@ -290,6 +453,23 @@ class LifecycleService(base.AppService):
         except PartsError as err:
             raise errors.PartsLifecycleError.from_parts_error(err) from err
 
+    def _get_source_ignore_patterns(self) -> list[str]:
+        """Get the patterns of local source files to ignore."""
+        return [
+            ".craft",  # in case of unmanaged lifecycle run
+            *self._app.source_ignore_patterns,
+        ]
+
+    def _get_ignore_outdated_patterns(self) -> list[str]:
+        """Get the patterns of local source files that don't outdate a pull."""
+        # Ignore spread.yaml, .spread-reuse.* and spread to prevent repulling sources
+        # when test files are changed.
+        return (
+            self._get_source_ignore_patterns()
+            + [".spread-reuse.*"]
+            + (["spread.yaml", "spread"] if Path("spread/.extension").exists() else [])
+        )
+
     @property
     def prime_state_timestamp(self) -> float | None:
         """The timestamp of the most recently primed part's prime state file."""
@@ -339,24 +519,37 @@ class LifecycleService(base.AppService):
         """
         target_step = _get_step(step_name) if step_name else None
         self._requires_repack = False
+        self.timings.clear()
+        try:
+            self._run(target_step, part_names)
+        finally:
+            self._report_timings()
 
-        self._validate_build_plan()
+    def _run(self, target_step: Step | None, part_names: list[str] | None) -> None:
+        """Run the lifecycle, translating errors from craft-parts."""
+        with self.timings.span("Validate build plan", category="lifecycle"):
+            self._validate_build_plan()
 
         try:
             if self._project.package_repositories:
                 emit.trace("Installing package repositories")
-                repositories.install_package_repositories(
-                    self._project.package_repositories,
-                    self._lcm,
-                    local_keys_path=self._get_local_keys_path(),
-                )
+                with self.timings.span(
+                    "Install package repositories", category="lifecycle"
+                ):
+                    repositories.install_package_repositories(
+                        self._project.package_repositories,
+                        self._lcm,
+                        local_keys_path=self._get_local_keys_path(),
+                    )
                 with contextlib.suppress(CallbackRegistrationError):
                     callbacks.register_configure_overlay(
                         repositories.install_overlay_repositories
                     )
             if target_step:
+                step_name = target_step.name.lower()
                 emit.trace(f"Planning {step_name} for {part_names or 'all parts'}")
-                actions = self._lcm.plan(target_step, part_names=part_names)
+                with self.timings.span(f"Plan {step_name}", category="lifecycle"):
+                    actions = self._plan(target_step, part_names)
             else:
                 actions = []
 
@@ -365,7 +558,8 @@ class LifecycleService(base.AppService):
             )
 
             emit.progress("Initializing lifecycle")
-            self._exec(actions)
+            with self.timings.span("Execute actions", category="lifecycle"):
+                self._exec(actions)
 
         except PartsError as err:
             raise errors.PartsLifecycleError.from_parts_error(err) from err
@@ -379,17 +573,215 @@ class LifecycleService(base.AppService):
         except Exception as err:
             raise errors.PartsLifecycleError(f"Unknown error: {str(err)}") from err
 
+    def _report_timings(self) -> None:
+        """Show a summary of the last run's timings and save them as a trace.
+
+        The summary is shown in verbose mode and is always in the log. In debug
+        and trace modes, the trace is also written next to the log in the Chrome
+        trace event format.
+        """
+        spans = self.timings.spans
+        if not any(span.category in _STEP_CATEGORIES for span in spans):
+            return
+        emit.verbose(_get_timing_summary(spans))
+        if emit.get_mode() not in (EmitterMode.DEBUG, EmitterMode.TRACE):
+            return
+        trace_path = self._get_trace_path()
+        try:
+            self.timings.write_chrome_trace(trace_path)
+        except OSError as exc:
+            emit.debug(f"Could not write the lifecycle trace: {exc}")
+        else:
+            emit.debug(f"Wrote the lifecycle trace to {str(trace_path)!r}")
+
+    def _get_trace_path(self) -> Path:
+        """Get the path to write the lifecycle trace to."""
+        return emit.log_filepath.with_suffix(".trace.json")
+
+    def _plan(self, target_step: Step, part_names: list[str] | None) -> list[Action]:
+        """Plan the actions to reach a step, reusing the last plan if possible.
+
+        A plan that skips every action is saved with a fingerprint of the project's
+        parts, its local sources and the parts' state. While the fingerprint stays
+        the same, planning again would skip the same actions, so the saved plan is
+        used instead.
+        """
+        start = time.perf_counter()
+        fingerprint = self._get_plan_fingerprint(target_step, part_names)
+        emit.debug(f"Fingerprinted the lifecycle in {time.perf_counter() - start:.3f}s")
+        plan_cache = Path(self._work_dir, "parts", _PLAN_CACHE_FILE)
+        if (actions := _load_plan(plan_cache, fingerprint)) is not None:
+            emit.debug("Nothing changed since the last run, reusing its plan")
+            return actions
+
+        start = time.perf_counter()
+        actions = self._lcm.plan(target_step, part_names=part_names)
+        emit.debug(
+            f"Planned {len(actions)} lifecycle actions "
+            f"in {time.perf_counter() - start:.3f}s"
+        )
+        _save_plan(plan_cache, fingerprint, actions)
+        return actions
+
+    def _get_plan_fingerprint(
+        self, target_step: Step, part_names: list[str] | None
+    ) -> str:
+        """Get a digest of everything that decides the lifecycle plan."""
+        project_service = self._services.get("project")
+        project_vars = project_service.project_vars
+        inputs = {
+            "cache-version": _PLAN_CACHE_VERSION,
+            "craft-parts": craft_parts.__version__,
+            "app": [self._app.name, self._app.version],
+            "step": target_step.name,
+            "part-names": part_names,
+            "build-for": self._get_build_for(),
+            "parts": self._project.parts,
+            "package-repositories": self._project.package_repositories,
+            "partitions": project_service.partitions,
+            "project-vars": project_vars.marshal() if project_vars else None,
+            "manager": self._manager_kwargs,
+        }
+        digest = hashlib.sha256(
+            json.dumps(inputs, sort_keys=True, default=str).encode()
+        )
+
+        work_dir = Path(self._work_dir)
+        for state_file in sorted(work_dir.glob("parts/*/state/*")):
+            stat = state_file.stat()
+            digest.update(
+                f"{state_file}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode()
+            )
+
+        # Only local sources are checked for changes when planning.
+        work_dirs = set()
+        for name in ("parts", "stage", "prime", "overlay", "partitions"):
+            with contextlib.suppress(OSError):
+                stat = (work_dir / name).stat()
+                work_dirs.add((stat.st_dev, stat.st_ino))
+        ignore = self._get_ignore_outdated_patterns()
+        for part in self._project.parts.values():
+            source = part.get("source")
+            source_type = part.get("source-type")
+            if not source or source_type not in (None, "local"):
+                continue
+            if source_type is None and not Path(source).is_dir():
+                continue
+            _update_tree_digest(digest, Path(source), ignore=ignore, exclude=work_dirs)
+
+        return digest.hexdigest()
+
     def _exec(self, actions: list[Action]) -> None:
         """Execute actions of the lifecycle.
 
         Applications must override this method to handle errors before craft-application.
         """
+        max_workers = min(self._get_parallel_action_count(), len(actions))
         with self._lcm.action_executor() as aex:
+            if max_workers > 1:
+                self._exec_parallel(aex, actions, max_workers=max_workers)
+                return
             for action in actions:
                 message = _get_parts_action_message(action)
                 emit.progress(message)
                 with emit.open_stream() as stream:
-                    aex.execute(action, stdout=stream, stderr=stream)
+                    self._execute_action(aex, action, stdout=stream, stderr=stream)
+
+    def _execute_action(
+        self, aex: ExecutionContext, action: Action, *, stdout: int, stderr: int
+    ) -> None:
+        """Execute a single action, timing it."""
+        with self.timings.span(
+            _get_parts_action_message(action),
+            category=action.step.name.lower(),
+            part=action.part_name,
+            action=action.action_type.name.lower(),
+        ):
+            aex.execute(action, stdout=stdout, stderr=stderr)
+
+    def _get_parallel_action_count(self) -> int:
+        """Get the maximum number of lifecycle actions to run at once."""
+        if not self._services.get("config").get("parallel_lifecycle"):
+            return 1
+        return util.get_parallel_build_count(self._app.name)
+
+    def is_parallel_action(self, action: Action) -> bool:
+        """Determine whether an action may run alongside other parts' actions.
+
+        Only pull and build steps can overlap, as the other steps write to
+        directories shared between parts. Pulling stage packages or snaps and
+        building with an application build environment also run on their own.
+        Applications may override this to run more of their actions serially.
+
+        :param action: The planned lifecycle action.
+        :returns: Whether the action may run in parallel.
+        """
+        part = self._project.parts.get(action.part_name, {})
+        if action.step == Step.PULL:
+            return not (part.get("stage-packages") or part.get("stage-snaps"))
+        if action.step == Step.BUILD:
+            return not self._manager_kwargs.get("build_environment")
+        return False
+
+    def _exec_parallel(
+        self, aex: ExecutionContext, actions: list[Action], *, max_workers: int
+    ) -> None:
+        """Execute independent actions concurrently.
+
+        Each action writes its output to its own file, which is shown once the
+        action finishes. After a failure, no new actions start and the first
+        error is raised once the running actions finish.
+        """
+        exclusive = [not self.is_parallel_action(action) for action in actions]
+        waiting = dict(
+            enumerate(_get_action_dependencies(actions, self._project.parts, exclusive))
+        )
+        running: dict[Future[None], tuple[int, IO[bytes]]] = {}
+        finished: set[int] = set()
+        error: BaseException | None = None
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{self._app.name}-lifecycle"
+        ) as pool:
+            while waiting or running:
+                ready = (
+                    [] if error else [i for i, d in waiting.items() if d <= finished]
+                )
+                for index in ready:
+                    del waiting[index]
+                    emit.progress(_get_parts_action_message(actions[index]))
+                    output: IO[bytes] = tempfile.TemporaryFile()  # noqa: SIM115
+                    future = pool.submit(
+                        self._execute_action,
+                        aex,
+                        actions[index],
+                        stdout=output.fileno(),
+                        stderr=output.fileno(),
+                    )
+                    running[future] = (index, output)
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: running[f][0]):
+                    index, output = running.pop(future)
+                    with output:
+                        _show_action_output(actions[index], output)
+                    if (exc := future.exception()) is not None:
+                        error = error or exc
+                    else:
+                        finished.add(index)
+
+        if error:
+            raise error
+
+    def _timed_post_prime(self, step_info: StepInfo) -> bool:
+        """Run the post-prime callback, timing it."""
+        with self.timings.span(
+            f"Post-prime {step_info.part_name}",
+            category="post-prime",
+            part=step_info.part_name,
+        ):
+            return self.post_prime(step_info)
 
     def post_prime(self, step_info: StepInfo) -> bool:
         """Perform any necessary post-lifecycle modifications to the prime directory.
@@ -17,27 +17,35 @@
 
 from __future__ import annotations
 
+import copy
 import inspect
+import itertools
 from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 from craft_cli import emit
 
-from craft_application import errors
+from craft_application import errors, util
 from craft_application.lint import (
+    AbstractFileLinter,
+    CacheStats,
     ExitCode,
     IgnoreConfig,
+    IgnoreMatcher,
     IgnoreSpec,
+    LintCache,
     LintContext,
     LinterIssue,
     Severity,
     Stage,
-    should_ignore,
+    compile_ignore_config,
 )
 from craft_application.services import base
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from concurrent.futures import Future
     from typing import Any
 
     from craft_application.application import AppMetadata
@@ -47,6 +55,9 @@ if TYPE_CHECKING:
     from craft_application.services.service_factory import ServiceFactory
 
 
+DEFAULT_MAX_LINTERS = 4
+
+
 class LinterService(base.AppService):
     """Orchestrates linter registration, ignore config and execution."""
 
@@ -55,11 +66,23 @@ class LinterService(base.AppService):
         Stage.POST: [],
     }
 
+    max_linters: int = DEFAULT_MAX_LINTERS
+    """The maximum number of parallel-safe linters to run at the same time."""
+
+    cache_issues: bool = False
+    """Whether to cache the issues of file linters between runs.
+
+    Cached issues are replayed for files whose contents haven't changed. The cache
+    is stored at :meth:`get_cache_path`.
+    """
+
     def __init__(self, app: AppMetadata, services: ServiceFactory) -> None:
         super().__init__(app, services)
         self._ignore_cfg: IgnoreConfig = {}
+        self._ignore_matchers: dict[str, IgnoreMatcher] = {}
         self._issues: list[LinterIssue] = []
         self._issues_by_linter: dict[str, list[LinterIssue]] = {}
+        self._cache_stats: dict[str, CacheStats] = {}
 
     @classmethod
     def register(cls, linter_cls: type[AbstractLinter]) -> None:
@@ -89,9 +112,14 @@ class LinterService(base.AppService):
         project_dir: Path,
         cli_ignores: IgnoreConfig | None = None,
     ) -> IgnoreConfig:
-        """Load ignore configuration using the class-level builder."""
+        """Load ignore configuration using the class-level builder.
+
+        The configuration is compiled once here. The returned configuration is a
+        copy, so changing it doesn't change the rules the service applies.
+        """
         self._ignore_cfg = self.__class__.build_ignore_config(project_dir, cli_ignores)
-        return self._ignore_cfg
+        self._ignore_matchers = compile_ignore_config(self._ignore_cfg)
+        return copy.deepcopy(self._ignore_cfg)
 
     @staticmethod
     def _normalize_ignore_config(raw: dict[str, Any]) -> IgnoreConfig:
@@ -189,25 +217,82 @@ class LinterService(base.AppService):
                 project_dir=ctx.project_dir,
                 project=project,
                 artifact_dirs=ctx.artifact_dirs,
+                files=ctx.files,
             )
         self._issues.clear()
         self._issues_by_linter.clear()
+        self._cache_stats.clear()
         registry = type(self)._class_registry  # noqa: SLF001
         selected = self.pre_filter_linters(stage, ctx, registry.get(stage, []))
-        for cls in selected:
-            linter = cls()
-            raw_issues = linter.run(ctx)
-
-            user_filtered = (
-                issue
-                for issue in raw_issues
-                if not should_ignore(linter.name, issue, self._ignore_cfg)
-            )
-            filtered = self.post_filter_issues(linter, user_filtered, ctx)
-            for issue in filtered:
-                self._issues.append(issue)
-                self._issues_by_linter.setdefault(linter.name, []).append(issue)
-                yield issue
+        cache = LintCache.load(self.get_cache_path(ctx)) if self.cache_issues else None
+        try:
+            for linter, raw_issues in self._run_linters(selected, ctx, cache):
+                matcher = self._ignore_matchers.get(linter.name)
+                user_filtered = (
+                    raw_issues
+                    if matcher is None
+                    else itertools.filterfalse(matcher.matches, raw_issues)
+                )
+                filtered = self.post_filter_issues(linter, user_filtered, ctx)
+                for issue in filtered:
+                    self._issues.append(issue)
+                    self._issues_by_linter.setdefault(linter.name, []).append(issue)
+                    yield issue
+            if cache is not None:
+                cache.save()
+                self._cache_stats = cache.stats
+        finally:
+            ctx.files.close()
+
+    def get_cache_path(self, ctx: LintContext) -> Path:
+        """Get the path of the file to cache linter issues in.
+
+        Defaults to a file in the parts directory of the project's work directory,
+        so cleaning the project also clears the cache.
+        """
+        return Path(util.get_work_dir(ctx.project_dir), "parts", ".lint-cache.json")
+
+    def _run_linters(
+        self,
+        selected: list[type[AbstractLinter]],
+        ctx: LintContext,
+        cache: LintCache | None = None,
+    ) -> Iterator[tuple[AbstractLinter, Iterable[LinterIssue]]]:
+        """Run the selected linters, yielding each one with its raw issues in order.
+
+        Consecutive parallel-safe linters run together, up to :attr:`max_linters`
+        at a time, and their issues are yielded once each has finished. Other
+        linters run on their own and their issues stream as they are found.
+        """
+        max_workers = min(
+            self.max_linters, sum(1 for cls in selected if cls.parallel_safe)
+        )
+        if max_workers < 2:  # noqa: PLR2004 (one linter can't run in parallel)
+            for cls in selected:
+                linter = cls()
+                yield linter, _lint(linter, ctx, cache)
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{self._app.name}-lint"
+        )
+        try:
+            for parallel_safe, group in itertools.groupby(
+                selected, key=lambda cls: cls.parallel_safe
+            ):
+                if not parallel_safe:
+                    for cls in group:
+                        linter = cls()
+                        yield linter, _lint(linter, ctx, cache)
+                    continue
+                runs: list[tuple[AbstractLinter, Future[list[LinterIssue]]]] = []
+                for cls in group:
+                    linter = cls()
+                    runs.append((linter, executor.submit(_collect, linter, ctx, cache)))
+                for linter, future in runs:
+                    yield linter, future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
     def get_highest_severity(self) -> Severity | None:
         """Return the highest severity present among collected issues."""
@@ -232,6 +317,14 @@ class LinterService(base.AppService):
         """Return collected issues grouped by linter name."""
         return {name: list(issues) for name, issues in self._issues_by_linter.items()}
 
+    @property
+    def cache_stats(self) -> dict[str, CacheStats]:
+        """Return the cache hits and misses of each cached linter in the last run.
+
+        Empty unless :attr:`cache_issues` is set.
+        """
+        return dict(self._cache_stats)
+
     @staticmethod
     def _is_adoptable_missing_error(error: errors.CraftValidationError) -> bool:
         """Return True for adopt-info missing-field validation errors."""
@@ -248,3 +341,23 @@ class LinterService(base.AppService):
         raw_project = project_service.get_raw()
         project_path = project_service.resolve_project_file_path()
         return self._app.ProjectClass.from_yaml_data(raw_project, project_path)
+
+
+def _lint(
+    linter: AbstractLinter, ctx: LintContext, cache: LintCache | None
+) -> Iterable[LinterIssue]:
+    """Run a linter, through the cache if it's a cacheable file linter."""
+    if (
+        cache is not None
+        and isinstance(linter, AbstractFileLinter)
+        and linter.cacheable
+    ):
+        return cache.run(linter, ctx)
+    return linter.run(ctx)
+
+
+def _collect(
+    linter: AbstractLinter, ctx: LintContext, cache: LintCache | None
+) -> list[LinterIssue]:
+    """Run a linter to completion and get all of its issues."""
+    return list(_lint(linter, ctx, cache))
@@ -18,17 +18,29 @@
 from __future__ import annotations
 
 import abc
+import contextlib
+import hashlib
+import json
+import os
 import pathlib
 import re
+import shutil
+import stat
+import sys
+import uuid
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from typing import TYPE_CHECKING, Any, BinaryIO, TypeVar, cast
 
 from craft_cli import emit
 
 from craft_application import errors, models, util
 from craft_application.services import base
 
+if sys.platform == "linux":
+    import fcntl
+
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Mapping
 
@@ -36,12 +48,16 @@ if TYPE_CHECKING:  # pragma: no cover
     from craft_application.services import ServiceFactory
 
 
+DEFAULT_MAX_PACKS = 4
 _PACKAGE_FILE_ATTR = "_craft_application_package_file"
+_PACK_MANIFEST_VERSION = 1
+_FICLONE = 0x40049409  # From linux/fs.h
+_COPY_CHUNK_SIZE = 1 << 30
 
 _MethodT = TypeVar("_MethodT", bound=Callable[..., Any])
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PackageFileEntry:
     """Metadata about a generated package file."""
 
@@ -89,6 +105,15 @@ class PackageService(base.AppService):
 
     _package_file_registry: list[PackageFileEntry] = []
 
+    concurrent_pack: bool = False
+    """Whether ``_pack`` can pack several artifacts at the same time.
+
+    Subclasses whose ``_pack`` shares no state between artifacts can set this to
+    have :meth:`pack_artifacts` pack their artifacts concurrently.
+    """
+    max_packs: int = DEFAULT_MAX_PACKS
+    """The maximum number of artifacts to pack at the same time."""
+
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
         # Build registry: start with the parent's entries, then overlay this class's.
@@ -294,6 +319,10 @@ class PackageService(base.AppService):
         if not artifact_path.is_file():
             return True
 
+        manifest_changed = self._pack_manifest_changed(partition, artifact_path)
+        if manifest_changed is not None:
+            return manifest_changed or self._app_needs_repack(partition)
+
         for file in self._package_files(partition):
             if self._package_file_changed(file, partition):
                 return True
@@ -305,22 +334,138 @@ class PackageService(base.AppService):
         return self._app_needs_repack(partition)
 
     def pack_artifacts(self) -> Mapping[str | None, bool]:
-        """Pack all artifacts for a package service with mediated metadata."""
+        """Pack all artifacts for a package service with mediated metadata.
+
+        If the service supports :attr:`concurrent_pack`, whether each artifact needs
+        packing is checked first, then up to :attr:`max_packs` artifacts are packed
+        at the same time.
+
+        :returns: A mapping of artifact names to whether they were packed.
+        :raises PackArtifactsError: if concurrently packing any artifact fails.
+        """
         artifacts = self.get_artifacts()
-        packed: dict[str | None, bool] = {}
+        if self.concurrent_pack:
+            return self._pack_artifacts_concurrently(artifacts)
 
+        packed: dict[str | None, bool] = {}
         for name, path in artifacts.items():
             if not self.needs_packing(name):
                 packed[name] = False
                 continue
 
-            self._materialize_package_files(name)
-            self._materialize_extra_assets(name)
-            self._pack(name=name, path=path)
+            self._pack_artifact(name, path)
             packed[name] = True
 
         return packed
 
+    def _pack_artifacts_concurrently(
+        self, artifacts: Mapping[str | None, pathlib.Path]
+    ) -> Mapping[str | None, bool]:
+        """Pack the artifacts that need packing, several at a time."""
+        packed = {name: self.needs_packing(name) for name in artifacts}
+        to_pack = [name for name, needed in packed.items() if needed]
+        if not to_pack:
+            return packed
+
+        failures: dict[str | None, BaseException] = {}
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_packs, len(to_pack)),
+            thread_name_prefix="package-pack",
+        ) as executor:
+            packs = {
+                executor.submit(self._pack_artifact, name, artifacts[name]): name
+                for name in to_pack
+            }
+            done = 0
+            for pack in as_completed(packs):
+                name = packs[pack]
+                if (exc := pack.exception()) is not None:
+                    failures[name] = exc
+                    packed[name] = False
+                else:
+                    done += 1
+                    emit.progress(f"Packed {done}/{len(packs)} artifacts")
+
+        if failures:
+            raise errors.PackArtifactsError(packed, failures) from next(
+                iter(failures.values())
+            )
+        return packed
+
+    def _pack_artifact(self, name: str | None, path: pathlib.Path) -> None:
+        """Write the generated files for an artifact, pack it and record its inputs."""
+        self._materialize_package_files(name)
+        self._materialize_extra_assets(name)
+        self._pack(name=name, path=path)
+        self._write_pack_manifest(name, path)
+
+    def _pack_manifest_path(self, partition_name: str | None) -> pathlib.Path:
+        """Get the path to the pack manifest of an artifact, in the parts directory.
+
+        The manifest is kept out of the project directory, which is also the work
+        directory in destructive mode, so writing it doesn't change the sources of
+        parts that build the project directory.
+        """
+        parts_dir = self._services.get("lifecycle").project_info.dirs.parts_dir
+        return parts_dir / f".pack-manifest-{partition_name or 'default'}.json"
+
+    def _get_pack_manifest(
+        self, partition_name: str | None, artifact_path: pathlib.Path
+    ) -> dict[str, Any]:
+        """Get a record of everything that went into packing an artifact.
+
+        The record holds the artifact's size and modification time, a digest of
+        the sizes and modification times in the prime directory, and a digest of
+        the generated package files and extra assets. Files are never read.
+        """
+        inputs = hashlib.sha256()
+        prime_dir = self._prime_dir_for(partition_name)
+        for package_file in self._package_files(partition_name):
+            content = getattr(self, package_file.method_name)(partition_name)
+            if content is not False:
+                _update_asset_digest(
+                    inputs, content, prime_dir / package_file.relative_path
+                )
+        for source, destination in self._gen_extra_assets(partition_name):
+            _update_asset_digest(inputs, source, destination)
+
+        return {
+            "version": _PACK_MANIFEST_VERSION,
+            "artifact": [str(artifact_path), _stat_key(artifact_path)],
+            "prime": _get_tree_digest(prime_dir),
+            "inputs": inputs.hexdigest(),
+        }
+
+    def _pack_manifest_changed(
+        self, partition_name: str | None, artifact_path: pathlib.Path
+    ) -> bool | None:
+        """Compare the inputs of an artifact with those it was last packed from.
+
+        :returns: Whether the inputs changed, or None if there's no usable manifest.
+        """
+        try:
+            manifest = json.loads(self._pack_manifest_path(partition_name).read_text())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict):
+            return None
+        if manifest.get("version") != _PACK_MANIFEST_VERSION:
+            return None
+        return manifest != self._get_pack_manifest(partition_name, artifact_path)
+
+    def _write_pack_manifest(
+        self, partition_name: str | None, artifact_path: pathlib.Path
+    ) -> None:
+        """Record the inputs an artifact was just packed from."""
+        path = self._pack_manifest_path(partition_name)
+        try:
+            manifest = self._get_pack_manifest(partition_name, artifact_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(manifest))
+        except OSError as exc:
+            emit.debug(f"Could not write the pack manifest {str(path)!r}: {exc}")
+            path.unlink(missing_ok=True)
+
     def _package_files(
         self, partition_name: str | None = None
     ) -> list[PackageFileEntry]:
@@ -402,16 +547,123 @@ class PackageService(base.AppService):
     def _write_asset(
         self, source: str | bytes | None | pathlib.Path, destination: pathlib.Path
     ) -> None:
-        """Write a generated package file or extra asset into prime."""
+        """Write a generated package file or extra asset into prime.
+
+        The file is written next to its destination and then renamed over it, so
+        the destination is never partially written. Path sources are copied with
+        :func:`_copy_asset`, keeping their permissions.
+        """
         if source is None:
             destination.unlink(missing_ok=True)
             return
 
         destination.parent.mkdir(parents=True, exist_ok=True)
         if isinstance(source, pathlib.Path):
-            destination.write_bytes(source.read_bytes())
+            _copy_asset(source, destination)
             return
-        if isinstance(source, str):
-            destination.write_text(source)
+
+        content = source.encode() if isinstance(source, str) else source
+        temp = _get_temporary_path(destination)
+        try:
+            with temp.open("xb") as file:
+                file.write(content)
+            with contextlib.suppress(FileNotFoundError):
+                temp.chmod(stat.S_IMODE(destination.stat().st_mode))
+            temp.replace(destination)
+        except BaseException:
+            temp.unlink(missing_ok=True)
+            raise
+
+
+def _get_temporary_path(destination: pathlib.Path) -> pathlib.Path:
+    """Get a unique path to write a file at before moving it to its destination."""
+    return destination.with_name(f".{destination.name}.{uuid.uuid4().hex}.tmp")
+
+
+def _copy_asset(source: pathlib.Path, destination: pathlib.Path) -> None:
+    """Copy a file to its destination without reading it all into memory.
+
+    The data is cloned if the filesystem supports it, copied by the kernel with
+    ``copy_file_range``, or streamed. The source is never hard linked, as the
+    packed copy may later be changed in place.
+    """
+    source_stat = source.stat()
+    temp = _get_temporary_path(destination)
+    try:
+        with source.open("rb") as source_file, temp.open("xb") as temp_file:
+            _copy_data(source_file, temp_file)
+        temp.chmod(stat.S_IMODE(source_stat.st_mode))
+        temp.replace(destination)
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
+
+
+def _copy_data(source: BinaryIO, destination: BinaryIO) -> None:
+    """Copy the data of an open file to another, without going through Python."""
+    if sys.platform == "linux":
+        with contextlib.suppress(OSError):
+            fcntl.ioctl(destination.fileno(), _FICLONE, source.fileno())
+            return
+        try:
+            while os.copy_file_range(
+                source.fileno(), destination.fileno(), _COPY_CHUNK_SIZE
+            ):
+                pass
+        except OSError:
+            # Not supported here, so start over with a regular copy.
+            source.seek(0)
+            destination.seek(0)
+            destination.truncate()
+        else:
             return
-        destination.write_bytes(source)
+    shutil.copyfileobj(source, destination)
+
+
+def _stat_key(path: pathlib.Path) -> list[int] | None:
+    """Get the size and modification time of a file, or None if it doesn't exist."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _update_asset_digest(
+    digest: hashlib._Hash,
+    source: str | bytes | None | pathlib.Path,
+    destination: pathlib.Path,
+) -> None:
+    """Add a generated file or extra asset and its destination to a digest."""
+    digest.update(f"{destination}\0{_stat_key(destination)}\0".encode())
+    if source is None:
+        digest.update(b"none\0")
+    elif isinstance(source, pathlib.Path):
+        digest.update(f"path\0{source}\0{_stat_key(source)}\0".encode())
+    else:
+        content = source.encode() if isinstance(source, str) else source
+        digest.update(f"content\0{len(content)}\0".encode())
+        digest.update(content)
+
+
+def _get_tree_digest(root: pathlib.Path) -> str:
+    """Get a digest of the names, modes, sizes and modification times in a tree."""
+    digest = hashlib.sha256()
+    directories = [str(root)]
+    while directories:
+        directory = directories.pop()
+        try:
+            with os.scandir(directory) as scanner:
+                entries = sorted(scanner, key=lambda entry: entry.name)
+        except FileNotFoundError:
+            digest.update(f"{directory}\0missing\n".encode())
+            continue
+        for entry in entries:
+            stat = entry.stat(follow_symlinks=False)
+            digest.update(
+                f"{os.path.relpath(entry.path, root)}\0{stat.st_mode}\0"
+                f"{stat.st_size}\0{stat.st_mtime_ns}\n".encode()
+            )
+            if entry.is_dir(follow_symlinks=False):
+                directories.append(entry.path)
+    return digest.hexdigest()
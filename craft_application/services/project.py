@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import copy
 import datetime
+import functools
 import os
 import pathlib
 from typing import TYPE_CHECKING, Any, Literal, cast, final
@@ -46,6 +47,28 @@ if TYPE_CHECKING:
     from .service_factory import ServiceFactory
 
 
+@functools.cache
+def _get_platforms_adapter() -> pydantic.TypeAdapter[
+    dict[Literal["platforms"], dict[str, Platform]]
+]:
+    """Get the (cached) adapter for validating a project's platforms."""
+    return pydantic.TypeAdapter(dict[Literal["platforms"], dict[str, Platform]])
+
+
+@functools.cache
+def _get_part_name_adapter() -> pydantic.TypeAdapter[PartName]:
+    """Get the (cached) adapter for validating part names."""
+    return pydantic.TypeAdapter(PartName)
+
+
+@functools.cache
+def _get_field_names(model_class: type[pydantic.BaseModel]) -> dict[str, str]:
+    """Get the names of a model's fields, keyed by their aliases."""
+    return {
+        field.alias or name: name for name, field in model_class.model_fields.items()
+    }
+
+
 class ProjectService(base.AppService):
     """A service for handling access to the project."""
 
@@ -258,9 +281,7 @@ class ProjectService(base.AppService):
         """Validate that the given platforms value is valid."""
         if platforms:
             cls._vectorise_platforms(platforms)
-        platforms_project_adapter = pydantic.TypeAdapter(
-            dict[Literal["platforms"], dict[str, Platform]],
-        )
+        platforms_project_adapter = _get_platforms_adapter()
         return platforms_project_adapter.dump_python(
             platforms_project_adapter.validate_python({"platforms": platforms}),
             mode="json",
@@ -476,7 +497,7 @@ class ProjectService(base.AppService):
             return
 
         part_names = project_dict.get("parts", {}).keys()
-        name_adapter: pydantic.TypeAdapter[PartName] = pydantic.TypeAdapter(PartName)
+        name_adapter = _get_part_name_adapter()
         invalid_part_names: list[str] = []
         for name in part_names:
             try:
@@ -784,8 +805,10 @@ class ProjectService(base.AppService):
     def deep_update(self, update: dict[str, Any]) -> None:
         """Perform a deep update of data in the project.
 
-        This method marshals the project and performs a recursive update on the
-        project dict, then unmarshals the project.
+        Only the top-level fields named in the update are marshalled, merged with
+        the update and validated again, on a copy of the project model. If the
+        update contains keys that aren't fields of the project, the whole project
+        is marshalled, updated and unmarshalled instead.
 
         :param update: The dict to merge into the project model.
 
@@ -796,6 +819,22 @@ class ProjectService(base.AppService):
         if not self._project_model:
             raise RuntimeError("Project doesn't exist.")
 
+        field_names = _get_field_names(type(self._project_model))
+        if all(key in field_names for key in update):
+            project_model = self._project_model.model_copy()
+            current = project_model.model_dump(
+                mode="json",
+                by_alias=True,
+                exclude_unset=True,
+                include={field_names[key] for key in update},
+            )
+            new_fields = self._deep_update(current, copy.deepcopy(update))
+            for key, value in new_fields.items():
+                # The model validates assignments, so this only validates one field.
+                setattr(project_model, field_names[key], value)
+            self._project_model = project_model
+            return
+
         project_dict = self._project_model.marshal()
         new_data = self._deep_update(project_dict, update)
         self._project_model = self._app.ProjectClass.unmarshal(new_data)
@@ -17,24 +17,30 @@
 
 from __future__ import annotations
 
+import atexit
+import collections
 import contextlib
 import enum
-import io
+import functools
 import os
 import pathlib
 import pkgutil
+import re
 import subprocess
 import sys
 import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 import craft_platforms
 import craft_providers
+import pygit2
 import snap_http
 from craft_cli import CraftError, emit
 from craft_providers import bases
 from craft_providers.actions.snap_installer import Snap
+from craft_providers.executor import get_instance_name
 from craft_providers.lxd import LXDInstance, LXDProvider
 from craft_providers.multipass import MultipassProvider
 
@@ -47,18 +53,45 @@ from craft_application.services import base
 from craft_application.util import ProServices, platforms, snap_config
 
 if TYPE_CHECKING:  # pragma: no cover
-    from collections.abc import Callable, Generator, Iterable, Sequence
+    from collections.abc import (
+        Callable,
+        Collection,
+        Generator,
+        Iterable,
+        Mapping,
+        Sequence,
+    )
 
     from craft_application.application import AppMetadata
     from craft_application.services import ServiceFactory
 
 
 DEFAULT_FORWARD_ENVIRONMENT_VARIABLES: Iterable[str] = ()
+DEFAULT_MAX_CLEANS = 4
 IGNORE_CONFIG_ITEMS: Iterable[str] = ("build_for", "platform", "verbosity_level")
 
 _REQUESTED_SNAPS: dict[str, Snap] = {}
 """Additional snaps to be installed using provider."""
 
+_SHORTENED_NAME_LENGTH = 40
+_SHORTENED_NAME_PATTERN = re.compile(r"[a-zA-Z0-9-]{1,40}-[0-9a-f]{20}")
+"""The names craft-providers gives instances whose names are too long or invalid.
+
+They're the first 40 valid characters of the name, then a hash of the full name.
+"""
+
+
+class _WarmInstance(NamedTuple):
+    """An instance launched ahead of time by the warm pool."""
+
+    instance: craft_providers.Executor
+    stack: contextlib.ExitStack
+    """The exit stack that stops the instance."""
+    messages: util.DeferredMessages
+    """The messages sent while launching the instance."""
+    allow_unstable: bool
+    use_base_instance: bool
+
 
 class ProviderService(base.AppService):
     """Manager for craft_providers in an application.
@@ -69,6 +102,8 @@ class ProviderService(base.AppService):
     """
 
     managed_mode_env_var = platforms.ENVIRONMENT_CRAFT_MANAGED_MODE
+    max_cleans: int = DEFAULT_MAX_CLEANS
+    """The maximum number of instances to clean at the same time."""
 
     def __init__(
         self,
@@ -92,6 +127,15 @@ class ProviderService(base.AppService):
         self.__provider_name: str | None = provider_name
         self._pack_state: models.PackState = models.PackState(artifacts=[])
         self._pro_services = pro_services
+        self._host_snaps: dict[str, dict[str, Any]] | None = None
+        self._warm_pool_size = 0
+        self._warm_queue: collections.deque[craft_platforms.BuildInfo] = (
+            collections.deque()
+        )
+        self._warm_pool: dict[str, Future[_WarmInstance]] = {}
+        self._warm_executor: ThreadPoolExecutor | None = None
+        self._streamed_logs: list[craft_providers.Executor] = []
+        self._work_dir_info: dict[pathlib.Path, _WorkDirInfo] = {}
 
     @property
     def compatibility_tag(self) -> str:
@@ -176,6 +220,18 @@ class ProviderService(base.AppService):
             )
             self.snaps.append(Snap(name=name, channel=channel, classic=True))
 
+    def _get_host_snaps(self) -> Mapping[str, dict[str, Any]]:
+        """Get the snaps installed on the host, indexed by name.
+
+        snapd is only queried the first time this is called.
+        """
+        if self._host_snaps is None:
+            snap_list = cast(list[dict[str, Any]], snap_http.list().result)
+            self._host_snaps = {}
+            for snap in snap_list:
+                self._host_snaps.setdefault(snap["name"], snap)
+        return self._host_snaps
+
     def _get_snap_store_channel(self, name: str) -> str | None:
         """Get the tracking channel of a snap on the host, if installed from the store.
 
@@ -183,10 +239,9 @@ class ProviderService(base.AppService):
         :returns: The tracking channel string, or None if the snap is not
           installed from a store channel (e.g. side-loaded).
         """
-        snap_list = cast(list[dict[str, Any]], snap_http.list().result)
-        matching = [s for s in snap_list if s["name"] == name]
-        if matching:
-            return matching[0].get("tracking-channel")
+        snap = self._get_host_snaps().get(name)
+        if snap:
+            return snap.get("tracking-channel")
         return None
 
     def enqueue_snap_injection(self, name: str, *, include_base: bool = True) -> bool:
@@ -199,32 +254,31 @@ class ProviderService(base.AppService):
         emit.debug(
             f"Setting {name} to be injected from the host into the build environment."
         )
-        # NOTE: A future version of snap-http will allow a smaller response.
-        # https://github.com/canonical/snap-http/pull/30
-        snap_list = cast(list[dict[str, Any]], snap_http.list().result)
-        matching_snaps = [s for s in snap_list if s["name"] == name]
-        for snap in matching_snaps:
-            # Must inject the base before the app or snapd will download the base.
-            if include_base:
-                matching_base_snaps = [
-                    s for s in snap_list if s["name"] == snap.get("base")
-                ]
-                installing_base = [
-                    base for base in self.snaps if base.name == snap.get("base")
-                ]
-                if matching_base_snaps and not installing_base:
-                    self.snaps.append(Snap(name=snap["base"], channel=None))
-
-            self.snaps.append(
-                Snap(
-                    name=snap["name"],
-                    channel=None,
-                    classic=snap["confinement"] == "classic",
-                )
-            )
-        if not matching_snaps:
+        host_snaps = self._get_host_snaps()
+        snap = host_snaps.get(name)
+        if snap is None:
             emit.debug(f"Snap {name} not installed on the system, not injecting.")
-        return len(matching_snaps) >= 1
+            return False
+
+        # Must inject the base before the app or snapd will download the base.
+        base: str | None = snap.get("base")
+        installing_base = any(installing.name == base for installing in self.snaps)
+        if (
+            include_base
+            and base is not None
+            and base in host_snaps
+            and not installing_base
+        ):
+            self.snaps.append(Snap(name=base, channel=None))
+
+        self.snaps.append(
+            Snap(
+                name=snap["name"],
+                channel=None,
+                classic=snap["confinement"] == "classic",
+            )
+        )
+        return True
 
     @contextlib.contextmanager
     def instance(
@@ -254,6 +308,70 @@ class ProviderService(base.AppService):
             project_name = self._project.name
         instance_name = self._get_instance_name(work_dir, build_info, project_name)
         emit.debug(f"Preparing managed instance {instance_name!r}")
+
+        with contextlib.ExitStack() as stack:
+            if clean_existing or kwargs:
+                # Warm instances are launched with the default options.
+                self._discard_warm_instance(instance_name)
+                instance = None
+            else:
+                instance = self._claim_warm_instance(
+                    instance_name,
+                    stack,
+                    allow_unstable=allow_unstable,
+                    use_base_instance=use_base_instance,
+                )
+                if instance is not None:
+                    emit.debug(f"Using warm instance {instance_name!r}")
+
+            if instance is None:
+                instance = stack.enter_context(
+                    self._launched_instance(
+                        build_info,
+                        work_dir=work_dir,
+                        project_name=project_name,
+                        instance_name=instance_name,
+                        allow_unstable=allow_unstable,
+                        clean_existing=clean_existing,
+                        use_base_instance=use_base_instance,
+                        prepare_instance=prepare_instance,
+                        messages=emit,
+                        **kwargs,
+                    )
+                )
+            elif prepare_instance:
+                # The warm instance was prepared without the caller's callback.
+                # The proxy configuration it already has isn't sent again.
+                prepare_instance(instance)
+            self._services.get("state").configure_instance(instance)
+
+            self._fill_warm_pool()
+            try:
+                yield instance
+            finally:
+                self._capture_logs_from_instance(instance)
+
+    @contextlib.contextmanager
+    def _launched_instance(  # noqa: PLR0913
+        self,
+        build_info: craft_platforms.BuildInfo,
+        *,
+        work_dir: pathlib.Path,
+        project_name: str,
+        instance_name: str,
+        allow_unstable: bool = True,
+        clean_existing: bool = False,
+        use_base_instance: bool = True,
+        prepare_instance: Callable[[craft_providers.Executor], None] | None = None,
+        messages: util.Messages | None = None,
+        **kwargs: bool | str | None,
+    ) -> Generator[craft_providers.Executor, None, None]:
+        """Launch an instance, mount the project into it and configure it.
+
+        :param messages: Where to send messages. Defaults to the emitter.
+        """
+        if messages is None:
+            messages = emit
         base_name = bases.BaseName(
             name=build_info.build_base.distribution,
             version=build_info.build_base.series,
@@ -269,9 +387,18 @@ class ProviderService(base.AppService):
 
         build_on = self._services.get("config").get("build_on")
 
-        build_root = _get_build_root(work_dir, use_git_root=self._use_git_build_root)
+        work_dir_info = self._get_work_dir_info(work_dir)
+        build_root = _get_build_root(
+            work_dir_info, use_git_root=self._use_git_build_root
+        )
+        if build_root != work_dir_info.path:
+            messages.debug(
+                f"Git-driven build root: mounting {str(build_root)!r} as /root/project"
+            )
 
-        emit.progress(f"Launching managed {base_name[0]} {base_name[1]} instance...")
+        messages.progress(
+            f"Launching managed {base_name[0]} {base_name[1]} instance..."
+        )
         with provider.launched_environment(
             project_name=project_name,
             project_path=build_root,
@@ -289,13 +416,149 @@ class ProviderService(base.AppService):
                 # https://github.com/canonical/craft-providers/issues/315
                 target=self._app.managed_instance_project_path,
             )
-            self._services.get("state").configure_instance(instance)
-            emit.debug("Instance launched and working directory mounted")
-            self._setup_instance_bashrc(instance)
-            try:
-                yield instance
-            finally:
-                self._capture_logs_from_instance(instance)
+            messages.debug("Instance launched and working directory mounted")
+            # prepare_instance only runs when the instance is created, before its
+            # base is set up, so everything else is sent once it's launched.
+            preparation = util.InstancePreparation(messages)
+            self._setup_instance_bashrc(preparation)
+            self.prepare_instance_files(preparation)
+            self._services.get("proxy").finalize_instance_configuration(
+                instance, preparation
+            )
+            preparation.apply(instance)
+            yield instance
+
+    def warm_instances(self, build_infos: Iterable[craft_platforms.BuildInfo]) -> None:
+        """Prepare instances for upcoming builds in the background.
+
+        This does nothing unless the ``instance_warm_pool`` config option is set.
+        Up to that many instances are launched and configured ahead of time and
+        :meth:`instance` uses them rather than launching its own. Each time a warm
+        instance is used, the next of the queued builds is warmed in its place.
+
+        :param build_infos: The builds that will run after the current one, in order.
+        """
+        pool_size = self._services.get("config").get("instance_warm_pool")
+        if not pool_size:
+            return
+        # Services aren't created in a thread-safe way, so get the ones the
+        # background launches use before starting them.
+        self._services.get("state")
+        self._services.get("proxy")
+        # Choosing the provider logs, which can't happen in the background.
+        self.get_provider(name=self.__provider_name)
+        self._warm_pool_size = pool_size
+        self._warm_queue.extend(build_infos)
+        self._fill_warm_pool()
+
+    def close_warm_pool(self) -> None:
+        """Stop the instances in the warm pool that were never used."""
+        self._warm_queue.clear()
+        for instance_name in list(self._warm_pool):
+            self._discard_warm_instance(instance_name)
+        if self._warm_executor is not None:
+            self._warm_executor.shutdown()
+            self._warm_executor = None
+
+    def _fill_warm_pool(self) -> None:
+        """Start warming queued builds until the pool is full."""
+        while self._warm_queue and len(self._warm_pool) < self._warm_pool_size:
+            build_info = self._warm_queue.popleft()
+            instance_name = self._get_instance_name(
+                self._work_dir, build_info, self._project.name
+            )
+            if instance_name in self._warm_pool:
+                continue
+            if self._warm_executor is None:
+                self._warm_executor = ThreadPoolExecutor(
+                    max_workers=self._warm_pool_size,
+                    thread_name_prefix="provider-warm",
+                )
+                atexit.register(self.close_warm_pool)
+            emit.debug(f"Warming managed instance {instance_name!r}")
+            self._warm_pool[instance_name] = self._warm_executor.submit(
+                self._warm_instance, build_info, instance_name
+            )
+
+    def _warm_instance(
+        self, build_info: craft_platforms.BuildInfo, instance_name: str
+    ) -> _WarmInstance:
+        """Launch an instance and keep it running until it's claimed.
+
+        This runs in a background thread, so its messages are kept until the
+        instance is claimed rather than sent to the emitter, which may be paused.
+        """
+        proxy = self._services.get("proxy")
+        messages = util.DeferredMessages()
+        allow_unstable = use_base_instance = True
+
+        def prepare_instance(instance: craft_providers.Executor) -> None:
+            preparation = util.InstancePreparation(messages)
+            proxy.configure_instance(instance, preparation)
+            preparation.apply(instance)
+
+        with contextlib.ExitStack() as stack:
+            instance = stack.enter_context(
+                self._launched_instance(
+                    build_info,
+                    work_dir=self._work_dir,
+                    project_name=self._project.name,
+                    instance_name=instance_name,
+                    allow_unstable=allow_unstable,
+                    use_base_instance=use_base_instance,
+                    prepare_instance=prepare_instance,
+                    messages=messages,
+                )
+            )
+            return _WarmInstance(
+                instance,
+                stack.pop_all(),
+                messages,
+                allow_unstable=allow_unstable,
+                use_base_instance=use_base_instance,
+            )
+
+    def _claim_warm_instance(
+        self,
+        instance_name: str,
+        stack: contextlib.ExitStack,
+        *,
+        allow_unstable: bool,
+        use_base_instance: bool,
+    ) -> craft_providers.Executor | None:
+        """Take an instance from the warm pool, waiting for it if necessary.
+
+        :param instance_name: The name of the instance to claim.
+        :param stack: The exit stack that stops the instance once it's done with.
+        :param allow_unstable: Whether the caller allows unstable images.
+        :param use_base_instance: Whether the caller uses a base instance.
+        :returns: The warm instance, or None if it isn't in the pool, failed to
+            launch or was launched with other options, in which case it's stopped.
+        """
+        future = self._warm_pool.pop(instance_name, None)
+        if future is None:
+            return None
+        if exc := future.exception():
+            emit.debug(f"Could not warm instance {instance_name!r}: {exc}")
+            return None
+        warm = future.result()
+        if (warm.allow_unstable, warm.use_base_instance) != (
+            allow_unstable,
+            use_base_instance,
+        ):
+            emit.debug(f"Not using warm instance {instance_name!r} with other options")
+            warm.stack.close()
+            return None
+        warm.messages.replay()
+        stack.enter_context(warm.stack)
+        return warm.instance
+
+    def _discard_warm_instance(self, instance_name: str) -> None:
+        """Remove an instance from the warm pool, stopping it if it was launched."""
+        future = self._warm_pool.pop(instance_name, None)
+        if future is None or future.cancel() or future.exception():
+            return
+        future.result().stack.close()
 
     def get_base(
         self,
@@ -400,23 +663,109 @@ class ProviderService(base.AppService):
             emit.debug("Provider not set in snap config.")
             return None
 
-    def clean_instances(self) -> None:
-        """Clean all existing managed instances related to the project."""
+    def clean_instances(self, *, all_platforms: bool = False) -> None:
+        """Clean all existing managed instances related to the project.
+
+        Instances are cleaned concurrently, with at most ``max_cleans`` being
+        cleaned at the same time.
+
+        :param all_platforms: Whether to clean every instance of the project in
+            the work directory, found with a single call to the provider, rather
+            than the instances in the build plan. This includes the instances of
+            renamed and removed platforms.
+        """
         provider = self.get_provider(name=self.__provider_name)
-        build_planner = self._services.get("build_plan")
+        cleaners: list[Callable[[], None]]
+        if all_platforms:
+            if not provider.is_provider_installed():
+                emit.debug(
+                    "Not cleaning instances because the provider isn't installed."
+                )
+                return
+            cleaners = [
+                instance.delete for instance in self._list_project_instances(provider)
+            ]
+        else:
+            build_plan = self._services.get("build_plan").create_build_plan(
+                platforms=None,
+                build_for=None,
+                build_on=[craft_platforms.DebianArchitecture.from_host()],
+            )
+            cleaners = [
+                functools.partial(
+                    self._clean_instance,
+                    provider,
+                    self._work_dir,
+                    info,
+                    self._project.name,
+                )
+                for info in build_plan
+            ]
 
-        build_plan = build_planner.create_build_plan(
-            platforms=None,
-            build_for=None,
-            build_on=[craft_platforms.DebianArchitecture.from_host()],
+        if not cleaners:
+            return
+        target = "environments" if len(cleaners) > 1 else "environment"
+        emit.progress(f"Cleaning build {target}")
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_cleans, len(cleaners)),
+            thread_name_prefix="provider-clean",
+        ) as executor:
+            cleans = [executor.submit(cleaner) for cleaner in cleaners]
+            for done, clean in enumerate(as_completed(cleans), start=1):
+                if not clean.exception():
+                    emit.progress(f"Cleaned {done}/{len(cleans)} build {target}")
+        for clean in cleans:
+            clean.result()
+
+    def _list_project_instances(
+        self, provider: craft_providers.Provider
+    ) -> Collection[craft_providers.Executor]:
+        """List the provider's instances of the project in the work directory.
+
+        Instance names end with the work directory's inode, which tells them apart
+        from those of other projects whose names start the same way. Names that
+        craft-providers shortened with a hash are only matched for the platforms
+        in the project's exhaustive build plan, as the inode isn't left in them.
+        """
+        prefix = f"{self._app.name}-{self._project.name}-"
+        suffix = f"-{self._get_work_dir_info(self._work_dir).inode}"
+        name_pattern = re.compile(f"{re.escape(prefix)}.+{re.escape(suffix)}")
+        build_plan = self._services.get("build_plan").create_build_plan(
+            platforms=None, build_for=None, build_on=None
         )
+        planned_names = {
+            get_instance_name(
+                self._get_instance_name(self._work_dir, info, self._project.name),
+                craft_providers.ProviderError,
+            )
+            for info in build_plan
+        }
+        instances: list[craft_providers.Executor] = []
+        unmatched: list[str] = []
+        # Shortened names keep only the start of the name.
+        list_prefix = prefix[:_SHORTENED_NAME_LENGTH]
+        for instance in provider.list_instances(instance_name_prefix=list_prefix):
+            name = getattr(instance, "name", "")
+            if name in planned_names or name_pattern.fullmatch(name):
+                instances.append(instance)
+            elif _SHORTENED_NAME_PATTERN.fullmatch(name):
+                unmatched.append(name)
+        emit.debug(f"Found {len(instances)} instances matching {prefix}*{suffix}")
+        if unmatched:
+            emit.progress(
+                f"Not cleaning {len(unmatched)} instances with shortened names that "
+                f"may belong to other projects: {', '.join(sorted(unmatched))}",
+                permanent=True,
+            )
+        return instances
 
-        if build_plan:
-            target = "environments" if len(build_plan) > 1 else "environment"
-            emit.progress(f"Cleaning build {target}")
-
-        for info in build_plan:
-            self._clean_instance(provider, self._work_dir, info, self._project.name)
+    def _get_work_dir_info(self, work_dir: pathlib.Path) -> _WorkDirInfo:
+        """Get the facts about a work directory, which are only resolved once."""
+        info = self._work_dir_info.get(work_dir)
+        if info is None:
+            info = self._work_dir_info[work_dir] = _WorkDirInfo(work_dir)
+        return info
 
     def _get_instance_name(
         self,
@@ -424,7 +773,7 @@ class ProviderService(base.AppService):
         build_info: craft_platforms.BuildInfo,
         project_name: str,
     ) -> str:
-        work_dir_inode = work_dir.stat().st_ino
+        work_dir_inode = self._get_work_dir_info(work_dir).inode
 
         # craft-providers will remove invalid characters from the name but replacing
         # characters improves readability for multi-base platforms like "ubuntu@24.04:amd64"
@@ -453,7 +802,16 @@ class ProviderService(base.AppService):
         return MultipassProvider()
 
     def _capture_logs_from_instance(self, instance: craft_providers.Executor) -> None:
-        """Fetch the logfile from inside `instance` and emit its contents."""
+        """Fetch the logfile from inside `instance` and emit its contents.
+
+        Nothing is fetched if the log was already streamed from the instance.
+        """
+        if any(streamed is instance for streamed in self._streamed_logs):
+            self._streamed_logs = [
+                streamed for streamed in self._streamed_logs if streamed is not instance
+            ]
+            emit.debug("Logs were streamed from the managed instance.")
+            return
         source_log_path = util.get_managed_logpath(self._app)
         with instance.temporarily_pull_file(
             source=source_log_path, missing_ok=True
@@ -467,22 +825,32 @@ class ProviderService(base.AppService):
                     f"Could not find log file {source_log_path.as_posix()} in instance."
                 )
 
-    def _setup_instance_bashrc(self, instance: craft_providers.Executor) -> None:
+    def prepare_instance_files(self, preparation: util.InstancePreparation) -> None:
+        """Add files and commands to send to each launched instance.
+
+        Everything added here is sent to the instance together with its bashrc and
+        the end of its proxy configuration, using a single push and a single
+        command. Applications can override this
+        method to add their own files rather than pushing them one at a time.
+
+        Instances may be prepared in a background thread, so overrides should send
+        their messages to ``preparation.messages`` rather than the emitter.
+
+        :param preparation: The preparation to add files and commands to.
+        """
+
+    def _setup_instance_bashrc(self, preparation: util.InstancePreparation) -> None:
         """Set up the instance's bashrc to export environment."""
         bashrc = pkgutil.get_data("craft_application", "misc/instance_bashrc")
 
         if bashrc is None:
-            emit.debug(
+            preparation.messages.debug(
                 "Could not find the bashrc file in the craft-application package"
             )
             return
 
-        emit.debug("Pushing bashrc to instance")
-        instance.push_file_io(
-            destination=Path("/root/.bashrc"),
-            content=io.BytesIO(bashrc),
-            file_mode="644",
-        )
+        preparation.messages.debug("Pushing bashrc to instance")
+        preparation.add_file(Path("/root/.bashrc"), bashrc)
 
     def _clean_instance(
         self,
@@ -580,8 +948,12 @@ class ProviderService(base.AppService):
                 fetch_env = self._services.get("fetch").configure_instance(instance)
                 env.update(fetch_env)
 
-            session_env = self._services.get("proxy").configure_instance(instance)
+            preparation = util.InstancePreparation()
+            session_env = self._services.get("proxy").configure_instance(
+                instance, preparation
+            )
             env.update(session_env)
+            preparation.apply(instance)
 
         with self.instance(
             build_info=build_info,
@@ -592,13 +964,17 @@ class ProviderService(base.AppService):
         ) as instance:
             self.configure_instance_with_pro(instance)
             emit.debug(f"Running in instance: {command}")
-            self._services.get("proxy").finalize_instance_configuration(instance)
+            # The emitter doesn't log while paused, so the stream writes to its log
+            # file directly.
+            log_stream = util.InstanceLogStream(
+                instance, util.get_managed_logpath(self._app), emit.log_filepath
+            )
             try:
-                with emit.pause():
+                with emit.pause(), log_stream:
                     instance.execute_run(
                         list(command),
                         cwd=_get_managed_cwd(
-                            self._work_dir,
+                            self._get_work_dir_info(self._work_dir),
                             self._app.managed_instance_project_path,
                             use_git_root=self._use_git_build_root,
                         ),
@@ -610,6 +986,8 @@ class ProviderService(base.AppService):
                     f"Failed to run {self._app.name} in instance"
                 ) from exc
             finally:
+                if log_stream.complete:
+                    self._streamed_logs.append(instance)
                 if active_fetch_service:
                     self._services.get("fetch").teardown_instance()
 
@@ -617,19 +995,41 @@ class ProviderService(base.AppService):
 def _find_git_root(path: pathlib.Path) -> pathlib.Path | None:
     """Return the git working tree root containing path, or None if not in a git repo."""
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--show-toplevel"],
-            capture_output=True,
-            text=True,
-            cwd=path,
-            check=True,
-        )
-        return pathlib.Path(result.stdout.strip())
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        repo_path = pygit2.discover_repository(path)
+        if repo_path is None:
+            return None
+        workdir = pygit2.Repository(repo_path).workdir
+    except pygit2.GitError:
         return None
+    return pathlib.Path(workdir) if workdir else None
+
+
+class _WorkDirInfo:
+    """Facts about a work directory on the host, each resolved on first use.
+
+    :param path: The work directory.
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        self.path = path
+
+    @functools.cached_property
+    def inode(self) -> int:
+        """The inode number of the work directory."""
+        return self.path.stat().st_ino
+
+    @functools.cached_property
+    def resolved_path(self) -> pathlib.Path:
+        """The absolute path of the work directory, with symlinks resolved."""
+        return self.path.resolve()
+
+    @functools.cached_property
+    def git_root(self) -> pathlib.Path | None:
+        """The root of the git working tree containing the work directory, if any."""
+        return _find_git_root(self.path)
 
 
-def _get_build_root(work_dir: pathlib.Path, *, use_git_root: bool) -> pathlib.Path:
+def _get_build_root(work_dir: _WorkDirInfo, *, use_git_root: bool) -> pathlib.Path:
     """Return the directory to mount as the build root in a managed instance.
 
     When use_git_root is True and work_dir is inside a git repo, the git
@@ -637,16 +1037,15 @@ def _get_build_root(work_dir: pathlib.Path, *, use_git_root: bool) -> pathlib.Pa
     (e.g. shared libraries in a monorepo) is accessible in the build container.
     """
     if not use_git_root:
-        return work_dir
-    git_root = _find_git_root(work_dir)
+        return work_dir.path
+    git_root = work_dir.git_root
     if git_root is None:
-        return work_dir
-    emit.debug(f"Git-driven build root: mounting {str(git_root)!r} as /root/project")
+        return work_dir.path
     return git_root
 
 
 def _get_managed_cwd(
-    work_dir: pathlib.Path,
+    work_dir: _WorkDirInfo,
     default_cwd: pathlib.PurePosixPath,
     *,
     use_git_root: bool,
@@ -658,10 +1057,10 @@ def _get_managed_cwd(
     """
     if not use_git_root:
         return default_cwd
-    git_root = _find_git_root(work_dir)
-    if git_root is None or git_root == work_dir:
+    git_root = work_dir.git_root
+    if git_root is None or git_root == work_dir.path:
         return default_cwd
-    resolved_work_dir = work_dir.resolve()
+    resolved_work_dir = work_dir.resolved_path
     resolved_git_root = git_root.resolve()
     if not resolved_work_dir.is_relative_to(resolved_git_root):
         return default_cwd
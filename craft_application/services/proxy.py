@@ -15,18 +15,21 @@
 
 from __future__ import annotations
 
-import io
 import pathlib
 import subprocess
+import weakref
 from typing import TYPE_CHECKING, final
 
-from craft_cli import emit
+from craft_application import util
 
 from . import base
 
 if TYPE_CHECKING:
     import craft_providers
 
+    from craft_application.application import AppMetadata
+    from craft_application.services import ServiceFactory
+
 # The path to the proxy certificate inside the build instance.
 _PROXY_CERT_INSTANCE_PATH = pathlib.Path(
     "/usr/local/share/ca-certificates/local-ca.crt"
@@ -45,6 +48,12 @@ class ProxyService(base.AppService):
     __is_configured: bool = False
     """True if the proxy service has been configured."""
 
+    def __init__(self, app: AppMetadata, services: ServiceFactory) -> None:
+        super().__init__(app, services)
+        self.__configured_instances: weakref.WeakSet[craft_providers.Executor] = (
+            weakref.WeakSet()
+        )
+
     @final
     def configure(self, proxy_cert: pathlib.Path, http_proxy: str) -> None:
         """Configure the proxy service.
@@ -57,43 +66,70 @@ class ProxyService(base.AppService):
         self.__is_configured = True
 
     @final
-    def configure_instance(self, instance: craft_providers.Executor) -> dict[str, str]:
+    def configure_instance(
+        self,
+        instance: craft_providers.Executor,
+        preparation: util.InstancePreparation | None = None,
+    ) -> dict[str, str]:
         """Configure a build instance before the base image setup.
 
+        An instance that was already configured, such as a warm instance, isn't
+        configured again.
+
         :param instance: The instance to configure.
+        :param preparation: A preparation to add the configuration to. The caller
+            is then responsible for applying it. If not set, the configuration is
+            sent to the instance right away.
 
         :returns: A dict of environment variables to set in the instance.
         """
+        own_preparation = preparation is None
+        if preparation is None:
+            preparation = util.InstancePreparation()
         if not self.__is_configured:
-            emit.debug(
+            preparation.messages.debug(
                 "Skipping proxy configuration because the proxy service isn't configured."
             )
             return {}
-
-        emit.progress("Configuring proxy in instance")
-
-        self._install_certificate(instance)
-        self._configure_apt(instance)
-        self._configure_pip(instance)
+        if instance in self.__configured_instances:
+            preparation.messages.debug("Proxy already configured in instance.")
+            return self._env
+
+        preparation.messages.progress("Configuring proxy in instance")
+        self._install_certificate(preparation)
+        self._configure_apt(instance, preparation)
+        self._configure_pip(preparation)
+        if own_preparation:
+            preparation.apply(instance)
+        self.__configured_instances.add(instance)
 
         return self._env
 
     def finalize_instance_configuration(
-        self, instance: craft_providers.Executor
+        self,
+        instance: craft_providers.Executor,
+        preparation: util.InstancePreparation | None = None,
     ) -> None:
         """Finish configuring a build instance after the base image setup.
 
         :param instance: The instance to configure.
+        :param preparation: A preparation to add the configuration to. The caller
+            is then responsible for applying it. If not set, the configuration is
+            sent to the instance right away.
         """
+        own_preparation = preparation is None
+        if preparation is None:
+            preparation = util.InstancePreparation()
         if not self.__is_configured:
-            emit.debug(
+            preparation.messages.debug(
                 "Skipping package configuration because the proxy service isn't configured."
             )
             return
 
-        emit.progress("Finalizing instance configuration")
-
-        self._configure_snapd(instance)
+        preparation.messages.progress("Finalizing instance configuration")
+        self._configure_snapd(preparation)
+        if own_preparation:
+            preparation.apply(instance)
 
     @property
     def _env(self) -> dict[str, str]:
@@ -109,31 +145,30 @@ class ProxyService(base.AppService):
             "GOPROXY": "direct",
         }
 
-    def _configure_pip(self, instance: craft_providers.Executor) -> None:
-        emit.progress("Configuring pip")
+    def _configure_pip(self, preparation: util.InstancePreparation) -> None:
+        preparation.messages.progress("Configuring pip")
 
-        self._execute_run(instance, ["mkdir", "-p", "/root/.pip"])
         pip_config = b"[global]\ncert=/usr/local/share/ca-certificates/local-ca.crt"
-        instance.push_file_io(
-            destination=pathlib.Path("/root/.pip/pip.conf"),
-            content=io.BytesIO(pip_config),
-            file_mode="0644",
-        )
+        preparation.add_file(pathlib.Path("/root/.pip/pip.conf"), pip_config)
 
-    def _configure_snapd(self, instance: craft_providers.Executor) -> None:
+    def _configure_snapd(self, preparation: util.InstancePreparation) -> None:
         """Configure snapd to use the proxy and see our certificate.
 
         Note: This must be called after _install_certificate(), to ensure that
         when the snapd restart happens the new cert is there.
         """
-        emit.progress("Configuring snapd")
-        self._execute_run(instance, ["systemctl", "restart", "snapd"])
+        preparation.messages.progress("Configuring snapd")
+        preparation.add_command(["systemctl", "restart", "snapd"])
         for config in ("proxy.http", "proxy.https"):
-            self._execute_run(
-                instance, ["snap", "set", "system", f"{config}={self.__http_proxy}"]
+            preparation.add_command(
+                ["snap", "set", "system", f"{config}={self.__http_proxy}"]
             )
 
-    def _configure_apt(self, instance: craft_providers.Executor) -> None:
+    def _configure_apt(
+        self,
+        instance: craft_providers.Executor,
+        preparation: util.InstancePreparation,
+    ) -> None:
         """Configure the proxy for apt.
 
         This function is a no-op on systems without apt.
@@ -141,24 +176,22 @@ class ProxyService(base.AppService):
         try:
             self._execute_run(instance, ["test", "-d", "/etc/apt"])
         except subprocess.CalledProcessError:
-            emit.debug(
+            preparation.messages.debug(
                 "Not configuring the proxy for apt because apt isn't available in the instance."
             )
             return
 
-        emit.progress("Configuring Apt")
+        preparation.messages.progress("Configuring Apt")
         apt_config = f'Acquire::http::Proxy "{self.__http_proxy}";\n'
         apt_config += f'Acquire::https::Proxy "{self.__http_proxy}";\n'
 
-        instance.push_file_io(
-            destination=pathlib.Path("/etc/apt/apt.conf.d/99proxy"),
-            content=io.BytesIO(apt_config.encode("utf-8")),
-            file_mode="0644",
+        preparation.add_file(
+            pathlib.Path("/etc/apt/apt.conf.d/99proxy"), apt_config.encode("utf-8")
+        )
+        preparation.add_command(["/bin/rm", "-Rf", "/var/lib/apt/lists"])
+        preparation.add_command(
+            ["apt", "update"], progress="Refreshing Apt package listings"
         )
-        self._execute_run(instance, ["/bin/rm", "-Rf", "/var/lib/apt/lists"])
-
-        emit.progress("Refreshing Apt package listings")
-        self._execute_run(instance, ["apt", "update"])
 
     def _execute_run(
         self, instance: craft_providers.Executor, cmd: list[str]
@@ -167,9 +200,9 @@ class ProxyService(base.AppService):
             cmd, check=True, text=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
         )
 
-    def _install_certificate(self, instance: craft_providers.Executor) -> None:
-        emit.progress("Installing certificate")
-        emit.debug(
+    def _install_certificate(self, preparation: util.InstancePreparation) -> None:
+        preparation.messages.progress("Installing certificate")
+        preparation.messages.debug(
             f"Installing certificate from {str(self.__proxy_cert)!r} to "
             f"{str(_PROXY_CERT_INSTANCE_PATH)!r} in the instance."
         )
@@ -183,15 +216,8 @@ class ProxyService(base.AppService):
                 f"Proxy certificate {str(self.__proxy_cert)!r} isn't a file."
             )
 
-        self._execute_run(
-            instance,
-            ["mkdir", "-p", str(_PROXY_CERT_INSTANCE_PATH.parent)],
-        )
-        instance.push_file(
-            source=self.__proxy_cert,
-            destination=_PROXY_CERT_INSTANCE_PATH,
-        )
+        preparation.add_file(_PROXY_CERT_INSTANCE_PATH, self.__proxy_cert.read_bytes())
         # Update the certificates db
-        self._execute_run(
-            instance, ["/bin/sh", "-c", "/usr/sbin/update-ca-certificates > /dev/null"]
+        preparation.add_command(
+            ["/bin/sh", "-c", "/usr/sbin/update-ca-certificates > /dev/null"]
         )
@@ -17,7 +17,9 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import contextlib
+import dataclasses
 import datetime
 import itertools
 import os
@@ -47,15 +49,32 @@ if TYPE_CHECKING:  # pragma: no cover
     from craft_application import AppMetadata, ServiceFactory
 
 DEFAULT_POLL_INTERVAL = 30
+DEFAULT_MAX_DOWNLOADS = 4
+DEFAULT_MAX_REQUESTS = 8
+
+
+@dataclasses.dataclass(frozen=True)
+class BuildOutputs:
+    """The files fetched for a single remote build."""
+
+    arch: str
+    """The architecture tag of the build."""
+    log: pathlib.Path | None
+    """The path to the downloaded build log, if the build has a log."""
+    artifacts: list[pathlib.Path]
+    """The paths to the downloaded build artifacts."""
 
 
 class RemoteBuildService(base.AppService):
     """Abstract service for performing remote builds."""
 
     RecipeClass: type[launchpad.models.Recipe]
-    lp: launchpad.Launchpad
     _deadline: int | None = None
     """The deadline for the builds. Raises a TimeoutError if we surpass this."""
+    max_downloads: int = DEFAULT_MAX_DOWNLOADS
+    """The maximum number of builds whose outputs are downloaded concurrently."""
+    max_requests: int = DEFAULT_MAX_REQUESTS
+    """The maximum number of concurrent Launchpad requests when cancelling builds."""
 
     def __init__(self, app: AppMetadata, services: ServiceFactory) -> None:
         super().__init__(app=app, services=services)
@@ -68,11 +87,27 @@ class RemoteBuildService(base.AppService):
         self._repository: launchpad.models.GitRepository | None = None
         self._recipe: launchpad.models.recipe.BaseRecipe | None = None
         self._builds: Collection[launchpad.models.Build] = []
+        # Whether the builds were loaded from Launchpad since their states were
+        # last checked, in which case they needn't be refreshed.
+        self._builds_are_fresh = False
         self._project_name: str | None = None
+        self._lp: launchpad.Launchpad | None = None
+        self._download_executor: concurrent.futures.ThreadPoolExecutor | None = None
 
-    def setup(self) -> None:
-        """Set up the remote builder."""
-        self.lp = self._get_lp_client()
+    @property
+    def lp(self) -> launchpad.Launchpad:
+        """The Launchpad client.
+
+        Logging in is deferred until the client is first needed, so setting up the
+        service doesn't make any requests.
+        """
+        if self._lp is None:
+            self._lp = self._get_lp_client()
+        return self._lp
+
+    @lp.setter
+    def lp(self, value: launchpad.Launchpad) -> None:
+        self._lp = value
 
     @property
     def credentials_filepath(self) -> pathlib.Path:
@@ -149,6 +184,7 @@ class RemoteBuildService(base.AppService):
         )
         self._check_timeout()
         self._builds = list(self._new_builds(self._recipe))
+        self._builds_are_fresh = True
         self._is_setup = True
         return self._builds
 
@@ -159,6 +195,7 @@ class RemoteBuildService(base.AppService):
         self._repository = self._get_repository()
         self._recipe = self._get_recipe()
         self._builds = self._get_builds()
+        self._builds_are_fresh = True
         self._is_setup = True
         return self._builds
 
@@ -193,17 +230,7 @@ class RemoteBuildService(base.AppService):
             raise RuntimeError(
                 "RemoteBuildService must be set up using start_builds or resume_builds before fetching logs."
             )
-        logs: dict[str, pathlib.Path | None] = {}
-        log_downloads: dict[str, pathlib.Path] = {}
-        fetch_time = datetime.datetime.now().isoformat(timespec="seconds")
-        for build in self._builds:
-            url = build.build_log_url
-            if not url:
-                logs[build.arch_tag] = None
-                continue
-            filename = f"{self._name}_{build.arch_tag}_{fetch_time}.txt"
-            logs[build.arch_tag] = output_dir / filename
-            log_downloads[url] = output_dir / filename
+        logs, log_downloads = self._get_log_downloads(self._builds, output_dir)
         self.request.download_files_with_progress(log_downloads)
         return logs
 
@@ -213,33 +240,99 @@ class RemoteBuildService(base.AppService):
             raise RuntimeError(
                 "RemoteBuildService must be set up using start_builds or resume_builds before fetching artifacts."
             )
-        artifact_downloads: dict[str, pathlib.Path] = {}
-        for url in self._get_artifact_urls():
-            # Decode URL-encoded characters (e.g., %40 -> @) in the filename
-            filename = urllib.parse.unquote(
-                pathlib.PurePosixPath(urllib.parse.urlparse(url).path).name
-            )
-            artifact_downloads[url] = output_dir / filename
+        artifact_downloads = self._get_artifact_downloads(
+            self._get_artifact_urls(), output_dir
+        )
         return self.request.download_files_with_progress(artifact_downloads).values()
 
+    def fetch_build_outputs(
+        self, arch: str, output_dir: pathlib.Path
+    ) -> concurrent.futures.Future[BuildOutputs]:
+        """Start fetching the log and artifacts of a single build in the background.
+
+        Launchpad is queried for the file locations in the calling thread. The
+        downloads themselves run in a background thread, with at most
+        ``max_downloads`` builds downloading at the same time.
+
+        :param arch: The architecture tag of the build to fetch.
+        :param output_dir: The directory into which to place the log and artifacts.
+        :returns: A future that resolves to the downloaded build outputs.
+        """
+        if not self._is_setup:
+            raise RuntimeError(
+                "RemoteBuildService must be set up using start_builds or resume_builds before fetching build outputs."
+            )
+        builds = [build for build in self._builds if build.arch_tag == arch]
+        if not builds:
+            raise ValueError(f"No build found for architecture {arch!r}")
+        logs, log_downloads = self._get_log_downloads(builds, output_dir)
+        artifact_downloads = self._get_artifact_downloads(
+            itertools.chain.from_iterable(
+                build.get_artifact_urls() for build in builds
+            ),
+            output_dir,
+        )
+
+        if self._download_executor is None:
+            self._download_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_downloads,
+                thread_name_prefix="remote-build-download",
+            )
+
+        def _download() -> BuildOutputs:
+            craft_cli.emit.debug(f"Downloading outputs of the {arch} build.")
+            self.request.download_files(log_downloads)
+            artifacts = self.request.download_files(artifact_downloads)
+            craft_cli.emit.debug(f"Finished downloading outputs of the {arch} build.")
+            return BuildOutputs(
+                arch=arch, log=logs[arch], artifacts=list(artifacts.values())
+            )
+
+        return self._download_executor.submit(_download)
+
+    def stop_fetching(self) -> None:
+        """Cancel any build output downloads that have not yet started.
+
+        Downloads already in progress are left to finish.
+        """
+        if self._download_executor is not None:
+            self._download_executor.shutdown(wait=False, cancel_futures=True)
+            self._download_executor = None
+
     def cancel_builds(self) -> None:
-        """Cancel all running builds for a recipe."""
+        """Cancel all running builds for a recipe.
+
+        Builds are cancelled concurrently, with at most ``max_requests`` requests
+        to Launchpad at a time.
+
+        :raises CancelFailedError: if any of the builds could not be cancelled.
+        """
         if not self._is_setup:
             raise RuntimeError(
                 "RemoteBuildService must be set up using start_builds or resume_builds before cancelling builds."
             )
+        if not self._builds:
+            return
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(self.max_requests, len(self._builds)),
+            thread_name_prefix="remote-build-cancel",
+        ) as executor:
+            cancels = [executor.submit(build.cancel) for build in self._builds]
         cancel_failed: list[str] = []
-        for build in self._builds:
-            try:
-                build.cancel()
-            # We have to try-except in a loop here.
-            except launchpad.errors.BuildError as exc:  # noqa: PERF203
+        for cancel in cancels:
+            exc = cancel.exception()
+            if isinstance(exc, launchpad.errors.BuildError):
                 cancel_failed.append(exc.args[0])
+            elif exc is not None:
+                raise exc
         if cancel_failed:
             raise errors.CancelFailedError(cancel_failed)
 
     def cleanup(self) -> None:
-        """Clean up the recipe and repository."""
+        """Clean up the recipe and repository.
+
+        The recipe is deleted before the repository it builds from.
+        """
         if self._recipe is not None:
             self._recipe.delete()
         if self._repository is not None:
@@ -407,7 +500,10 @@ class RemoteBuildService(base.AppService):
         return self._recipe.get_builds()
 
     def _get_build_states(self) -> Mapping[str, launchpad.models.BuildState]:
-        self._refresh_builds()
+        # Builds that were just started or resumed don't need refreshing.
+        if not self._builds_are_fresh:
+            self._refresh_builds()
+        self._builds_are_fresh = False
         return {build.arch_tag: build.get_state() for build in self._builds}
 
     def _refresh_builds(self) -> None:
@@ -415,6 +511,37 @@ class RemoteBuildService(base.AppService):
         for build in self._builds:
             build.lp_refresh()
 
+    def _get_log_downloads(
+        self, builds: Iterable[launchpad.models.Build], output_dir: pathlib.Path
+    ) -> tuple[dict[str, pathlib.Path | None], dict[str, pathlib.Path]]:
+        """Get the log destination per architecture and the log downloads."""
+        logs: dict[str, pathlib.Path | None] = {}
+        log_downloads: dict[str, pathlib.Path] = {}
+        fetch_time = datetime.datetime.now().isoformat(timespec="seconds")
+        for build in builds:
+            url = build.build_log_url
+            if not url:
+                logs[build.arch_tag] = None
+                continue
+            filename = f"{self._name}_{build.arch_tag}_{fetch_time}.txt"
+            logs[build.arch_tag] = output_dir / filename
+            log_downloads[url] = output_dir / filename
+        return logs, log_downloads
+
+    @staticmethod
+    def _get_artifact_downloads(
+        urls: Iterable[str], output_dir: pathlib.Path
+    ) -> dict[str, pathlib.Path]:
+        """Map each artifact URL to its destination file."""
+        artifact_downloads: dict[str, pathlib.Path] = {}
+        for url in urls:
+            # Decode URL-encoded characters (e.g., %40 -> @) in the filename
+            filename = urllib.parse.unquote(
+                pathlib.PurePosixPath(urllib.parse.urlparse(url).path).name
+            )
+            artifact_downloads[url] = output_dir / filename
+        return artifact_downloads
+
     def _get_artifact_urls(self) -> Collection[str]:
         """Get the locations of all build artifacts."""
         return list(
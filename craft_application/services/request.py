@@ -76,6 +76,25 @@ class RequestService(base.AppService):
         """Download a single file with a progress bar."""
         return self.download_files_with_progress({url: dest})[url]
 
+    def download_files(
+        self, files: Mapping[str, pathlib.Path]
+    ) -> Mapping[str, pathlib.Path]:
+        """Download a set of files from various URLs without displaying progress.
+
+        Unlike :meth:`download_files_with_progress`, this does not interact with
+        the terminal, so it may be used from background threads.
+
+        :param files: A mapping of urls to their destination files or directories
+        :returns: The files mapping, updated with the actual file paths.
+        """
+        files = dict(files)
+        for url, path in files.items():
+            if path.is_dir():
+                path = files[url] = path / util.get_filename_from_url_path(url)  # noqa: PLW2901
+            for _ in self.download_chunks(url, path):
+                pass
+        return files
+
     def download_files_with_progress(
         self, files: Mapping[str, pathlib.Path]
     ) -> Mapping[str, pathlib.Path]:
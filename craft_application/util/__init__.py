@@ -17,6 +17,12 @@
 
 from craft_application.util.callbacks import get_unique_callbacks
 from craft_application.util.docs import render_doc_url
+from craft_application.util.instance import (
+    DeferredMessages,
+    InstanceLogStream,
+    InstancePreparation,
+    Messages,
+)
 from craft_application.util.logging import setup_loggers
 from craft_application.util.paths import (
     get_filename_from_url_path,
@@ -44,10 +50,15 @@ from craft_application.util.system import get_parallel_build_count
 from craft_application.util.yaml import dump_yaml, safe_yaml_load
 from craft_application.util.pro_services import ProServices
 from craft_application.util.cli import format_timestamp
+from craft_application.util.timing import Timings, TimingSpan
 
 __all__ = [
     "get_unique_callbacks",
     "render_doc_url",
+    "DeferredMessages",
+    "InstancePreparation",
+    "InstanceLogStream",
+    "Messages",
     "setup_loggers",
     "get_filename_from_url_path",
     "get_managed_logpath",
@@ -71,4 +82,6 @@ __all__ = [
     "get_hostname",
     "is_managed_mode",
     "format_timestamp",
+    "Timings",
+    "TimingSpan",
 ]
@@ -0,0 +1,373 @@
+#  This file is part of craft-application.
+#
+#  Copyright 2026 Canonical Ltd.
+#
+#  This program is free software: you can redistribute it and/or modify it
+#  under the terms of the GNU Lesser General Public License version 3, as
+#  published by the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+#  SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Utilities for preparing provider instances."""
+
+from __future__ import annotations
+
+import io
+import pathlib
+import shlex
+import subprocess
+import tarfile
+import threading
+import time
+from typing import TYPE_CHECKING, Protocol, cast
+
+from craft_cli import emit
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Sequence
+    from types import TracebackType
+
+    import craft_providers
+    from typing_extensions import Self
+
+_ARCHIVE_PATH = pathlib.PurePosixPath("/tmp/craft-instance-preparation.tar")  # noqa: S108
+_LOG_CHUNK_SIZE = 64 * 1024
+_NO_TAR = "craft-instance-preparation: tar not found"
+"""The error written when an instance has no ``tar`` to extract files with."""
+
+
+class Messages(Protocol):
+    """Somewhere to send messages about preparing an instance.
+
+    The emitter is one, and :class:`DeferredMessages` is another.
+    """
+
+    def progress(self, text: str) -> None:
+        """Show a progress message."""
+
+    def debug(self, text: str) -> None:
+        """Log a debug message."""
+
+
+class DeferredMessages:
+    """Messages kept by a background thread to be shown later.
+
+    The emitter can't be used while it's paused, as it is while a build runs in an
+    instance, so work done in the background keeps its messages here. The thread
+    that waits for the work shows them with :meth:`replay`.
+    """
+
+    def __init__(self) -> None:
+        self._messages: list[tuple[bool, str]] = []
+
+    def progress(self, text: str) -> None:
+        """Keep a progress message."""
+        self._messages.append((True, text))
+
+    def debug(self, text: str) -> None:
+        """Keep a debug message."""
+        self._messages.append((False, text))
+
+    def replay(self) -> None:
+        """Send the kept messages to the emitter, in order."""
+        for is_progress, text in self._messages:
+            if is_progress:
+                emit.progress(text)
+            else:
+                emit.debug(text)
+        self._messages.clear()
+
+
+class InstancePreparation:
+    """Files and commands to send to an instance together.
+
+    Files are added to a single archive that is pushed to the instance and
+    extracted at the root of its filesystem with ``tar``, creating parent
+    directories as needed. The commands then run in order in a single shell,
+    stopping at the first that fails. If the instance has no ``tar``, the files
+    are pushed one at a time instead.
+
+    Everything that adds to the preparation should send its messages to
+    :attr:`messages`, as it may be prepared in a background thread.
+
+    :param messages: Where to send messages. Defaults to the emitter.
+    """
+
+    def __init__(self, messages: Messages | None = None) -> None:
+        self.messages: Messages = emit if messages is None else messages
+        self._files: list[tuple[pathlib.PurePosixPath, bytes, int]] = []
+        self._commands: list[str] = []
+        self._progress: list[str] = []
+
+    def __bool__(self) -> bool:
+        return bool(self._files or self._commands)
+
+    def add_file(
+        self, destination: pathlib.PurePath, content: bytes, *, mode: int = 0o644
+    ) -> None:
+        """Add a file to write in the instance.
+
+        :param destination: The absolute path of the file in the instance.
+        :param content: The contents of the file.
+        :param mode: The permissions of the file.
+        """
+        self._files.append((pathlib.PurePosixPath(destination), content, mode))
+
+    def add_command(
+        self, command: Sequence[str], *, progress: str | None = None
+    ) -> None:
+        """Add a command to run in the instance once its files are written.
+
+        :param command: The command and its arguments.
+        :param progress: A progress message to show when the commands start
+            running, for commands that take a while.
+        """
+        self._commands.append(shlex.join(command))
+        if progress is not None:
+            self._progress.append(progress)
+
+    def apply(self, instance: craft_providers.Executor) -> None:
+        """Write the files and run the commands in an instance.
+
+        Nothing is sent to the instance if the preparation is empty. A single file
+        with no commands is pushed without an archive, once its parent directory
+        is created.
+
+        :param instance: The instance to prepare.
+        :raises CalledProcessError: if extracting the files or a command fails.
+        """
+        if not self:
+            return
+
+        if len(self._files) == 1 and not self._commands:
+            self._make_parents(instance)
+            self._push_files(instance)
+        elif self._files:
+            self._push_archive(instance)
+            no_tar = f"echo {shlex.quote(_NO_TAR)} >&2; exit 1"
+            extract = [
+                f"command -v tar >/dev/null || {{ {no_tar}; }}",
+                shlex.join(["tar", "-xf", str(_ARCHIVE_PATH), "-C", "/"]),
+                shlex.join(["rm", "-f", str(_ARCHIVE_PATH)]),
+            ]
+            try:
+                self._run_commands(instance, extract)
+            except subprocess.CalledProcessError as exc:
+                if exc.stderr != f"{_NO_TAR}\n":
+                    raise
+                self.messages.debug(
+                    "The instance has no tar, pushing the files one at a time"
+                )
+                self._make_parents(
+                    instance, [shlex.join(["rm", "-f", str(_ARCHIVE_PATH)])]
+                )
+                self._push_files(instance)
+                if self._commands:
+                    self._run_commands(instance)
+        else:
+            self._run_commands(instance)
+
+        self._files.clear()
+        self._commands.clear()
+        self._progress.clear()
+
+    def _make_parents(
+        self, instance: craft_providers.Executor, setup: Sequence[str] = ()
+    ) -> None:
+        """Create the parent directories of the files, after some lines of setup."""
+        parents = sorted({str(path.parent) for path, _, _ in self._files})
+        _run_script(instance, [*setup, shlex.join(["mkdir", "-p", *parents])])
+
+    def _push_files(self, instance: craft_providers.Executor) -> None:
+        """Push each file to the instance on its own."""
+        for destination, content, mode in self._files:
+            start = time.perf_counter()
+            instance.push_file_io(
+                destination=pathlib.Path(destination),
+                content=io.BytesIO(content),
+                file_mode=f"{mode:o}",
+            )
+            self.messages.debug(f"Pushed {str(destination)!r} in {_since(start)}")
+
+    def _push_archive(self, instance: craft_providers.Executor) -> None:
+        """Push an archive of all the files to the instance."""
+        start = time.perf_counter()
+        archive = self._get_archive()
+        self.messages.debug(
+            f"Archived {len(self._files)} files for the instance "
+            f"({archive.getbuffer().nbytes} bytes) in {_since(start)}"
+        )
+        start = time.perf_counter()
+        instance.push_file_io(
+            destination=pathlib.Path(_ARCHIVE_PATH),
+            content=archive,
+            file_mode="600",
+        )
+        self.messages.debug(f"Pushed the archive to the instance in {_since(start)}")
+
+    def _run_commands(
+        self, instance: craft_providers.Executor, setup: Sequence[str] = ()
+    ) -> None:
+        """Run the commands in a single shell, after some lines of setup."""
+        for progress in self._progress:
+            self.messages.progress(progress)
+        start = time.perf_counter()
+        _run_script(instance, [*setup, *self._commands])
+        self.messages.debug(
+            f"Ran {len(self._commands)} commands in the instance in {_since(start)}"
+        )
+
+    def _get_archive(self) -> io.BytesIO:
+        """Get a tar archive of the files, relative to the root directory."""
+        archive = io.BytesIO()
+        mtime = time.time()
+        with tarfile.open(fileobj=archive, mode="w") as tar:
+            for destination, content, mode in self._files:
+                info = tarfile.TarInfo(str(destination.relative_to("/")))
+                info.size = len(content)
+                info.mode = mode
+                info.mtime = mtime
+                tar.addfile(info, io.BytesIO(content))
+        archive.seek(0)
+        return archive
+
+
+class InstanceLogStream:
+    """Copy a log file from an instance to a host file while it's being written.
+
+    ``tail`` follows the log in the instance and its output is appended to the
+    destination as it arrives, reading at most 64 KiB at a time. Once the
+    stream is closed, anything ``tail`` hadn't sent yet is fetched with one last
+    ``tail`` call, so the destination ends up with the whole log.
+
+    Streaming never raises. If it fails, :attr:`complete` is False and the log
+    should be fetched some other way.
+
+    :param instance: The instance that writes the log.
+    :param source: The path to the log file in the instance.
+    :param destination: The host file to append the log to.
+    :param prefix: A prefix for each line written to the destination.
+    """
+
+    def __init__(
+        self,
+        instance: craft_providers.Executor,
+        source: pathlib.PurePosixPath,
+        destination: pathlib.Path,
+        *,
+        prefix: str = ":: ",
+    ) -> None:
+        self._instance = instance
+        self._source = source
+        self._destination = destination
+        self._prefix = prefix
+        self._offset = 0
+        self._pending = b""
+        self._failed = False
+        self._process: subprocess.Popen[bytes] | None = None
+        self._stdout: io.BufferedReader | None = None
+        self._thread: threading.Thread | None = None
+        self.complete = False
+        """Whether the whole log was copied to the destination."""
+
+    def __enter__(self) -> Self:
+        try:
+            self._process = self._tail(follow=True)
+        except Exception:  # noqa: BLE001
+            self._failed = True
+            return self
+        # Pipes opened with the default buffering are buffered readers.
+        self._stdout = cast("io.BufferedReader | None", self._process.stdout)
+        self._thread = threading.Thread(
+            target=self._stream, name="instance-log-stream", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self._process is None or self._thread is None:
+            return
+        self._process.terminate()
+        self._thread.join()
+        self._process.wait()
+        if self._failed:
+            return
+        try:
+            remainder = self._tail(follow=False)
+            stdout, _ = remainder.communicate()
+        except Exception:  # noqa: BLE001
+            return
+        if remainder.returncode != 0 and not self._offset:
+            # The log doesn't exist or couldn't be read.
+            return
+        self._write(stdout, final=True)
+        self.complete = not self._failed
+
+    def _tail(self, *, follow: bool) -> subprocess.Popen[bytes]:
+        """Start ``tail`` in the instance from the first byte not yet copied."""
+        command = ["tail", "-c", f"+{self._offset + 1}"]
+        if follow:
+            command.append("-F")
+        return cast(
+            "subprocess.Popen[bytes]",
+            self._instance.execute_popen(
+                [*command, self._source.as_posix()],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            ),
+        )
+
+    def _stream(self) -> None:
+        """Copy the output of the following ``tail`` until it stops."""
+        if self._stdout is None:
+            self._failed = True
+            return
+        try:
+            while chunk := self._stdout.read1(_LOG_CHUNK_SIZE):
+                self._write(chunk)
+        except Exception:  # noqa: BLE001
+            self._failed = True
+
+    def _write(self, chunk: bytes, *, final: bool = False) -> None:
+        """Append the complete lines in a chunk to the destination.
+
+        A partial line is kept until the rest of it arrives, unless it exceeds
+        the chunk size or this is the final chunk.
+        """
+        self._offset += len(chunk)
+        *lines, self._pending = (self._pending + chunk).split(b"\n")
+        if self._pending and (final or len(self._pending) > _LOG_CHUNK_SIZE):
+            lines.append(self._pending)
+            self._pending = b""
+        if not lines:
+            return
+        with self._destination.open("a", encoding="utf8") as log:
+            log.writelines(
+                f"{self._prefix}{line.decode(errors='replace')}\n" for line in lines
+            )
+
+
+def _run_script(instance: craft_providers.Executor, script: Sequence[str]) -> None:
+    """Run lines of shell script in an instance, stopping at the first that fails."""
+    instance.execute_run(
+        ["/bin/sh", "-ec", "\n".join(script)],
+        check=True,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+
+
+def _since(start: float) -> str:
+    """Format the time elapsed since a ``perf_counter()`` value."""
+    return f"{time.perf_counter() - start:.3f}s"
@@ -0,0 +1,140 @@
+#  This file is part of craft-application.
+#
+#  Copyright 2026 Canonical Ltd.
+#
+#  This program is free software: you can redistribute it and/or modify it
+#  under the terms of the GNU Lesser General Public License version 3, as
+#  published by the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+#  SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Utilities for timing operations."""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import json
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pathlib
+    from collections.abc import Iterator, Mapping
+
+
+@dataclasses.dataclass(frozen=True)
+class TimingSpan:
+    """A timed operation.
+
+    :param name: A description of the operation.
+    :param category: The kind of operation, used to group spans.
+    :param start: When the operation started, in seconds since timing began.
+    :param duration: How long the operation took, in seconds.
+    :param thread: The name of the thread that ran the operation.
+    :param args: Additional details about the operation.
+    """
+
+    name: str
+    category: str
+    start: float
+    duration: float
+    thread: str
+    args: Mapping[str, str] = dataclasses.field(default_factory=dict)
+
+
+class Timings:
+    """A record of timed operations that can be shared between threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._spans: list[TimingSpan] = []
+
+    @property
+    def spans(self) -> list[TimingSpan]:
+        """The recorded spans, in the order they ended."""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        """Forget all recorded spans and restart the clock."""
+        with self._lock:
+            self._origin = time.perf_counter()
+            self._spans.clear()
+
+    @contextlib.contextmanager
+    def span(self, name: str, *, category: str, **args: str) -> Iterator[None]:
+        """Time the operation run in this context.
+
+        The span is recorded even if the operation raises an error.
+
+        :param name: A description of the operation.
+        :param category: The kind of operation.
+        :param args: Additional details about the operation.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self._spans.append(
+                    TimingSpan(
+                        name=name,
+                        category=category,
+                        start=start - self._origin,
+                        duration=end - start,
+                        thread=threading.current_thread().name,
+                        args=args,
+                    )
+                )
+
+    def get_chrome_trace(self) -> dict[str, Any]:
+        """Get the spans in the Chrome trace event format.
+
+        The trace can be loaded in Perfetto or ``chrome://tracing``.
+        """
+        pid = os.getpid()
+        thread_ids: dict[str, int] = {}
+        events: list[dict[str, Any]] = []
+        for span in self.spans:
+            if span.thread not in thread_ids:
+                thread_ids[span.thread] = len(thread_ids)
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": pid,
+                        "tid": thread_ids[span.thread],
+                        "args": {"name": span.thread},
+                    }
+                )
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": round(span.start * 1_000_000),
+                    "dur": round(span.duration * 1_000_000),
+                    "pid": pid,
+                    "tid": thread_ids[span.thread],
+                    "args": dict(span.args),
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: pathlib.Path) -> None:
+        """Write the spans to a file in the Chrome trace event format.
+
+        :param path: The file to write.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.get_chrome_trace()))
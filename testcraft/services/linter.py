@@ -41,6 +41,7 @@ class MissingVersionLinter(AbstractLinter):
 
     name = "testcraft.missing_version"
     stage = Stage.PRE
+    parallel_safe = True
 
     def run(self, ctx: LintContext) -> Iterable[LinterIssue]:
         """Check for the presence of the 'version' field in the project file."""
@@ -62,6 +63,7 @@ class EmptyArtifactLinter(AbstractLinter):
 
     name = "testcraft.empty_artifact"
     stage = Stage.POST
+    parallel_safe = True
 
     def run(self, ctx: LintContext) -> Iterable[LinterIssue]:
         """Check for the presence of non-metadata files in the artifact directory."""
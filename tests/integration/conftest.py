@@ -18,8 +18,10 @@
 import atexit
 import os
 import pathlib
+import shutil
 import sys
 import tempfile
+import urllib.parse
 from unittest import mock
 
 import craft_platforms
@@ -28,6 +30,8 @@ from craft_application import launchpad
 from craft_application.services import provider, remotebuild
 from craft_providers import lxd, multipass
 
+from tests.integration.fake_launchpad import FakeLaunchpadConfig, FakeLaunchpadServer
+
 
 def pytest_configure(config: pytest.Config):
     config.addinivalue_line("markers", "multipass: tests that require multipass")
@@ -64,6 +68,63 @@ def anonymous_remote_build_service(default_app_metadata):
     return service
 
 
+@pytest.fixture
+def record_measurement(request):
+    """Record a benchmark measurement as a user property of the test.
+
+    Unlike pytest's ``record_property``, this doesn't warn with the ``xunit2``
+    JUnit family.
+    """
+
+    def _record(name: str, value: float) -> None:
+        request.node.user_properties.append((name, value))
+
+    return _record
+
+
+@pytest.fixture
+def fake_launchpad_config() -> FakeLaunchpadConfig:
+    """Configuration for the fake Launchpad server. Override to simulate builds."""
+    return FakeLaunchpadConfig()
+
+
+@pytest.fixture
+def fake_launchpad_server(tmp_path_factory, fake_launchpad_config):
+    """A local stand-in for the Launchpad web service."""
+    server = FakeLaunchpadServer(
+        tmp_path_factory.mktemp("fake-launchpad"), fake_launchpad_config
+    )
+    server.start()
+    yield server
+    server.stop()
+    # launchpadlib caches per service root host, which includes the random port.
+    host = urllib.parse.urlparse(server.root_url).netloc
+    shutil.rmtree(launchpad.launchpad.DEFAULT_CACHE_PATH / host, ignore_errors=True)
+
+
+@pytest.fixture
+def offline_remote_build_service(
+    monkeypatch, tmp_path, emitter, app_metadata, fake_services, fake_launchpad_server
+):
+    """A snap remote build service that talks to the fake Launchpad server."""
+
+    class OfflineRemoteBuildService(remotebuild.RemoteBuildService):
+        RecipeClass = launchpad.models.SnapRecipe
+
+        @property
+        def credentials_filepath(self) -> pathlib.Path:
+            return tmp_path / "launchpad-credentials"
+
+    fake_launchpad_server.write_credentials(tmp_path / "launchpad-credentials")
+    monkeypatch.setenv("TESTCRAFT_LAUNCHPAD_INSTANCE", fake_launchpad_server.root_url)
+    monkeypatch.setattr("xdg.BaseDirectory.xdg_cache_home", str(tmp_path / "cache"))
+    # Looking up a recipe that doesn't exist yet is retried with backoff.
+    monkeypatch.setattr(
+        sys.modules["craft_application.util.retry"], "_ATTEMPT_SLEEPS", [0] * 5
+    )
+    return OfflineRemoteBuildService(app_metadata, fake_services)
+
+
 @pytest.fixture
 def snap_safe_tmp_path():
     """A temporary path accessible to snap-confined craft providers.
@@ -0,0 +1,1032 @@
+#  This file is part of craft-application.
+#
+#  Copyright 2026 Canonical Ltd.
+#
+#  This program is free software: you can redistribute it and/or modify it
+#  under the terms of the GNU Lesser General Public License version 3, as
+#  published by the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+#  SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""A local stand-in for the Launchpad web service.
+
+The server implements just enough of the Launchpad API for launchpadlib and
+``RemoteBuildService`` to run a full remote build offline:
+
+- A WADL description and JSON representations for people, projects, git
+  repositories, snap recipes, build requests and snap builds.
+- A git smart-HTTP endpoint (backed by ``git http-backend``) for pushing the
+  project to a repository.
+- Simulated builds with configurable durations, artifact sizes and failures, and
+  downloadable logs and artifacts.
+
+Every request is recorded so tests and benchmarks can count round trips.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime as dt
+import http
+import http.server
+import itertools
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+import urllib.parse
+from typing import TYPE_CHECKING, Any, TypeVar
+from xml.sax.saxutils import quoteattr
+
+from launchpadlib.credentials import AccessToken, Credentials
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pathlib
+    from collections.abc import Mapping
+
+WADL_MEDIA_TYPE = "application/vnd.sun.wadl+xml"
+API_VERSION = "devel"
+CHUNK_SIZE = 64 * 1024
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+@dataclasses.dataclass
+class FakeLaunchpadConfig:
+    """Knobs for how the fake Launchpad simulates builds."""
+
+    username: str = "craft-test-user"
+    """The name of the logged-in user."""
+    default_architectures: tuple[str, ...] = ("amd64",)
+    """Architectures to build when a recipe doesn't list any processors."""
+    pending_seconds: float = 0.0
+    """How long each build stays pending before it starts building."""
+    build_seconds: float = 0.0
+    """How long each build runs, unless overridden in ``build_seconds_by_arch``."""
+    build_seconds_by_arch: dict[str, float] = dataclasses.field(default_factory=dict)
+    """Per-architecture build durations."""
+    failed_architectures: frozenset[str] = frozenset()
+    """Architectures whose builds fail."""
+    artifact_size: int = 1024
+    """The size in bytes of each artifact."""
+    artifacts_per_build: int = 1
+    """The number of artifacts each successful build produces."""
+    log_size: int = 1024
+    """The size in bytes of each build log."""
+
+
+@dataclasses.dataclass
+class _Project:
+    name: str
+    title: str
+    display_name: str
+    summary: str
+    description: str | None = None
+    information_type: str = "Public"
+
+
+@dataclasses.dataclass
+class _GitRepository:
+    path: str
+    name: str
+    owner: str
+    target: str | None
+    information_type: str
+
+
+@dataclasses.dataclass
+class _SnapBuild:
+    id: int
+    arch: str
+    snap_path: str
+    created: float
+    duration: float
+    failed: bool
+    cancelled: bool = False
+
+
+@dataclasses.dataclass
+class _BuildRequest:
+    id: int
+    snap_path: str
+    builds: list[_SnapBuild]
+
+
+@dataclasses.dataclass
+class _Snap:
+    path: str
+    name: str
+    owner: str
+    project: str | None
+    git_ref: str | None
+    build_path: str | None
+    processors: list[str]
+    information_type: str
+    store_name: str | None = None
+    builds: list[_SnapBuild] = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass(frozen=True)
+class _Operation:
+    name: str
+    method: str
+    params: tuple[str, ...] = ()
+    returns: str | None = None
+    """An entry type returned by the operation, if any."""
+    creates: str | None = None
+    """An entry type created (and returned with 201 Created) by the operation."""
+
+
+@dataclasses.dataclass(frozen=True)
+class _ResourceType:
+    fields: tuple[str, ...] = ()
+    links: dict[str, str] = dataclasses.field(default_factory=dict)
+    collections: dict[str, str] = dataclasses.field(default_factory=dict)
+    operations: tuple[_Operation, ...] = ()
+
+
+_ENTRY_TYPES = {
+    "person": _ResourceType(fields=("name", "display_name")),
+    "project": _ResourceType(
+        fields=(
+            "name",
+            "title",
+            "display_name",
+            "summary",
+            "description",
+            "information_type",
+        )
+    ),
+    "git_repository": _ResourceType(
+        fields=(
+            "name",
+            "display_name",
+            "description",
+            "default_branch",
+            "git_https_url",
+            "git_ssh_url",
+            "information_type",
+            "private",
+        ),
+        links={"owner": "person", "target": "project"},
+        operations=(
+            _Operation(
+                "issueAccessToken",
+                "POST",
+                params=("description", "scopes", "date_expires"),
+            ),
+        ),
+    ),
+    "snap": _ResourceType(
+        fields=(
+            "name",
+            "description",
+            "build_path",
+            "information_type",
+            "private",
+            "store_name",
+            "store_upload",
+            "auto_build",
+            "git_path",
+        ),
+        links={"owner": "person", "project": "project"},
+        collections={"builds": "snap_build"},
+        operations=(
+            _Operation(
+                "requestBuilds",
+                "POST",
+                params=("archive", "pocket", "channels", "architectures"),
+                creates="snap_build_request",
+            ),
+        ),
+    ),
+    "snap_build_request": _ResourceType(
+        fields=("status", "error_message"),
+        links={"snap": "snap"},
+        collections={"builds": "snap_build"},
+    ),
+    "snap_build": _ResourceType(
+        fields=(
+            "title",
+            "arch_tag",
+            "buildstate",
+            "build_log_url",
+            "datebuilt",
+            "can_be_cancelled",
+            "can_be_retried",
+        ),
+        links={"snap": "snap"},
+        operations=(
+            _Operation("getFileUrls", "GET"),
+            _Operation("cancel", "POST"),
+            _Operation("retry", "POST"),
+        ),
+    ),
+}
+
+_COLLECTION_TYPES = {
+    "projects": (
+        "project",
+        (
+            _Operation(
+                "new_project",
+                "POST",
+                params=(
+                    "name",
+                    "display_name",
+                    "title",
+                    "summary",
+                    "description",
+                    "information_type",
+                ),
+                creates="project",
+            ),
+        ),
+    ),
+    "git_repositories": (
+        "git_repository",
+        (
+            _Operation(
+                "new",
+                "POST",
+                params=("name", "owner", "target", "information_type"),
+                creates="git_repository",
+            ),
+            _Operation("getByPath", "GET", params=("path",), returns="git_repository"),
+        ),
+    ),
+    "snaps": (
+        "snap",
+        (
+            _Operation(
+                "new",
+                "POST",
+                params=(
+                    "name",
+                    "owner",
+                    "project",
+                    "information_type",
+                    "git_ref",
+                    "branch",
+                    "build_path",
+                    "description",
+                    "processors",
+                    "store_upload",
+                    "store_name",
+                    "store_channels",
+                    "auto_build",
+                    "auto_build_archive",
+                    "auto_build_pocket",
+                ),
+                creates="snap",
+            ),
+            _Operation("getByName", "GET", params=("owner", "name"), returns="snap"),
+        ),
+    ),
+}
+
+_ROOT_LINKS = {"me": "person"}
+_ROOT_COLLECTIONS = {
+    "projects": "projects",
+    "git_repositories": "git_repositories",
+    "snaps": "snaps",
+}
+
+
+def _param(
+    name: str, *, style: str = "plain", link: str | None = None, **attrs: str
+) -> str:
+    attributes = "".join(f" {key}={quoteattr(value)}" for key, value in attrs.items())
+    if style == "plain":
+        attributes += f" path={quoteattr(f'$[{name!r}]')}"
+    if link is None:
+        return (
+            f"<wadl:param style={quoteattr(style)} name={quoteattr(name)}{attributes}/>"
+        )
+    link_tag = (
+        f"<wadl:link resource_type={quoteattr(link)}/>" if link else "<wadl:link/>"
+    )
+    return (
+        f"<wadl:param style={quoteattr(style)} name={quoteattr(name)}{attributes}>"
+        f"{link_tag}</wadl:param>"
+    )
+
+
+def _operation(base: str, owner: str, operation: _Operation) -> str:
+    params = [
+        _param("ws.op", style="query", required="true", fixed=operation.name),
+        *(_param(name, style="query", required="false") for name in operation.params),
+    ]
+    if operation.method == "GET":
+        request = "".join(params)
+    else:
+        request = (
+            '<wadl:representation mediaType="application/x-www-form-urlencoded">'
+            f"{''.join(params)}</wadl:representation>"
+        )
+    if operation.creates:
+        response = _param(
+            "Location", style="header", link=f"{base}#{operation.creates}"
+        )
+    elif operation.returns:
+        response = f'<wadl:representation href="{base}#{operation.returns}-full"/>'
+    else:
+        response = ""
+    return (
+        f'<wadl:method id="{owner}-{operation.name}" name="{operation.method}">'
+        f"<wadl:request>{request}</wadl:request>"
+        f"<wadl:response>{response}</wadl:response></wadl:method>"
+    )
+
+
+def _get_method(type_id: str, representation: str) -> str:
+    return (
+        f'<wadl:method name="GET" id="{type_id}-get"><wadl:response>'
+        f'<wadl:representation href="{representation}"/>'
+        f'<wadl:representation mediaType="{WADL_MEDIA_TYPE}" id="{type_id}-wadl"/>'
+        "</wadl:response></wadl:method>"
+    )
+
+
+def _page(base: str, entry_type: str) -> str:
+    """The resource type and representation of a page of a collection."""
+    page_resource = f"{base}#{entry_type}-page-resource"
+    params = [
+        _param("resource_type_link", link=""),
+        _param("total_size", required="true"),
+        _param("start", required="true"),
+        _param("next_collection_link", link=page_resource),
+        _param("prev_collection_link", link=page_resource),
+        _param("entries", required="true"),
+    ]
+    params.append(
+        '<wadl:param style="plain" name="entry_links" '
+        "path=\"$['entries'][*]['self_link']\">"
+        f'<wadl:link resource_type="{base}#{entry_type}"/></wadl:param>'
+    )
+    return (
+        f'<wadl:resource_type id="{entry_type}-page-resource">'
+        f"{_get_method(f'{entry_type}-page-resource', f'{base}#{entry_type}-page')}"
+        "</wadl:resource_type>"
+        f'<wadl:representation mediaType="application/json" id="{entry_type}-page">'
+        f"{''.join(params)}</wadl:representation>"
+    )
+
+
+def _link_params(
+    base: str, links: dict[str, str], collections: dict[str, str]
+) -> list[str]:
+    params = [
+        _param(f"{name}_link", link=f"{base}#{type_id}")
+        for name, type_id in links.items()
+    ]
+    params.extend(
+        _param(f"{name}_collection_link", link=f"{base}#{type_id}-page-resource")
+        for name, type_id in collections.items()
+    )
+    return params
+
+
+def build_wadl(base: str) -> str:
+    """Build the WADL description of the fake web service rooted at ``base``."""
+    parts = [
+        '<?xml version="1.0"?>',
+        (
+            '<wadl:application xmlns="http://research.sun.com/wadl/2006/10" '
+            'xmlns:wadl="http://research.sun.com/wadl/2006/10">'
+        ),
+        f'<wadl:resources base="{base}">',
+        '<wadl:resource path="" type="#service-root"/>',
+        "</wadl:resources>",
+        '<wadl:resource_type id="service-root">',
+        _get_method("service-root", "#service-root-json"),
+        "</wadl:resource_type>",
+        '<wadl:representation mediaType="application/json" id="service-root-json">',
+        *_link_params(base, _ROOT_LINKS, {}),
+        *(
+            _param(f"{name}_collection_link", link=f"{base}#{type_id}")
+            for name, type_id in _ROOT_COLLECTIONS.items()
+        ),
+        "</wadl:representation>",
+    ]
+    for type_id, entry_type in _ENTRY_TYPES.items():
+        parts.append(f'<wadl:resource_type id="{type_id}">')
+        parts.append(_get_method(type_id, f"{base}#{type_id}-full"))
+        parts.extend(_operation(base, type_id, op) for op in entry_type.operations)
+        parts.append("</wadl:resource_type>")
+        parts.append(
+            f'<wadl:representation mediaType="application/json" id="{type_id}-full">'
+        )
+        parts.append(_param("self_link", link=f"{base}#{type_id}"))
+        parts.append(_param("web_link", link=""))
+        parts.append(_param("resource_type_link", link=""))
+        parts.append(_param("http_etag"))
+        parts.extend(_param(field, required="true") for field in entry_type.fields)
+        parts.extend(_link_params(base, entry_type.links, entry_type.collections))
+        parts.append("</wadl:representation>")
+        parts.append(_page(base, type_id))
+    for type_id, (entry_type_id, operations) in _COLLECTION_TYPES.items():
+        parts.append(f'<wadl:resource_type id="{type_id}">')
+        parts.append(_get_method(type_id, f"{base}#{entry_type_id}-page"))
+        parts.extend(_operation(base, type_id, op) for op in operations)
+        parts.append("</wadl:resource_type>")
+    parts.append("</wadl:application>")
+    return "\n".join(parts)
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: http.HTTPStatus, message: str = "") -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message or status.phrase
+
+
+class FakeLaunchpad:
+    """The state of a fake Launchpad instance."""
+
+    def __init__(
+        self, root_url: str, git_root: pathlib.Path, config: FakeLaunchpadConfig
+    ) -> None:
+        self.root_url = root_url
+        self.api_url = f"{root_url}{API_VERSION}/"
+        self.git_root = git_root
+        self.config = config
+        self.lock = threading.RLock()
+        self.projects: dict[str, _Project] = {}
+        self.repositories: dict[str, _GitRepository] = {}
+        self.snaps: dict[str, _Snap] = {}
+        self.build_requests: dict[int, _BuildRequest] = {}
+        self.builds: dict[int, _SnapBuild] = {}
+        self._ids = itertools.count(1)
+        self.wadl = build_wadl(self.api_url)
+
+    # region Representations
+    def _entry(self, type_id: str, path: str, **fields: Any) -> dict[str, Any]:
+        return {
+            "self_link": f"{self.api_url}{path}",
+            "web_link": f"{self.root_url}{path}",
+            "resource_type_link": f"{self.api_url}#{type_id}",
+            "http_etag": f'"{type_id}-{time.monotonic_ns()}"',
+            **fields,
+        }
+
+    def root(self) -> dict[str, Any]:
+        """The service root representation."""
+        return {
+            "resource_type_link": f"{self.api_url}#service-root",
+            "me_link": f"{self.api_url}~{self.config.username}",
+            "projects_collection_link": f"{self.api_url}projects",
+            "git_repositories_collection_link": f"{self.api_url}+git",
+            "snaps_collection_link": f"{self.api_url}+snaps",
+        }
+
+    def person(self, name: str) -> dict[str, Any]:
+        """The representation of a person."""
+        return self._entry("person", f"~{name}", name=name, display_name=name)
+
+    def project(self, project: _Project) -> dict[str, Any]:
+        """The representation of a project."""
+        return self._entry("project", project.name, **dataclasses.asdict(project))
+
+    def repository(self, repo: _GitRepository) -> dict[str, Any]:
+        """The representation of a git repository."""
+        return self._entry(
+            "git_repository",
+            repo.path,
+            name=repo.name,
+            display_name=repo.path,
+            description=None,
+            default_branch="refs/heads/main",
+            git_https_url=f"{self.root_url}{repo.path}",
+            git_ssh_url=f"git+ssh://{self.config.username}@localhost/{repo.path}",
+            information_type=repo.information_type,
+            private=repo.information_type not in ("Public", "Public Security"),
+            owner_link=f"{self.api_url}~{repo.owner}",
+            target_link=f"{self.api_url}{repo.target}" if repo.target else None,
+        )
+
+    def snap(self, snap: _Snap) -> dict[str, Any]:
+        """The representation of a snap recipe."""
+        return self._entry(
+            "snap",
+            snap.path,
+            name=snap.name,
+            description=None,
+            build_path=snap.build_path,
+            information_type=snap.information_type,
+            private=snap.information_type not in ("Public", "Public Security"),
+            store_name=snap.store_name,
+            store_upload=bool(snap.store_name),
+            auto_build=False,
+            git_path=snap.git_ref,
+            owner_link=f"{self.api_url}~{snap.owner}",
+            project_link=f"{self.api_url}{snap.project}" if snap.project else None,
+            builds_collection_link=f"{self.api_url}{snap.path}/builds",
+        )
+
+    def build_request(self, request: _BuildRequest) -> dict[str, Any]:
+        """The representation of a build request."""
+        return self._entry(
+            "snap_build_request",
+            f"{request.snap_path}/+build-request/{request.id}",
+            status="Completed",
+            error_message=None,
+            snap_link=f"{self.api_url}{request.snap_path}",
+            builds_collection_link=(
+                f"{self.api_url}{request.snap_path}/+build-request/{request.id}/builds"
+            ),
+        )
+
+    def build_state(self, build: _SnapBuild) -> str:
+        """Get the current state of a simulated build."""
+        if build.cancelled:
+            return "Cancelled build"
+        elapsed = time.monotonic() - build.created
+        if elapsed < self.config.pending_seconds:
+            return "Needs building"
+        if elapsed < self.config.pending_seconds + build.duration:
+            return "Currently building"
+        return "Failed to build" if build.failed else "Successfully built"
+
+    def build(self, build: _SnapBuild) -> dict[str, Any]:
+        """The representation of a snap build."""
+        state = self.build_state(build)
+        finished = state in ("Successfully built", "Failed to build", "Cancelled build")
+        return self._entry(
+            "snap_build",
+            f"{build.snap_path}/+build/{build.id}",
+            title=f"{build.arch} build of {build.snap_path}",
+            arch_tag=build.arch,
+            buildstate=state,
+            build_log_url=(
+                f"{self.root_url}files/{build.id}/buildlog_{build.arch}.txt.gz"
+                if finished
+                else None
+            ),
+            datebuilt=(
+                dt.datetime.now(tz=dt.timezone.utc).isoformat() if finished else None
+            ),
+            can_be_cancelled=not finished,
+            can_be_retried=state == "Failed to build",
+            snap_link=f"{self.api_url}{build.snap_path}",
+        )
+
+    def page(self, type_id: str, entries: list[dict[str, Any]]) -> dict[str, Any]:
+        """A single page containing all entries of a collection."""
+        return {
+            "resource_type_link": f"{self.api_url}#{type_id}-page-resource",
+            "total_size": len(entries),
+            "start": 0,
+            "entries": entries,
+        }
+
+    def artifact_names(self, build: _SnapBuild) -> list[str]:
+        """Get the names of a build's artifacts."""
+        if self.build_state(build) != "Successfully built":
+            return []
+        name = build.snap_path.rpartition("/")[2]
+        return [
+            f"{name}_{index}_{build.arch}.snap"
+            for index in range(self.config.artifacts_per_build)
+        ]
+
+    # endregion
+    # region Actions
+    def new_project(self, params: dict[str, Any]) -> str:
+        """Create a new project."""
+        name = params["name"]
+        if name in self.projects:
+            raise _HTTPError(http.HTTPStatus.BAD_REQUEST, f"{name} already exists.")
+        self.projects[name] = _Project(
+            name=name,
+            title=params["title"],
+            display_name=params["display_name"],
+            summary=params["summary"],
+            description=params.get("description"),
+            information_type=params.get("information_type") or "Public",
+        )
+        return name
+
+    def new_repository(self, params: dict[str, Any]) -> str:
+        """Create a new git repository."""
+        owner = _strip_link(params["owner"]).lstrip("~")
+        target = _strip_link(params["target"]) if params.get("target") else None
+        if target:
+            path = f"~{owner}/{target}/+git/{params['name']}"
+        else:
+            path = f"~{owner}/+git/{params['name']}"
+        if path in self.repositories:
+            raise _HTTPError(http.HTTPStatus.BAD_REQUEST, f"{path} already exists.")
+        self.repositories[path] = _GitRepository(
+            path=path,
+            name=params["name"],
+            owner=owner,
+            target=target,
+            information_type=params.get("information_type") or "Public",
+        )
+        repo_dir = self.git_root / path
+        repo_dir.mkdir(parents=True)
+        subprocess.run(
+            ["git", "init", "--quiet", "--bare", str(repo_dir)],
+            check=True,
+        )
+        return path
+
+    def find_repository(self, path: str) -> _GitRepository | None:
+        """Find a repository by its path.
+
+        Unlike Launchpad, a personal-style path (``~owner/+git/name``) also finds
+        a project repository with the same owner and name.
+        """
+        if path in self.repositories:
+            return self.repositories[path]
+        match = re.fullmatch(r"~([^/]+)/\+git/([^/]+)", path)
+        if match:
+            for repo in self.repositories.values():
+                if (repo.owner, repo.name) == match.groups():
+                    return repo
+        return None
+
+    def new_snap(self, params: dict[str, Any]) -> str:
+        """Create a new snap recipe."""
+        owner = _strip_link(params["owner"]).lstrip("~")
+        path = f"~{owner}/+snap/{params['name']}"
+        if path in self.snaps:
+            raise _HTTPError(http.HTTPStatus.BAD_REQUEST, f"{path} already exists.")
+        git_ref = params.get("git_ref")
+        if git_ref:
+            repo_path = _strip_link(git_ref).partition("/+ref/")[0]
+            if self.find_repository(repo_path) is None:
+                raise _HTTPError(
+                    http.HTTPStatus.BAD_REQUEST, f"No repository at {repo_path}"
+                )
+        self.snaps[path] = _Snap(
+            path=path,
+            name=params["name"],
+            owner=owner,
+            project=_strip_link(params["project"]) if params.get("project") else None,
+            git_ref=git_ref,
+            build_path=params.get("build_path"),
+            processors=[
+                _strip_link(processor).rpartition("/")[2]
+                for processor in params.get("processors") or []
+            ],
+            information_type=params.get("information_type") or "Public",
+            store_name=params.get("store_name"),
+        )
+        return path
+
+    def request_builds(self, snap: _Snap) -> str:
+        """Request builds for each of a snap recipe's architectures."""
+        request = _BuildRequest(id=next(self._ids), snap_path=snap.path, builds=[])
+        for arch in snap.processors or self.config.default_architectures:
+            build = _SnapBuild(
+                id=next(self._ids),
+                arch=arch,
+                snap_path=snap.path,
+                created=time.monotonic(),
+                duration=self.config.build_seconds_by_arch.get(
+                    arch, self.config.build_seconds
+                ),
+                failed=arch in self.config.failed_architectures,
+            )
+            request.builds.append(build)
+            snap.builds.append(build)
+            self.builds[build.id] = build
+        self.build_requests[request.id] = request
+        return f"{snap.path}/+build-request/{request.id}"
+
+    # endregion
+
+
+def _strip_link(link: str) -> str:
+    """Convert an API link or absolute path into a path relative to the API root."""
+    path = urllib.parse.urlparse(link).path
+    if path.startswith(f"/{API_VERSION}/"):
+        path = path[len(API_VERSION) + 1 :]
+    return path.strip("/")
+
+
+def _get_or_404(mapping: Mapping[K, V], key: K) -> V:
+    """Get an item by its key, or respond with 404 Not Found."""
+    try:
+        return mapping[key]
+    except KeyError:
+        raise _HTTPError(http.HTTPStatus.NOT_FOUND) from None
+
+
+def _decode_params(pairs: list[tuple[str, str]]) -> dict[str, Any]:
+    """Decode operation parameters, which lazr.restfulclient sends as JSON."""
+    params: dict[str, Any] = {}
+    for key, value in pairs:
+        try:
+            params[key] = json.loads(value)
+        except ValueError:  # noqa: PERF203
+            params[key] = value
+    return params
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    server: FakeLaunchpadServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Don't log requests to stderr."""
+
+    # region HTTP plumbing
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                if size == 0:
+                    self.rfile.readline()
+                    break
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+            return b"".join(chunks)
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def _send(
+        self,
+        status: int,
+        body: bytes = b"",
+        content_type: str = "application/json",
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_json(self, data: Any, status: int = 200) -> None:
+        self._send(status, json.dumps(data).encode())
+
+    def _dispatch(self) -> None:
+        body = self._read_body()
+        url = urllib.parse.urlparse(self.path)
+        self.server.record(self.command, url.path)
+        try:
+            if url.path.startswith(f"/{API_VERSION}/"):
+                with self.server.launchpad.lock:
+                    self._api(url, body)
+            elif url.path.startswith("/files/"):
+                self._file(url.path)
+            else:
+                self._git(url, body)
+        except _HTTPError as exc:
+            self._send(exc.status, exc.message.encode(), content_type="text/plain")
+
+    do_GET = do_POST = do_DELETE = do_HEAD = do_PATCH = _dispatch  # noqa: N815
+
+    # endregion
+    # region Launchpad API
+    def _api(self, url: urllib.parse.ParseResult, body: bytes) -> None:
+        lp = self.server.launchpad
+        path = url.path[len(API_VERSION) + 2 :].strip("/")
+        if self.command == "POST":
+            params = _decode_params(urllib.parse.parse_qsl(body.decode()))
+        else:
+            params = _decode_params(urllib.parse.parse_qsl(url.query))
+        operation = params.pop("ws.op", None)
+
+        if not path:
+            if WADL_MEDIA_TYPE in self.headers.get("Accept", ""):
+                self._send(200, lp.wadl.encode(), content_type=WADL_MEDIA_TYPE)
+            else:
+                self._send_json(lp.root())
+            return
+
+        if path in ("projects", "+git", "+snaps"):
+            self._api_collection(path, operation, params)
+        elif match := re.fullmatch(r"~([^/]+)", path):
+            self._send_json(lp.person(match.group(1)))
+        elif "/+git/" in path:
+            self._api_repository(path, operation)
+        elif match := re.fullmatch(r"(~[^/]+/\+snap/[^/]+)(/.*)?", path):
+            self._api_snap(match.group(1), match.group(2) or "", operation)
+        elif path in lp.projects:
+            self._send_json(lp.project(lp.projects[path]))
+        else:
+            raise _HTTPError(http.HTTPStatus.NOT_FOUND)
+
+    def _api_collection(
+        self, path: str, operation: str | None, params: dict[str, Any]
+    ) -> None:
+        lp = self.server.launchpad
+        if path == "projects" and operation == "new_project":
+            self._created(f"{lp.api_url}{lp.new_project(params)}")
+        elif path == "projects":
+            self._send_json(
+                lp.page("project", [lp.project(p) for p in lp.projects.values()])
+            )
+        elif path == "+git" and operation == "new":
+            self._created(f"{lp.api_url}{lp.new_repository(params)}")
+        elif path == "+git" and operation == "getByPath":
+            repo = lp.find_repository(params["path"].strip("/"))
+            self._send_json(lp.repository(repo) if repo else None)
+        elif path == "+snaps" and operation == "new":
+            self._created(f"{lp.api_url}{lp.new_snap(params)}")
+        elif path == "+snaps" and operation == "getByName":
+            owner = _strip_link(params["owner"]).lstrip("~")
+            snap = lp.snaps.get(f"~{owner}/+snap/{params['name']}")
+            if snap is None:
+                raise _HTTPError(http.HTTPStatus.NOT_FOUND)
+            self._send_json(lp.snap(snap))
+        else:
+            raise _HTTPError(http.HTTPStatus.BAD_REQUEST)
+
+    def _created(self, location: str) -> None:
+        self._send(201, b"", headers={"Location": location})
+
+    def _api_repository(self, path: str, operation: str | None) -> None:
+        lp = self.server.launchpad
+        repo = _get_or_404(lp.repositories, path)
+        if self.command == "DELETE":
+            del lp.repositories[path]
+            shutil.rmtree(lp.git_root / path, ignore_errors=True)
+            self._send(200)
+        elif operation == "issueAccessToken":
+            self._send_json(f"token-{next(lp._ids)}")
+        else:
+            self._send_json(lp.repository(repo))
+
+    def _api_snap(self, snap_path: str, sub_path: str, operation: str | None) -> None:
+        lp = self.server.launchpad
+        snap = _get_or_404(lp.snaps, snap_path)
+        if not sub_path:
+            if self.command == "DELETE":
+                del lp.snaps[snap_path]
+                self._send(200)
+            elif operation == "requestBuilds":
+                self._created(f"{lp.api_url}{lp.request_builds(snap)}")
+            else:
+                self._send_json(lp.snap(snap))
+        elif sub_path == "/builds":
+            self._send_json(lp.page("snap_build", [lp.build(b) for b in snap.builds]))
+        elif match := re.fullmatch(r"/\+build-request/(\d+)(/builds)?", sub_path):
+            request = _get_or_404(lp.build_requests, int(match.group(1)))
+            if match.group(2):
+                self._send_json(
+                    lp.page("snap_build", [lp.build(b) for b in request.builds])
+                )
+            else:
+                self._send_json(lp.build_request(request))
+        elif match := re.fullmatch(r"/\+build/(\d+)", sub_path):
+            self._api_build(_get_or_404(lp.builds, int(match.group(1))), operation)
+        else:
+            raise _HTTPError(http.HTTPStatus.NOT_FOUND)
+
+    def _api_build(self, build: _SnapBuild, operation: str | None) -> None:
+        lp = self.server.launchpad
+        if operation == "getFileUrls":
+            self._send_json(
+                [
+                    f"{lp.root_url}files/{build.id}/{name}"
+                    for name in lp.artifact_names(build)
+                ]
+            )
+        elif operation == "cancel":
+            if lp.build_state(build) in ("Successfully built", "Failed to build"):
+                raise _HTTPError(
+                    http.HTTPStatus.BAD_REQUEST, "Build cannot be cancelled."
+                )
+            build.cancelled = True
+            self._send_json(None)
+        elif operation == "retry":
+            build.created = time.monotonic()
+            build.cancelled = False
+            build.failed = False
+            self._send_json(None)
+        else:
+            self._send_json(lp.build(build))
+
+    # endregion
+    # region Files and git
+    def _file(self, path: str) -> None:
+        lp = self.server.launchpad
+        match = re.fullmatch(r"/files/(\d+)/([^/]+)", path)
+        with lp.lock:
+            build = lp.builds.get(int(match.group(1))) if match else None
+            if not match or not build:
+                raise _HTTPError(http.HTTPStatus.NOT_FOUND)
+            name = urllib.parse.unquote(match.group(2))
+            if name.startswith("buildlog_"):
+                size = lp.config.log_size
+            elif name in lp.artifact_names(build):
+                size = lp.config.artifact_size
+            else:
+                raise _HTTPError(http.HTTPStatus.NOT_FOUND)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(size))
+        self.end_headers()
+        chunk = b"\0" * CHUNK_SIZE
+        while size > 0:
+            self.wfile.write(chunk[:size])
+            size -= CHUNK_SIZE
+
+    def _git(self, url: urllib.parse.ParseResult, body: bytes) -> None:
+        """Serve the git smart-HTTP protocol with ``git http-backend``."""
+        env = {
+            "PATH": os.environ.get("PATH", ""),
+            "GIT_PROJECT_ROOT": str(self.server.launchpad.git_root),
+            "GIT_HTTP_EXPORT_ALL": "1",
+            "REMOTE_USER": self.server.launchpad.config.username,
+            "REQUEST_METHOD": self.command,
+            "PATH_INFO": urllib.parse.unquote(url.path),
+            "QUERY_STRING": url.query,
+            "CONTENT_TYPE": self.headers.get("Content-Type", ""),
+            "CONTENT_LENGTH": str(len(body)),
+            "GIT_CONFIG_NOSYSTEM": "1",
+            "HOME": str(self.server.launchpad.git_root),
+        }
+        if protocol := self.headers.get("Git-Protocol"):
+            env["GIT_PROTOCOL"] = protocol
+        result = subprocess.run(
+            ["git", "http-backend"],
+            input=body,
+            env=env,
+            capture_output=True,
+            check=False,
+        )
+        header_block, separator, content = result.stdout.partition(b"\r\n\r\n")
+        if not separator:
+            header_block, _, content = result.stdout.partition(b"\n\n")
+        status = 200
+        content_type = "text/plain"
+        headers: dict[str, str] = {}
+        for line in header_block.decode().splitlines():
+            key, _, value = line.partition(":")
+            if key.lower() == "status":
+                status = int(value.split()[0])
+            elif key.lower() == "content-type":
+                content_type = value.strip()
+            else:
+                headers[key] = value.strip()
+        self._send(status, content, content_type=content_type, headers=headers)
+
+    # endregion
+
+
+class FakeLaunchpadServer(http.server.ThreadingHTTPServer):
+    """An HTTP server hosting a fake Launchpad instance on localhost."""
+
+    daemon_threads = True
+
+    def __init__(
+        self, work_dir: pathlib.Path, config: FakeLaunchpadConfig | None = None
+    ) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.root_url = f"http://127.0.0.1:{self.server_address[1]}/"
+        git_root = work_dir / "git"
+        git_root.mkdir(parents=True, exist_ok=True)
+        self.launchpad = FakeLaunchpad(
+            self.root_url, git_root, config or FakeLaunchpadConfig()
+        )
+        self.requests: list[tuple[str, str]] = []
+        self._requests_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def record(self, method: str, path: str) -> None:
+        """Record a request to the server."""
+        with self._requests_lock:
+            self.requests.append((method, path))
+
+    def count_requests(self, prefix: str = "/") -> int:
+        """Count the recorded requests whose path starts with ``prefix``."""
+        with self._requests_lock:
+            return sum(1 for _, path in self.requests if path.startswith(prefix))
+
+    def write_credentials(self, path: pathlib.Path) -> pathlib.Path:
+        """Write a launchpadlib credentials file that this server accepts."""
+        credentials = Credentials("System-wide: fake-launchpad")
+        credentials.access_token = AccessToken("fake-token", "fake-secret")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        credentials.save_to_path(str(path))
+        return path
+
+    def start(self) -> None:
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and close the server socket."""
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
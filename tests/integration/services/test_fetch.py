@@ -481,8 +481,8 @@ def _check_log(capsys) -> None:
         Configuring proxy in instance
         Installing certificate
         Configuring Apt
-        Refreshing Apt package listings
         Configuring pip
+        Refreshing Apt package listings
         Finalizing instance configuration
         Configuring snapd
         """
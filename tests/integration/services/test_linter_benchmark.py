@@ -0,0 +1,95 @@
+#  This file is part of craft-application.
+#
+#  Copyright 2026 Canonical Ltd.
+#
+#  This program is free software: you can redistribute it and/or modify it
+#  under the terms of the GNU Lesser General Public License version 3, as
+#  published by the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+#  SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmarks for filtering linter issues through ignore rules.
+
+These don't assert on timings. Each benchmark records its measurements as user
+properties of the test, which show up in the JUnit XML report (``--junit-xml``).
+"""
+
+import time
+
+import pytest
+from craft_application.lint import (
+    IgnoreConfig,
+    IgnoreSpec,
+    LintContext,
+    LinterIssue,
+    Severity,
+    Stage,
+    should_ignore,
+)
+from craft_application.lint.base import AbstractLinter
+from craft_application.services import LinterService, ServiceFactory
+
+ISSUE_COUNT = 100_000
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+ISSUES = [
+    LinterIssue(
+        id=f"B00{index % 3}",
+        message="benchmark issue",
+        severity=Severity.WARNING,
+        filename=f"prime/dir-{index % 100}/file-{index}.{('so', 'py', 'txt')[index % 3]}",
+    )
+    for index in range(ISSUE_COUNT)
+]
+
+
+class _ManyIssuesLinter(AbstractLinter):
+    name = "benchmark.many"
+    stage = Stage.POST
+
+    def run(self, ctx: LintContext):
+        yield from ISSUES
+
+
+def test_benchmark_ignore_issues(
+    record_measurement, linter_registry_guard, app_metadata, tmp_path
+):
+    """Time a 100k-issue run where most issues go through filename globs."""
+    ignore_config: IgnoreConfig = {
+        _ManyIssuesLinter.name: IgnoreSpec(
+            ids={"B000"},
+            by_filename={
+                "B001": {"prime/dir-1/*", "prime/dir-2?/*", "*/dir-99/*"},
+                "B002": {"*.md", "prime/dir-[0-4]/*.txt", "*/nothing/*"},
+            },
+        ),
+    }
+    service = LinterService(app_metadata, ServiceFactory(app_metadata))
+    ctx = LintContext(project_dir=tmp_path, artifact_dirs=[])
+
+    start = time.perf_counter()
+    service.load_ignore_config(project_dir=tmp_path, cli_ignores=ignore_config)
+    loaded = time.perf_counter()
+    with linter_registry_guard(_ManyIssuesLinter):
+        issues = list(service.run(Stage.POST, ctx))
+    ran = time.perf_counter()
+    # The per-issue glob matching that the service used to do, for comparison.
+    uncompiled = [
+        issue
+        for issue in ISSUES
+        if not should_ignore(_ManyIssuesLinter.name, issue, ignore_config)
+    ]
+    end = time.perf_counter()
+
+    assert issues == uncompiled
+    record_measurement("issues", ISSUE_COUNT)
+    record_measurement("reported_issues", len(issues))
+    record_measurement("load_ignore_config_seconds", loaded - start)
+    record_measurement("run_seconds", ran - loaded)
+    record_measurement("uncompiled_filter_seconds", end - ran)
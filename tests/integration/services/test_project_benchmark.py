@@ -0,0 +1,86 @@
+#  This file is part of craft-application.
+#
+#  Copyright 2026 Canonical Ltd.
+#
+#  This program is free software: you can redistribute it and/or modify it
+#  under the terms of the GNU Lesser General Public License version 3, as
+#  published by the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+#  SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmarks for rendering and updating a large project.
+
+These don't assert on timings. Each benchmark records its measurements as user
+properties of the test, which show up in the JUnit XML report (``--junit-xml``).
+"""
+
+import pathlib
+import time
+
+import craft_platforms
+import pytest
+from craft_application.services import ProjectService, ServiceFactory
+from craft_application.util import yaml
+
+PART_COUNT = 500
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+
+@pytest.fixture
+def large_project_service(app_metadata, in_project_path: pathlib.Path):
+    """A project service for a project with many parts."""
+    host_arch = craft_platforms.DebianArchitecture.from_host().value
+    project = {
+        "name": "large-project",
+        "version": "1.0",
+        "summary": "A project with many parts.",
+        "description": "A project with many parts, for benchmarking.",
+        "base": "ubuntu@24.04",
+        "platforms": {host_arch: None},
+        "parts": {
+            f"part-{index}": {
+                "plugin": "nil",
+                "source": f"src/{index}",
+                "after": [f"part-{index - 1}"] if index else [],
+                "build-environment": [{"PART_INDEX": str(index)}],
+                "stage-packages": [f"package-{index}"],
+            }
+            for index in range(PART_COUNT)
+        },
+    }
+    (in_project_path / f"{app_metadata.name}.yaml").write_text(yaml.dump_yaml(project))
+    return ProjectService(
+        app=app_metadata,
+        services=ServiceFactory(app_metadata),
+        project_dir=in_project_path,
+    )
+
+
+def test_benchmark_render_and_update(record_measurement, large_project_service):
+    """Time rendering a 500-part project and applying a ``craftctl set`` update."""
+    service = large_project_service
+    update = {"version": "2.0", "summary": "An updated summary."}
+
+    start = time.perf_counter()
+    service.configure(platform=None, build_for=None)
+    project = service.get()
+    rendered = time.perf_counter()
+    service.deep_update(update)
+    updated = time.perf_counter()
+    # The full revalidation that deep_update used to do, for comparison.
+    full = type(project).unmarshal(
+        ProjectService._deep_update(project.marshal(), update)
+    )
+    end = time.perf_counter()
+
+    assert len(service.get().parts) == PART_COUNT
+    assert service.get().marshal() == full.marshal()
+    record_measurement("render_for_seconds", rendered - start)
+    record_measurement("deep_update_seconds", updated - rendered)
+    record_measurement("full_revalidation_seconds", end - updated)
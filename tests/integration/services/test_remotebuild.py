@@ -15,8 +15,13 @@
 #  along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Tests for the remote build service."""
 
+import subprocess
+
 import pytest
-from craft_application import errors
+from craft_application import errors, launchpad
+from craft_application.git import GitRepo
+
+from tests.integration.fake_launchpad import API_VERSION, FakeLaunchpadConfig
 
 
 @pytest.fixture(scope="module", params=["charmcraft", "coreutils", "dpkg", "sudo"])
@@ -51,3 +56,120 @@ def test_project_is_public(anonymous_remote_build_service, public_project_name):
     """Test that the given project is public."""
     anonymous_remote_build_service.set_project(public_project_name)
     assert not anonymous_remote_build_service.is_project_private()
+
+
+@pytest.fixture
+def git_project(tmp_path):
+    """A committed git repository containing a project."""
+    project_dir = tmp_path / "git-project"
+    project_dir.mkdir()
+    (project_dir / "testcraft.yaml").write_text("name: myproject\n")
+    repo = GitRepo(project_dir)
+    repo.add_all()
+    repo.commit("Initial commit")
+    return project_dir
+
+
+@pytest.mark.parametrize(
+    "fake_launchpad_config",
+    [FakeLaunchpadConfig(failed_architectures=frozenset({"riscv64"}))],
+)
+def test_offline_remote_build(
+    tmp_path, fake_launchpad_server, offline_remote_build_service, git_project
+):
+    """Run a full remote build against the fake Launchpad server."""
+    service = offline_remote_build_service
+    service.setup()
+
+    builds = service.start_builds(git_project, architectures=["amd64", "riscv64"])
+    *_, states = service.monitor_builds(poll_interval=0)
+    logs = service.fetch_logs(tmp_path)
+    artifacts = service.fetch_artifacts(tmp_path)
+    service.cleanup()
+
+    assert {build.arch_tag for build in builds} == {"amd64", "riscv64"}
+    assert states == {
+        "amd64": launchpad.models.BuildState.SUCCESS,
+        "riscv64": launchpad.models.BuildState.FAILED,
+    }
+    assert all(log.is_file() for log in logs.values() if log)
+    assert [path.name for path in artifacts] == [f"{service._name}_0_amd64.snap"]
+    assert not fake_launchpad_server.launchpad.snaps
+    assert not fake_launchpad_server.launchpad.repositories
+
+
+def test_offline_remote_build_pushes_project(
+    fake_launchpad_server, offline_remote_build_service, git_project
+):
+    """The project is pushed to a repository on the fake Launchpad server."""
+    service = offline_remote_build_service
+    service.setup()
+
+    service.start_builds(git_project)
+
+    (repo,) = fake_launchpad_server.launchpad.repositories.values()
+    tree = subprocess.run(
+        ["git", "ls-tree", "--name-only", "main"],
+        cwd=fake_launchpad_server.launchpad.git_root / repo.path,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert tree.stdout.splitlines() == ["testcraft.yaml"]
+
+
+def test_offline_resume_remote_build(
+    tmp_path, offline_remote_build_service, git_project
+):
+    """Resume monitoring and fetch outputs of an existing build."""
+    service = offline_remote_build_service
+    service.setup()
+    service.start_builds(git_project)
+    name = service._name
+
+    service._builds = []
+    service._is_setup = False
+    builds = service.resume_builds(name)
+    outputs = service.fetch_build_outputs("amd64", tmp_path).result()
+    service.stop_fetching()
+
+    assert [build.arch_tag for build in builds] == ["amd64"]
+    assert outputs.log is not None
+    assert outputs.log.is_file()
+    assert [path.name for path in outputs.artifacts] == [f"{name}_0_amd64.snap"]
+
+
+def test_offline_login_reuses_service_root(
+    app_metadata, fake_services, fake_launchpad_server, offline_remote_build_service
+):
+    """A second login reuses the cached service root and WADL description."""
+    service_root = f"/{API_VERSION}/"
+    offline_remote_build_service.lp.lp.me  # noqa: B018 (log in)
+    first_requests = fake_launchpad_server.requests.copy()
+
+    second_service = type(offline_remote_build_service)(app_metadata, fake_services)
+    second_service.lp.lp.me  # noqa: B018 (log in)
+    second_requests = fake_launchpad_server.requests[len(first_requests) :]
+
+    assert first_requests == [("GET", service_root), ("GET", service_root)]
+    assert second_requests == []
+
+
+@pytest.mark.parametrize(
+    "fake_launchpad_config", [FakeLaunchpadConfig(build_seconds=600)]
+)
+def test_offline_cancel_and_cleanup(
+    fake_launchpad_server, offline_remote_build_service, git_project
+):
+    """Cancel many builds concurrently, then clean up."""
+    architectures = ["amd64", "arm64", "armhf", "ppc64el", "riscv64", "s390x"]
+    service = offline_remote_build_service
+    service.start_builds(git_project, architectures=architectures)
+
+    service.cancel_builds()
+    service.cleanup()
+
+    builds = fake_launchpad_server.launchpad.builds.values()
+    assert [build.cancelled for build in builds] == [True] * len(architectures)
+    assert not fake_launchpad_server.launchpad.snaps
+    assert not fake_launchpad_server.launchpad.repositories
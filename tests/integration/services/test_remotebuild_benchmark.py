@@ -0,0 +1,151 @@
+#  This file is part of craft-application.
+#
+#  Copyright 2026 Canonical Ltd.
+#
+#  This program is free software: you can redistribute it and/or modify it
+#  under the terms of the GNU Lesser General Public License version 3, as
+#  published by the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+#  SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmarks for remote builds against a local fake Launchpad.
+
+These don't assert on timings. Each benchmark records its measurements as user
+properties of the test, which show up in the JUnit XML report (``--junit-xml``).
+"""
+
+import time
+
+import pytest
+from craft_application.git import GitRepo
+
+from tests.integration.fake_launchpad import FakeLaunchpadConfig
+
+ARCHITECTURES = ["amd64", "arm64", "armhf", "ppc64el", "riscv64", "s390x"]
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+
+@pytest.fixture
+def git_project(tmp_path):
+    """A committed git repository with a number of files to push."""
+    project_dir = tmp_path / "git-project"
+    project_dir.mkdir()
+    (project_dir / "testcraft.yaml").write_text("name: myproject\n")
+    for index in range(200):
+        (project_dir / f"file_{index}.txt").write_bytes(bytes(index) * 512)
+    repo = GitRepo(project_dir)
+    repo.add_all()
+    repo.commit("Initial commit")
+    return project_dir
+
+
+def test_benchmark_upload(
+    record_measurement, fake_launchpad_server, offline_remote_build_service, git_project
+):
+    """Time from login until builds are requested, including the git push."""
+    service = offline_remote_build_service
+
+    start = time.perf_counter()
+    service.setup()
+    # Logging in is deferred until the client is first used.
+    assert service.lp is not None
+    login = time.perf_counter()
+    login_requests = fake_launchpad_server.count_requests()
+    service.start_builds(git_project, architectures=ARCHITECTURES)
+    end = time.perf_counter()
+
+    record_measurement("login_seconds", login - start)
+    record_measurement("login_requests", login_requests)
+    record_measurement("start_builds_seconds", end - login)
+    record_measurement("requests", fake_launchpad_server.count_requests())
+
+
+@pytest.mark.parametrize(
+    "fake_launchpad_config",
+    [
+        FakeLaunchpadConfig(
+            build_seconds=1.0,
+            build_seconds_by_arch={"riscv64": 3.0},
+            artifact_size=1024**2,
+        )
+    ],
+)
+def test_benchmark_polling(
+    record_measurement, fake_launchpad_server, offline_remote_build_service, git_project
+):
+    """Measure the cost of polling build states until every build stops."""
+    service = offline_remote_build_service
+    service.setup()
+    service.start_builds(git_project, architectures=ARCHITECTURES)
+    api_requests = fake_launchpad_server.count_requests("/devel/")
+
+    start = time.perf_counter()
+    polls = sum(1 for _ in service.monitor_builds(poll_interval=0.1))
+    end = time.perf_counter()
+
+    poll_requests = fake_launchpad_server.count_requests("/devel/") - api_requests
+    record_measurement("polls", polls)
+    record_measurement("monitor_seconds", end - start)
+    record_measurement("requests_per_poll", poll_requests / polls)
+
+
+@pytest.mark.parametrize(
+    "fake_launchpad_config",
+    [
+        FakeLaunchpadConfig(
+            build_seconds=0.5,
+            build_seconds_by_arch={"riscv64": 2.0},
+            artifact_size=16 * 1024**2,
+            artifacts_per_build=2,
+            log_size=1024**2,
+        )
+    ],
+)
+@pytest.mark.parametrize("streaming", [False, True], ids=["sequential", "streaming"])
+def test_benchmark_downloads(
+    tmp_path,
+    record_measurement,
+    offline_remote_build_service,
+    git_project,
+    streaming,
+):
+    """Time from requesting builds until every output is downloaded.
+
+    The sequential case waits for all builds before downloading, as
+    ``fetch_logs`` and ``fetch_artifacts`` do. The streaming case starts
+    downloading each build's outputs as soon as it stops.
+    """
+    service = offline_remote_build_service
+    service.setup()
+    service.start_builds(git_project, architectures=ARCHITECTURES)
+
+    start = time.perf_counter()
+    if streaming:
+        fetches = {}
+        for states in service.monitor_builds(poll_interval=0.1):
+            fetches.update(
+                (arch, service.fetch_build_outputs(arch, tmp_path))
+                for arch, state in states.items()
+                if state.is_stopped and arch not in fetches
+            )
+        outputs = [future.result() for future in fetches.values()]
+        artifacts = [path for output in outputs for path in output.artifacts]
+        service.stop_fetching()
+    else:
+        for _ in service.monitor_builds(poll_interval=0.1):
+            pass
+        service.fetch_logs(tmp_path)
+        artifacts = list(service.fetch_artifacts(tmp_path))
+    end = time.perf_counter()
+
+    assert len(artifacts) == 2 * len(ARCHITECTURES)
+    record_measurement("total_seconds", end - start)
+    record_measurement(
+        "downloaded_bytes", sum(path.stat().st_size for path in artifacts)
+    )
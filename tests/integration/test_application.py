@@ -219,6 +219,7 @@ def test_project_destructive(
 ):
     monkeypatch.chdir(tmp_path)
     shutil.copytree(VALID_PROJECTS_DIR / project, tmp_path, dirs_exist_ok=True)
+    project_files = {path.name for path in tmp_path.iterdir()}
 
     monkeypatch.setattr(
         "sys.argv",
@@ -229,6 +230,13 @@ def test_project_destructive(
     app.run()
 
     assert (tmp_path / "package_1.0.tar.zst").exists()
+    # Only the work dirs and the package are added to the project dir.
+    assert {path.name for path in tmp_path.iterdir()} == project_files | {
+        "parts",
+        "stage",
+        "prime",
+        "package_1.0.tar.zst",
+    }
     captured = capsys.readouterr()
     assert (
         captured.err.splitlines()[-1]
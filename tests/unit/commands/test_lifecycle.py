@@ -489,7 +489,10 @@ def test_clean_run_without_parts(
     mock_services.get("config").get.return_value = build_env
     parts = []
     parsed_args = argparse.Namespace(
-        parts=parts, output=tmp_path, destructive_mode=destructive_mode
+        parts=parts,
+        output=tmp_path,
+        destructive_mode=destructive_mode,
+        all_platforms=False,
     )
     command = CleanCommand({"app": app_metadata, "services": mock_services})
 
@@ -499,6 +502,24 @@ def test_clean_run_without_parts(
     assert mock_services.provider.clean_instances.called == expected_provider
 
 
+@pytest.mark.parametrize("all_platforms", [False, True])
+def test_clean_run_all_platforms(app_metadata, tmp_path, mock_services, all_platforms):
+    mock_services.get("config").get.return_value = "lxd"
+    parser = argparse.ArgumentParser("clean")
+    command = CleanCommand({"app": app_metadata, "services": mock_services})
+    command.fill_parser(parser)
+    parsed_args = parser.parse_args(
+        ["--all-platforms"] if all_platforms else [],
+        namespace=argparse.Namespace(output=tmp_path, destructive_mode=False),
+    )
+
+    command.run(parsed_args)
+
+    mock_services.provider.clean_instances.assert_called_once_with(
+        all_platforms=all_platforms
+    )
+
+
 @pytest.mark.parametrize("app_metadata", [{"enable_pro_support": True}], indirect=True)
 @pytest.mark.parametrize(("pro_service_dict", "pro_service_args"), PRO_SERVICE_COMMANDS)
 @pytest.mark.parametrize(("build_env_dict", "build_env_args"), BUILD_ENV_COMMANDS)
@@ -16,12 +16,14 @@
 """Tests for remote-build commands."""
 
 import argparse
+import concurrent.futures
 
 import pytest
 from craft_application.commands import RemoteBuild
 from craft_application.errors import RemoteBuildError
 from craft_application.launchpad.models import BuildState
 from craft_application.services import RemoteBuildService
+from craft_application.services.remotebuild import BuildOutputs
 from craft_cli import emit
 
 
@@ -69,26 +71,24 @@ def test_remote_build_run(remote_build, mocker, fake_services, tmp_path, emitter
         },
     ]
 
-    mocker.patch.object(
-        builder, "start_builds", return_value=["arch1", "arch2", "arch3", "arch4"]
-    )
+    builds = [mocker.Mock(arch_tag=f"arch{i}") for i in range(1, 5)]
+    mocker.patch.object(builder, "start_builds", return_value=builds)
     mocker.patch.object(builder, "monitor_builds", side_effect=[build_states])
 
-    logs = {
-        "arch1": tmp_path / "log1.txt",
-        "arch2": tmp_path / "log2.txt",
-        "arch3": tmp_path / "log3.txt",
-        "arch4": tmp_path / "log4.txt",
-    }
-    mocker.patch.object(builder, "fetch_logs", return_value=logs)
-
-    artifacts = [
-        tmp_path / "art1.zip",
-        tmp_path / "art2.zip",
-        tmp_path / "art3.zip",
-        tmp_path / "art4.zip",
-    ]
-    mocker.patch.object(builder, "fetch_artifacts", return_value=artifacts)
+    def fake_fetch_build_outputs(arch, output_dir):
+        future = concurrent.futures.Future()
+        future.set_result(
+            BuildOutputs(
+                arch=arch,
+                log=tmp_path / f"log{arch[-1]}.txt",
+                artifacts=[tmp_path / f"art{arch[-1]}.zip"],
+            )
+        )
+        return future
+
+    mock_fetch = mocker.patch.object(
+        builder, "fetch_build_outputs", side_effect=fake_fetch_build_outputs
+    )
 
     parsed_args = argparse.Namespace(
         launchpad_accept_public_upload=True,
@@ -107,8 +107,13 @@ def test_remote_build_run(remote_build, mocker, fake_services, tmp_path, emitter
         "Stopped: arch4; Building: arch2; Uploading: arch1; Pending: arch3"
     )
     emitter.assert_progress("Stopped: arch4; Succeeded: arch1, arch2, arch3")
-    emitter.assert_progress("Fetching 4 build logs...")
-    emitter.assert_progress("Fetching build artifacts...")
+    # Each build's outputs are fetched once, as soon as that build stops.
+    assert [call.args[0] for call in mock_fetch.mock_calls] == [
+        "arch4",
+        "arch1",
+        "arch2",
+        "arch3",
+    ]
     emitter.assert_message(
         "Build completed.\n"
         "Log files: log1.txt, log2.txt, log3.txt, log4.txt\n"
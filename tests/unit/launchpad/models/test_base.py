@@ -102,6 +102,29 @@ def test_dir_lp_attributes(fake_obj, mock_lplib_entry):
     assert {"abc", "def", "ghi"}.issubset(dir(fake_obj))
 
 
+def test_dir_excludes_caches(fake_obj, mock_lplib_entry):
+    mock_lplib_entry.lp_attributes = ["abc"]
+    assert fake_obj.abc == mock_lplib_entry.abc
+
+    assert not {"_lp_names", "_lp_objects"} & set(dir(fake_obj))
+
+
+def test_attribute_specs_per_class(fake_launchpad, mock_lplib_entry):
+    class ParentObject(FakeLaunchpadObject):
+        parent_attr: str
+
+    class ChildObject(ParentObject):
+        child_attr: str
+
+    parent = ParentObject(fake_launchpad, mock_lplib_entry)
+    child = ChildObject(fake_launchpad, mock_lplib_entry)
+
+    assert set(parent._get_attribute_specs()) == {"parent_attr"}
+    assert set(child._get_attribute_specs()) == {"child_attr"}
+    assert ParentObject._get_attribute_specs() is parent._get_attribute_specs()
+    assert "_attribute_specs" not in vars(parent)
+
+
 def test_getattr_with_annotations(fake_launchpad, mock_lplib_entry):
     class AnnotationsObject(FakeLaunchpadObject):
         some_attribute_right_here: str
@@ -159,3 +182,57 @@ def test_setattr_protected_attributes(fake_obj, item):
     setattr(fake_obj, item, expected)
 
     assert getattr(fake_obj, item) is expected
+
+
+def test_getattr_caches_lp_names(fake_obj, mock_lplib_entry):
+    lp_attributes = mock.PropertyMock(return_value=["abcd", "efgh"])
+    type(mock_lplib_entry).lp_attributes = lp_attributes
+
+    assert fake_obj.abcd == mock_lplib_entry.abcd
+    assert fake_obj.efgh == mock_lplib_entry.efgh
+    lp_attributes.assert_called_once_with()
+
+    fake_obj.lp_refresh()
+    assert fake_obj.abcd == mock_lplib_entry.abcd
+
+    assert lp_attributes.call_count == 2
+
+
+def test_getattr_no_lp_names_cache(fake_launchpad, mock_lplib_entry):
+    class UncachedObject(FakeLaunchpadObject):
+        _cache_lp_names = False
+
+    test_obj = UncachedObject(fake_launchpad, mock_lplib_entry)
+    lp_attributes = mock.PropertyMock(return_value=["abcd"])
+    type(mock_lplib_entry).lp_attributes = lp_attributes
+
+    assert test_obj.abcd == mock_lplib_entry.abcd
+    assert test_obj.abcd == mock_lplib_entry.abcd
+
+    assert lp_attributes.call_count == 2
+
+
+def test_getattr_caches_lp_objects(fake_launchpad, mock_lplib_entry):
+    class ChildObject(FakeLaunchpadObject):
+        pass
+
+    class ParentObject(FakeLaunchpadObject):
+        child: ChildObject
+
+    mock_lplib_entry.child = mock.MagicMock(
+        __class__=Entry, resource_type_link="http://blah#this"
+    )
+    test_obj = ParentObject(fake_launchpad, mock_lplib_entry)
+
+    child = test_obj.child
+
+    assert isinstance(child, ChildObject)
+    assert child.get_entry() is mock_lplib_entry.child
+    assert test_obj.child is child
+
+    test_obj.lp_refresh()
+    assert test_obj.child is not child
+
+    new_entry = mock.MagicMock(__class__=Entry, resource_type_link="http://blah#this")
+    test_obj.child = new_entry
+    assert test_obj.child.get_entry() is new_entry
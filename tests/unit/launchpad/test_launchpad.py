@@ -22,9 +22,12 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     import enum
 
+import concurrent.futures
+import os
 import pathlib
 from unittest import mock
 
+import httplib2
 import launchpadlib.launchpad
 import launchpadlib.uris
 import lazr.restfulclient.errors
@@ -163,6 +166,112 @@ def test_set_username_logged_in(fake_launchpad):
     assert fake_launchpad.username == "test_user"
 
 
+def test_username_is_lazy():
+    lp = mock.Mock()
+    client = launchpad.Launchpad("testcraft", lp)
+
+    assert lp.mock_calls == []
+
+    lp.me.name = "lazy_user"
+    assert client.username == "lazy_user"
+
+
+def test_username_anonymous():
+    lp = mock.Mock()
+    type(lp).me = mock.PropertyMock(
+        side_effect=lazr.restfulclient.errors.Unauthorized(mock.Mock(), b"")
+    )
+
+    assert launchpad.Launchpad("testcraft", lp).username == "anonymous"
+
+
+@pytest.fixture
+def service_root_http(tmp_path, mocker):
+    """A caching HTTP client whose network requests are mocked."""
+    mock_request = mocker.patch.object(
+        launchpadlib.launchpad.LaunchpadOAuthAwareHttp,
+        "request",
+        return_value=(httplib2.Response({"status": "200"}), b"<wadl/>"),
+    )
+    root = mock.Mock(_root_uri="https://api.launchpad.net/devel/")
+    http = launchpad.launchpad._ServiceRootCachingHttp(
+        root, None, None, httplib2.FileCache(str(tmp_path)), None, None
+    )
+    return http, mock_request
+
+
+def test_per_thread_http():
+    factory = mock.Mock(side_effect=lambda: mock.Mock(spec=httplib2.Http))
+    http = launchpad.launchpad._PerThreadHttp(factory)
+    main_http = http.http
+    http.request("https://example.com")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        thread_http = executor.submit(lambda: http.http).result()
+
+    assert http.http is main_http
+    assert thread_http is not main_http
+    assert factory.call_count == 2
+    main_http.request.assert_called_once_with("https://example.com")
+
+
+def test_service_root_cache(service_root_http):
+    http, mock_request = service_root_http
+    headers = {"Accept": "application/vnd.sun.wadl+xml"}
+
+    first = http.request("https://api.launchpad.net/devel/", headers=headers)
+    second = http.request("https://api.launchpad.net/devel/", headers=headers)
+
+    mock_request.assert_called_once()
+    assert first[1] == second[1] == b"<wadl/>"
+    assert second[0].status == 200
+    assert second[0]["content-type"] == "application/vnd.sun.wadl+xml"
+    assert second[0].fromcache
+
+
+def test_service_root_cache_by_media_type(service_root_http):
+    http, mock_request = service_root_http
+
+    http.request("https://api.launchpad.net/devel/", headers={"Accept": "a/b"})
+    http.request("https://api.launchpad.net/devel/", headers={"Accept": "c/d"})
+
+    assert mock_request.call_count == 2
+
+
+def test_service_root_cache_expired(service_root_http):
+    http, mock_request = service_root_http
+    headers = {"Accept": "application/json"}
+    http.request("https://api.launchpad.net/devel/", headers=headers)
+    (cache_file,) = pathlib.Path(http.cache.cache).glob("service-root-v*/*")
+    expired = (
+        cache_file.stat().st_mtime - launchpad.launchpad.SERVICE_ROOT_CACHE_MAX_AGE
+    )
+    os.utime(cache_file, (expired, expired))
+
+    http.request("https://api.launchpad.net/devel/", headers=headers)
+
+    assert mock_request.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("uri", "method", "status"),
+    [
+        pytest.param("https://api.launchpad.net/devel/~me", "GET", 200, id="not-root"),
+        pytest.param("https://api.launchpad.net/devel/", "POST", 200, id="post"),
+        pytest.param("https://api.launchpad.net/devel/", "GET", 503, id="error"),
+    ],
+)
+def test_service_root_cache_skipped(service_root_http, uri, method, status):
+    http, mock_request = service_root_http
+    mock_request.return_value = (httplib2.Response({"status": str(status)}), b"")
+    headers = {"Accept": "application/json"}
+
+    http.request(uri, method, headers=headers)
+    http.request(uri, method, headers=headers)
+
+    assert mock_request.call_count == 2
+
+
 def test_repr(fake_launchpad):
     assert repr(fake_launchpad) == "Launchpad('testcraft')"
 
@@ -0,0 +1,237 @@
+# This file is part of craft-application.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for the cache of file linter issues."""
+
+import pathlib
+import sys
+
+import pytest
+from craft_application.lint import (
+    AbstractFileLinter,
+    CacheStats,
+    FileEntry,
+    LintCache,
+    LintContext,
+    LinterIssue,
+    Severity,
+    Stage,
+)
+from craft_application.lint._files import MAX_MAPPED_FILES
+
+
+class _TodoLinter(AbstractFileLinter):
+    name = "test.todo"
+    stage = Stage.POST
+
+    def lint_file(self, ctx: LintContext, entry: FileEntry):
+        if ctx.files.content(entry.path).find(b"TODO") != -1:
+            yield LinterIssue(
+                id="T001",
+                message="file has a TODO",
+                severity=Severity.WARNING,
+                filename=str(entry.path),
+                url="https://example.com/todo",
+            )
+        if entry.path.name == "elsewhere.txt":
+            yield LinterIssue(
+                id="T002",
+                message="issue in another file",
+                severity=Severity.ERROR,
+                filename="/elsewhere/file.txt",
+            )
+
+
+def _make_tree(root: pathlib.Path) -> pathlib.Path:
+    (root / "dir").mkdir(parents=True)
+    (root / "todo.txt").write_text("TODO")
+    (root / "dir" / "clean.txt").write_text("clean")
+    (root / "elsewhere.txt").write_text("")
+    return root
+
+
+def _run(cache: LintCache, root: pathlib.Path, linter=None) -> list[LinterIssue]:
+    ctx = LintContext(project_dir=root, artifact_dirs=[root])
+    return list(cache.run(linter or _TodoLinter(), ctx))
+
+
+@pytest.fixture
+def cache_path(tmp_path: pathlib.Path) -> pathlib.Path:
+    return tmp_path / "work" / ".lint-cache.json"
+
+
+def test_file_linter_run(tmp_path: pathlib.Path):
+    root = _make_tree(tmp_path / "prime")
+    ctx = LintContext(project_dir=tmp_path, artifact_dirs=[root])
+
+    issues = list(_TodoLinter().run(ctx))
+
+    assert [(issue.id, issue.filename) for issue in issues] == [
+        ("T002", "/elsewhere/file.txt"),
+        ("T001", str(root / "todo.txt")),
+    ]
+
+
+def test_replay(mocker, tmp_path: pathlib.Path, cache_path: pathlib.Path):
+    root = _make_tree(tmp_path / "prime")
+    first = LintCache.load(cache_path)
+    issues = _run(first, root)
+    first.save()
+    spy_lint = mocker.spy(_TodoLinter, "lint_file")
+
+    second = LintCache.load(cache_path)
+
+    assert _run(second, root) == issues
+    assert spy_lint.call_count == 0
+    assert first.stats == {"test.todo": CacheStats(hits=0, misses=3)}
+    assert second.stats == {"test.todo": CacheStats(hits=3, misses=0)}
+
+
+def test_changed_file(tmp_path: pathlib.Path, cache_path: pathlib.Path):
+    root = _make_tree(tmp_path / "prime")
+    cache = LintCache.load(cache_path)
+    _run(cache, root)
+    cache.save()
+    (root / "dir" / "clean.txt").write_text("TODO")
+    (root / "todo.txt").unlink()
+
+    cache = LintCache.load(cache_path)
+    issues = _run(cache, root)
+
+    assert [issue.filename for issue in issues] == [
+        str(root / "dir" / "clean.txt"),
+        "/elsewhere/file.txt",
+    ]
+    assert cache.stats == {"test.todo": CacheStats(hits=1, misses=1)}
+
+
+def test_moved_root(tmp_path: pathlib.Path, cache_path: pathlib.Path):
+    """Cached filenames follow the artifact directory, e.g. a new temporary dir."""
+    cache = LintCache.load(cache_path)
+    _run(cache, _make_tree(tmp_path / "first"))
+    cache.save()
+    root = _make_tree(tmp_path / "second")
+
+    cache = LintCache.load(cache_path)
+    issues = _run(cache, root)
+
+    assert [issue.filename for issue in issues] == [
+        "/elsewhere/file.txt",
+        str(root / "todo.txt"),
+    ]
+    assert cache.stats == {"test.todo": CacheStats(hits=3, misses=0)}
+
+
+@pytest.mark.parametrize(
+    ("attribute", "value"),
+    [
+        ("version", "2"),
+        ("cache_key", lambda self, ctx: "ubuntu@24.04"),
+    ],
+)
+def test_linter_key_changed(
+    tmp_path: pathlib.Path, cache_path: pathlib.Path, attribute: str, value
+):
+    root = _make_tree(tmp_path / "prime")
+    cache = LintCache.load(cache_path)
+    _run(cache, root)
+    cache.save()
+    linter_cls = type(_TodoLinter)(
+        "_TodoLinter", (_TodoLinter,), {"name": "test.todo", attribute: value}
+    )
+
+    cache = LintCache.load(cache_path)
+    _run(cache, root, linter_cls())
+
+    assert cache.stats == {"test.todo": CacheStats(hits=0, misses=3)}
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "",
+        "not json",
+        '{"version": 0, "linters": {}}',
+        '{"version": 1, "linters": []}',
+        '{"version": 1, "linters": {"test.todo": []}}',
+        '{"version": 1, "linters": {"test.todo": {"key": ["1", ""], "files": 1}}}',
+        (
+            '{"version": 1, "linters": {"test.todo": {"key": ["1", ""], '
+            '"files": {"todo.txt": {"digest": 1}}}}}'
+        ),
+    ],
+)
+def test_load_invalid(tmp_path: pathlib.Path, cache_path: pathlib.Path, content: str):
+    root = _make_tree(tmp_path / "prime")
+    cache_path.parent.mkdir()
+    cache_path.write_text(content)
+
+    cache = LintCache.load(cache_path)
+    issues = _run(cache, root)
+
+    assert len(issues) == 2
+    assert cache.stats == {"test.todo": CacheStats(hits=0, misses=3)}
+
+
+def test_save_error(emitter, tmp_path: pathlib.Path):
+    (tmp_path / "file").touch()
+    cache = LintCache(tmp_path / "file" / "cache.json")
+
+    cache.save()
+
+    emitter.assert_debug(
+        f"Could not save the lint cache: [Errno 17] File exists: '{tmp_path / 'file'}'"
+    )
+
+
+def test_incomplete_run_not_cached(tmp_path: pathlib.Path, cache_path: pathlib.Path):
+    root = _make_tree(tmp_path / "prime")
+    cache = LintCache.load(cache_path)
+
+    next(cache.run(_TodoLinter(), LintContext(tmp_path, [root])))
+    cache.save()
+
+    assert cache.stats == {}
+    assert LintCache.load(cache_path).stats == {}
+    assert '"linters": {}' in cache_path.read_text()
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Counts open fds in /proc")
+def test_large_tree(tmp_path: pathlib.Path, cache_path: pathlib.Path):
+    """Caching a tree with more files than the open-file limit doesn't run out."""
+    resource = pytest.importorskip("resource")
+    root = tmp_path / "prime"
+    for number in range(1500):
+        directory = root / f"dir-{number % 10}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"file-{number}.txt").write_text("TODO" if number % 3 else "")
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    open_fds = len(list(pathlib.Path("/proc/self/fd").iterdir()))
+    limit = min(open_fds + MAX_MAPPED_FILES + 16, 1000)
+
+    resource.setrlimit(resource.RLIMIT_NOFILE, (limit, hard))
+    try:
+        first = LintCache.load(cache_path)
+        issues = _run(first, root)
+        first.save()
+        second = LintCache.load(cache_path)
+        replayed = _run(second, root)
+    finally:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+
+    assert len(issues) == 1000
+    assert replayed == issues
+    assert first.stats == {"test.todo": CacheStats(hits=0, misses=1500)}
+    assert second.stats == {"test.todo": CacheStats(hits=1500, misses=0)}
@@ -0,0 +1,209 @@
+# This file is part of craft-application.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for the linters' shared file index."""
+
+import hashlib
+import pathlib
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from craft_application.lint import FileIndex, LintContext, _files
+
+
+@pytest.fixture
+def tree(tmp_path: pathlib.Path) -> pathlib.Path:
+    root = tmp_path / "prime"
+    (root / "bin").mkdir(parents=True)
+    (root / "bin" / "hello").write_bytes(b"\x7fELF" + bytes(8000))
+    (root / "bin" / "hello").chmod(0o755)
+    (root / "empty").write_bytes(b"")
+    (root / "link").symlink_to("bin")
+    return root
+
+
+def test_entries(tree: pathlib.Path):
+    index = FileIndex()
+
+    entries = index.entries(tree)
+
+    assert [entry.path.relative_to(tree).as_posix() for entry in entries] == [
+        "bin",
+        "bin/hello",
+        "empty",
+        "link",
+    ]
+    directory, binary, empty, link = entries
+    assert directory.is_dir
+    assert binary.is_file
+    assert binary.size == 8004
+    assert binary.mode & 0o777 == 0o755
+    assert binary.mtime == (tree / "bin" / "hello").stat().st_mtime
+    assert empty.size == 0
+    assert link.is_symlink
+    assert not link.is_dir
+    assert index.get(tree / "bin" / "hello") is binary
+
+
+def test_entries_walks_once(mocker, tree: pathlib.Path):
+    index = FileIndex()
+    spy_scandir = mocker.spy(pathlib.os, "scandir")
+
+    first = index.entries(tree)
+    (tree / "new").write_text("new")
+
+    assert index.entries(tree) is first
+    assert spy_scandir.call_count == 2  # The root and bin/
+
+
+def test_entries_missing(tmp_path: pathlib.Path):
+    assert FileIndex().entries(tmp_path / "missing") == []
+
+
+def test_get_missing(tmp_path: pathlib.Path):
+    with pytest.raises(FileNotFoundError):
+        FileIndex().get(tmp_path / "missing")
+
+
+def test_head(mocker, tree: pathlib.Path):
+    index = FileIndex()
+    path = tree / "bin" / "hello"
+    data = path.read_bytes()
+    spy_open = mocker.spy(pathlib.Path, "open")
+
+    assert index.head(path, 4) == b"\x7fELF"
+    assert index.head(path) == data[:4096]
+    assert spy_open.call_count == 1
+    assert index.head(path, 5000) == data[:5000]
+    assert spy_open.call_count == 2
+    # A small file is read whole, so a larger head doesn't need another read.
+    assert index.head(tree / "empty") == b""
+    assert index.head(tree / "empty", 10_000) == b""
+    assert spy_open.call_count == 3
+
+
+def test_content_and_digest(mocker, tree: pathlib.Path):
+    index = FileIndex()
+    path = tree / "bin" / "hello"
+    data = path.read_bytes()
+    spy_open = mocker.spy(pathlib.Path, "open")
+
+    content = index.content(path)
+
+    assert content[:] == data
+    assert index.content(path) is content
+    assert index.digest(path) == hashlib.sha256(data).hexdigest()
+    assert index.head(path, 4) == b"\x7fELF"
+    assert spy_open.call_count == 1
+    assert index.content(tree / "empty") == b""
+    assert index.digest(tree / "empty") == hashlib.sha256(b"").hexdigest()
+
+
+def test_digest_reads_file(mocker, tree: pathlib.Path):
+    index = FileIndex()
+    path = tree / "bin" / "hello"
+    spy_mmap = mocker.spy(_files.mmap, "mmap")
+
+    assert index.digest(path) == hashlib.sha256(path.read_bytes()).hexdigest()
+    spy_mmap.assert_not_called()
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Counts open fds in /proc")
+def test_open_files_bounded(tmp_path: pathlib.Path):
+    """Digesting or mapping many files doesn't keep a descriptor open for each."""
+    resource = pytest.importorskip("resource")
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    open_fds = len(list(pathlib.Path("/proc/self/fd").iterdir()))
+    limit = open_fds + _files.MAX_MAPPED_FILES + 16
+    paths = []
+    for number in range(limit * 2):
+        path = tmp_path / f"file-{number}"
+        path.write_text(str(number))
+        paths.append(path)
+    index = FileIndex()
+
+    resource.setrlimit(resource.RLIMIT_NOFILE, (limit, hard))
+    try:
+        digests = [index.digest(path) for path in paths]
+        contents = [bytes(index.content(path)) for path in paths]
+    finally:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+        index.close()
+
+    assert digests == [
+        hashlib.sha256(str(number).encode()).hexdigest() for number in range(limit * 2)
+    ]
+    assert contents == [str(number).encode() for number in range(limit * 2)]
+
+
+@pytest.mark.parametrize(
+    ("method", "loader"),
+    [
+        ("entries", "_walk"),
+        ("content", "_map_file"),
+        ("digest", "_get_file_digest"),
+        ("head", "_read_head"),
+    ],
+)
+def test_concurrent_requests_load_once(mocker, tree: pathlib.Path, method, loader):
+    index = FileIndex()
+    path = tree if method == "entries" else tree / "bin" / "hello"
+    original = getattr(_files, loader)
+
+    def slow_loader(*args):
+        time.sleep(0.2)
+        return original(*args)
+
+    spy_loader = mocker.patch.object(_files, loader, side_effect=slow_loader)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: getattr(index, method)(path), range(4)))
+
+    assert spy_loader.call_count == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_failed_load_retried(tmp_path: pathlib.Path):
+    index = FileIndex()
+    path = tmp_path / "late"
+
+    with pytest.raises(FileNotFoundError):
+        index.digest(path)
+    path.write_text("here now")
+
+    assert index.digest(path) == hashlib.sha256(b"here now").hexdigest()
+
+
+def test_close(tree: pathlib.Path):
+    index = FileIndex()
+    path = tree / "bin" / "hello"
+    content = index.content(path)
+
+    index.close()
+
+    assert content.closed
+    assert index.content(path) is not content
+    assert index.digest(path) == hashlib.sha256(path.read_bytes()).hexdigest()
+    index.close()
+
+
+def test_lint_context_files(tmp_path: pathlib.Path):
+    ctx = LintContext(project_dir=tmp_path, artifact_dirs=[])
+
+    assert isinstance(ctx.files, FileIndex)
+    assert ctx == LintContext(project_dir=tmp_path, artifact_dirs=[])
+    assert LintContext(project_dir=tmp_path, artifact_dirs=[]).files is not ctx.files
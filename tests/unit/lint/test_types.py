@@ -0,0 +1,90 @@
+# This file is part of craft-application.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for linter ignore rules."""
+
+import pytest
+from craft_application.lint import (
+    IgnoreConfig,
+    IgnoreMatcher,
+    IgnoreSpec,
+    LinterIssue,
+    Severity,
+    compile_ignore_config,
+    should_ignore,
+)
+
+IGNORE_CONFIG: IgnoreConfig = {
+    "all": IgnoreSpec(ids="*", by_filename={"E001": {"*.txt"}}),
+    "ids": IgnoreSpec(ids={"E001", "E002"}, by_filename={}),
+    "globs": IgnoreSpec(
+        ids={"E001"},
+        by_filename={
+            "E002": {"*.md", "docs/*", "file[0-9].py"},
+            "E003": {"exact.yaml"},
+            "E004": set(),
+        },
+    ),
+    "special": IgnoreSpec(ids=set(), by_filename={"E001": {"a+b (1).txt", "?.c"}}),
+}
+
+
+def _issue(issue_id: str, filename: str) -> LinterIssue:
+    return LinterIssue(
+        id=issue_id, message="message", severity=Severity.WARNING, filename=filename
+    )
+
+
+@pytest.mark.parametrize("linter_name", [*IGNORE_CONFIG, "unknown"])
+@pytest.mark.parametrize("issue_id", ["E001", "E002", "E003", "E004", "E005"])
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "README.md",
+        "docs/index.rst",
+        "docs/nested/index.rst",
+        "file1.py",
+        "file10.py",
+        "exact.yaml",
+        "not-exact.yaml",
+        "a+b (1).txt",
+        "ab (1).txt",
+        "x.c",
+        "xy.c",
+        "multi\nline.md",
+    ],
+)
+def test_matches_should_ignore(linter_name: str, issue_id: str, filename: str):
+    issue = _issue(issue_id, filename)
+    matchers = compile_ignore_config(IGNORE_CONFIG)
+    matcher = matchers.get(linter_name)
+
+    expected = should_ignore(linter_name, issue, IGNORE_CONFIG)
+
+    assert (matcher is not None and matcher.matches(issue)) == expected
+
+
+def test_from_spec():
+    matcher = IgnoreMatcher.from_spec(IGNORE_CONFIG["globs"])
+
+    assert not matcher.ignore_all
+    assert matcher.ids == {"E001"}
+    assert set(matcher.by_filename) == {"E002", "E003"}
+
+
+def test_from_spec_ignore_all():
+    assert IgnoreMatcher.from_spec(IGNORE_CONFIG["all"]) == IgnoreMatcher(
+        ignore_all=True
+    )
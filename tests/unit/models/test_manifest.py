@@ -22,6 +22,7 @@ from craft_application import util
 from craft_application.models.manifest import (
     CraftManifest,
     ProjectManifest,
+    SessionArtifact,
     SessionArtifactManifest,
 )
 from freezegun import freeze_time
@@ -105,3 +106,62 @@ def test_session_report_rejections(session_report):
         "the artifact format is unknown",
         "the request was not recognized by any format inspector",
     ]
+
+
+def test_session_artifact_matches_manifest(session_report):
+    artifacts = SessionArtifact.from_session_report(session_report)
+    deps = SessionArtifactManifest.from_session_report(session_report)
+
+    assert [a.marshal() for a in artifacts] == [d.marshal() for d in deps]
+    assert [(a.rejected, list(a.rejection_reasons)) for a in artifacts] == [
+        (d.rejected, d.rejection_reasons) for d in deps
+    ]
+
+
+def test_session_artifact_is_compact(session_report):
+    artifact = SessionArtifact.from_session_report(session_report)[0]
+
+    assert not hasattr(artifact, "__dict__")
+    with pytest.raises(AttributeError):
+        artifact.size = 0  # type: ignore[misc]
+
+
+@pytest.mark.parametrize(
+    ("version", "expected"),
+    [("1.0", "1.0"), (2, "2"), (2.5, "2.5")],
+)
+def test_session_artifact_coerces_numbers(session_report, version, expected):
+    artifact = session_report["artifacts"][0]
+    artifact["metadata"]["version"] = version
+
+    assert SessionArtifact.from_report_artifact(artifact).component_version == (
+        expected
+    )
+
+
+@pytest.mark.parametrize("version", [None, True, ["1.0"]])
+def test_session_artifact_invalid_string(session_report, version):
+    artifact = session_report["artifacts"][0]
+    artifact["metadata"]["version"] = version
+
+    with pytest.raises(TypeError, match="Expected a string in the session report"):
+        SessionArtifact.from_report_artifact(artifact)
+
+
+@pytest.mark.skipif(
+    craft_platforms.DebianArchitecture.from_host() != "amd64",
+    reason="https://github.com/canonical/craft-application/issues/1032",
+)
+def test_marshal_craft_manifest(tmp_path, project_manifest, session_report):
+    project_manifest_path = tmp_path / "project-manifest.yaml"
+    project_manifest.to_yaml_file(project_manifest_path)
+
+    data = CraftManifest.marshal_craft_manifest(
+        project_manifest_path, SessionArtifact.from_session_report(session_report)
+    )
+
+    assert data == (
+        CraftManifest.create_craft_manifest(
+            project_manifest_path, session_report
+        ).marshal()
+    )
@@ -25,7 +25,7 @@ import pytest
 import pytest_check
 import pytest_mock
 from craft_application.errors import EmptyBuildPlanError
-from craft_application.services.buildplan import BuildPlanService
+from craft_application.services.buildplan import BuildPlanService, _BuildPlanIndex
 from craft_application.services.service_factory import ServiceFactory
 from craft_cli.pytest_plugin import RecordingEmitter
 from craft_platforms import BuildInfo, DebianArchitecture, DistroBase
@@ -681,3 +681,139 @@ def test_set_build_fors_resets_cached_plan(
         build_for=["riscv64"],
         build_on=[craft_platforms.DebianArchitecture.from_host()],
     )
+
+
+def test_plan_empty_is_cached(
+    mocker: pytest_mock.MockFixture,
+    build_plan_service: BuildPlanService,
+):
+    mock_creator = mocker.patch.object(
+        build_plan_service, "create_build_plan", return_value=[]
+    )
+
+    for _ in range(2):
+        with pytest.raises(EmptyBuildPlanError):
+            build_plan_service.plan()
+
+    mock_creator.assert_called_once()
+
+
+def test_create_build_plan_reuses_exhaustive_plan(
+    mocker: pytest_mock.MockFixture,
+    build_plan_service: BuildPlanService,
+    fake_services: ServiceFactory,
+    fake_platform,
+    fake_host_architecture,
+):
+    project_service = fake_services.get("project")
+    raw_project = project_service.get_raw()
+    raw_project["platforms"] = project_service.get_platforms()
+    exhaustive_plan = list(
+        build_plan_service._gen_exhaustive_build_plan(project_data=raw_project)
+    )
+    spy_gen = mocker.spy(build_plan_service, "_gen_exhaustive_build_plan")
+
+    for platforms, build_for, build_on in [
+        (None, None, None),
+        ([fake_platform], None, None),
+        (None, ["all"], None),
+        (None, None, [fake_host_architecture]),
+        ([fake_platform], None, [fake_host_architecture]),
+    ]:
+        plan = build_plan_service.create_build_plan(
+            platforms=platforms, build_for=build_for, build_on=build_on
+        )
+        assert plan == list(
+            build_plan_service._filter_plan(
+                exhaustive_plan,
+                platforms=platforms,
+                build_for=build_for,
+                build_on=build_on,
+            )
+        )
+
+    spy_gen.assert_called_once()
+
+
+def test_create_build_plan_project_changed(
+    mocker: pytest_mock.MockFixture,
+    build_plan_service: BuildPlanService,
+    fake_services: ServiceFactory,
+):
+    spy_gen = mocker.spy(build_plan_service, "_gen_exhaustive_build_plan")
+    project_service = fake_services.get("project")
+    build_plan_service.create_build_plan(platforms=None, build_for=None, build_on=None)
+
+    mocker.patch.object(
+        project_service,
+        "_load_raw_project",
+        return_value=project_service.get_raw(),
+    )
+    build_plan_service.create_build_plan(platforms=None, build_for=None, build_on=None)
+    build_plan_service.create_build_plan(platforms=None, build_for=None, build_on=None)
+
+    assert spy_gen.call_count == 2
+
+
+def test_create_build_plan_custom_filter(app_metadata, fake_services: ServiceFactory):
+    class CustomBuildPlanService(BuildPlanService):
+        def _filter_plan(self, exhaustive_build_plan, **kwargs):
+            # Ignore the filters and keep only the last build.
+            *_, last = exhaustive_build_plan
+            yield last
+
+    service = CustomBuildPlanService(app_metadata, fake_services)
+    service.setup()
+    unfiltered = service.create_build_plan(
+        platforms=None, build_for=None, build_on=None
+    )
+
+    assert (
+        service.create_build_plan(
+            platforms=["not-a-platform"], build_for=None, build_on=None
+        )
+        == unfiltered
+    )
+
+
+@pytest.mark.parametrize(
+    ("platforms", "build_for", "build_on", "expected"),
+    [
+        (
+            None,
+            None,
+            None,
+            [
+                _pc_on_amd64_for_amd64,
+                _pc_on_amd64_for_i386,
+                _amd64_on_amd64_for_amd64,
+                _i386_on_amd64_for_i386,
+            ],
+        ),
+        (["i386", "pc"], None, None, [_pc_on_amd64_for_amd64, _i386_on_amd64_for_i386]),
+        (
+            None,
+            [DebianArchitecture.I386],
+            None,
+            [_pc_on_amd64_for_i386, _i386_on_amd64_for_i386],
+        ),
+        (["pc", "legacy-pc"], [DebianArchitecture.I386], None, [_pc_on_amd64_for_i386]),
+        (None, None, [DebianArchitecture.RISCV64], []),
+        ([], None, None, []),
+    ],
+)
+def test_build_plan_index_select(platforms, build_for, build_on, expected):
+    index = _BuildPlanIndex(
+        project={},
+        plan=[
+            _pc_on_amd64_for_amd64,
+            _pc_on_amd64_for_i386,
+            _amd64_on_amd64_for_amd64,
+            _i386_on_amd64_for_i386,
+        ],
+    )
+
+    assert (
+        index.select(platforms=platforms, build_for=build_for, build_on=build_on)
+        == expected
+    )
@@ -183,12 +183,38 @@ def test_snap_config_handler(snap_config_handler, item: str, content: str):
     ):
         mp.setattr("snaphelpers._ctl.Popen", subprocess.Popen)
         fp.register(
-            ["/usr/bin/snapctl", "get", "-d", snap_item],
+            ["/usr/bin/snapctl", "get", "-d"],
             stdout=json.dumps({snap_item: content}),
         )
+        snap_config_handler.invalidate()
         assert snap_config_handler.get_raw(item) == content
 
 
+def test_snap_config_handler_reads_once(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_process: pytest_subprocess.FakeProcess,
+    snap_config_handler,
+):
+    monkeypatch.setattr("snaphelpers._ctl.Popen", subprocess.Popen)
+    command = ["/usr/bin/snapctl", "get", "-d"]
+    fake_process.register(
+        command, stdout=json.dumps({"lxd-remote": "remote", "nested": {"a": "b"}})
+    )
+    fake_process.register(command, stdout=json.dumps({"lxd-remote": "changed"}))
+    snap_config_handler.invalidate()
+
+    assert snap_config_handler.get_raw("lxd_remote") == "remote"
+    assert snap_config_handler.get_raw("nested.a") == "b"
+    with pytest.raises(KeyError, match="unknown snap config item: 'idle_mins'"):
+        snap_config_handler.get_raw("idle_mins")
+    assert fake_process.call_count(command) == 1
+
+    snap_config_handler.invalidate()
+
+    assert snap_config_handler.get_raw("lxd_remote") == "changed"
+    assert fake_process.call_count(command) == 2
+
+
 @pytest.mark.parametrize(
     ("item", "expected"),
     [
@@ -283,11 +309,69 @@ def test_get_all(
     monkeypatch.setattr("snaphelpers._ctl.Popen", subprocess.Popen)
     for key, value in environment_variables.items():
         monkeypatch.setenv(key, value)
-    for config_item in app_metadata.ConfigModel.model_fields:
-        fake_process.register(
-            f"/usr/bin/snapctl get -d {config_item.replace('_', '-')}", stdout="{}"
-        )
+    fake_process.register("/usr/bin/snapctl get -d", stdout="{}")
     config = fake_services.config.get_all()
     for var, value in environment_variables.items():
         config_name = var.partition("_")[2].lower()
         assert str(config[config_name]) == value
+
+
+@pytest.mark.usefixtures("production_mode")
+def test_config_service_memoizes(
+    mocker,
+    monkeypatch: pytest.MonkeyPatch,
+    fake_process: pytest_subprocess.FakeProcess,
+    fake_services,
+):
+    monkeypatch.setattr("snaphelpers._ctl.Popen", subprocess.Popen)
+    fake_process.register("/usr/bin/snapctl get -d", stdout="{}")
+    monkeypatch.setenv("CRAFT_PARALLEL_BUILD_COUNT", "3")
+    config_service = fake_services.get("config")
+    assert config_service.get("parallel_build_count") == 3
+    spy_resolve = mocker.spy(config_service, "_resolve")
+
+    assert config_service.get("parallel_build_count") == 3
+    assert config_service.get_all()["parallel_build_count"] == 3
+    assert "parallel_build_count" not in {
+        call.args[0] for call in spy_resolve.call_args_list
+    }
+
+    config_service.invalidate()
+
+    assert config_service.get("parallel_build_count") == 3
+    spy_resolve.assert_any_call("parallel_build_count")
+
+
+@pytest.mark.parametrize(
+    "variable", ["CRAFT_PARALLEL_BUILD_COUNT", "TESTCRAFT_PARALLEL_BUILD_COUNT"]
+)
+def test_config_service_environment_changed(
+    monkeypatch: pytest.MonkeyPatch,
+    fake_process: pytest_subprocess.FakeProcess,
+    fake_services,
+    variable,
+):
+    """Changing the environment resolves an item again without invalidating."""
+    monkeypatch.setattr("snaphelpers._ctl.Popen", subprocess.Popen)
+    fake_process.register("/usr/bin/snapctl get -d", stdout="{}")
+    monkeypatch.setenv(variable, "3")
+    config_service = fake_services.get("config")
+    assert config_service.get("parallel_build_count") == 3
+
+    monkeypatch.setenv(variable, "5")
+
+    assert config_service.get("parallel_build_count") == 5
+
+    monkeypatch.delenv(variable)
+
+    with pytest.raises(KeyError, match="has no default value"):
+        config_service.get("parallel_build_count")
+
+
+def test_config_service_caches_type_adapters(fake_services):
+    config_service = fake_services.get("config")
+
+    adapter = config_service._get_type_adapter(int)
+
+    assert config_service._get_type_adapter(int) is adapter
+    assert config_service._get_type_adapter(list[int]) is not adapter
@@ -18,7 +18,10 @@
 from __future__ import annotations
 
 import dataclasses
+import json
+import os
 import re
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest import mock
@@ -33,7 +36,7 @@ from craft_application import errors, models, util
 from craft_application.errors import EmptyBuildPlanError, PartsLifecycleError
 from craft_application.services import lifecycle
 from craft_application.util import repositories
-from craft_cli import CraftError
+from craft_cli import CraftError, EmitterMode, emit
 from craft_parts import (
     Action,
     ActionType,
@@ -70,6 +73,9 @@ class FakePartsLifecycle(lifecycle.LifecycleService):
         mock_lcm.project_info = mock_info
         return mock_lcm
 
+    def _get_trace_path(self) -> Path:
+        return Path(self._work_dir).parent / "lifecycle.trace.json"
+
 
 @pytest.fixture
 def fake_parts_lifecycle(app_metadata, fake_project, fake_services, tmp_path):
@@ -239,6 +245,48 @@ def test_get_step_failure(step_name):
         lifecycle._get_step(step_name)
 
 
+@pytest.mark.parametrize(
+    ("actions", "parts", "exclusive", "expected"),
+    [
+        pytest.param([], {}, [], [], id="empty"),
+        pytest.param(
+            [Action("a", Step.PULL), Action("b", Step.PULL), Action("a", Step.BUILD)],
+            {},
+            [False, False, False],
+            [set(), set(), {0}],
+            id="independent-parts",
+        ),
+        pytest.param(
+            [
+                Action("a", Step.PULL),
+                Action("b", Step.PULL),
+                Action("a", Step.BUILD),
+                Action("b", Step.BUILD),
+            ],
+            {"b": {"after": ["a"]}},
+            [False, False, False, False],
+            [set(), set(), {0}, {1, 2}],
+            id="after",
+        ),
+        pytest.param(
+            [
+                Action("a", Step.PULL),
+                Action("b", Step.PULL),
+                Action("a", Step.STAGE),
+                Action("c", Step.PULL),
+                Action("b", Step.BUILD),
+            ],
+            {},
+            [False, False, True, False, False],
+            [set(), set(), {0, 1}, {2}, {1, 2}],
+            id="exclusive",
+        ),
+    ],
+)
+def test_get_action_dependencies(actions, parts, exclusive, expected):
+    assert lifecycle._get_action_dependencies(actions, parts, exclusive) == expected
+
+
 # endregion
 # region PartsLifecycle tests
 def test_init_success(app_metadata, fake_project, fake_services, tmp_path):
@@ -541,6 +589,111 @@ def test_run_no_step(
     assert executor.method_calls == []
 
 
+@pytest.mark.parametrize(
+    ("action", "part", "manager_kwargs", "expected"),
+    [
+        (Action("my-part", Step.PULL), {}, {}, True),
+        (Action("my-part", Step.PULL), {"stage-packages": ["hello"]}, {}, False),
+        (Action("my-part", Step.PULL), {"stage-snaps": ["hello"]}, {}, False),
+        (Action("my-part", Step.BUILD), {}, {}, True),
+        (Action("my-part", Step.BUILD), {}, {"build_environment": ["A=b"]}, False),
+        (Action("my-part", Step.OVERLAY), {}, {}, False),
+        (Action("my-part", Step.STAGE), {}, {}, False),
+        (Action("my-part", Step.PRIME), {}, {}, False),
+    ],
+)
+def test_is_parallel_action(
+    fake_parts_lifecycle, action, part, manager_kwargs, expected
+):
+    fake_parts_lifecycle._project.parts["my-part"] = {"plugin": "nil", **part}
+    fake_parts_lifecycle._manager_kwargs.update(manager_kwargs)
+
+    assert fake_parts_lifecycle.is_parallel_action(action) == expected
+
+
+@pytest.fixture
+def parallel_lifecycle(monkeypatch, fake_parts_lifecycle):
+    monkeypatch.setenv("CRAFT_PARALLEL_LIFECYCLE", "1")
+    monkeypatch.setenv("CRAFT_PARALLEL_BUILD_COUNT", "2")
+    return fake_parts_lifecycle
+
+
+def test_exec_parallel(parallel_lifecycle, emitter):
+    actions = [
+        Action("a", Step.PULL),
+        Action("b", Step.PULL),
+        Action("a", Step.STAGE),
+    ]
+    executor = (
+        parallel_lifecycle._lcm.action_executor.return_value.__enter__.return_value
+    )
+    barrier = threading.Barrier(2, timeout=10)
+
+    def execute(action, stdout, stderr):
+        if action.step == Step.PULL:
+            # Both pulls must be running to get past the barrier.
+            barrier.wait()
+        os.write(stdout, f"output of {action.part_name}\n".encode())
+
+    executor.execute.side_effect = execute
+
+    parallel_lifecycle._exec(actions)
+
+    assert executor.execute.mock_calls[-1] == mock.call(
+        actions[2], stdout=mock.ANY, stderr=mock.ANY
+    )
+    executor.execute.assert_has_calls(
+        [mock.call(action, stdout=mock.ANY, stderr=mock.ANY) for action in actions],
+        any_order=True,
+    )
+    emitter.assert_progress("Pulling a")
+    emitter.assert_progress("Pulling b")
+    emitter.assert_progress("Staging a")
+
+
+def test_exec_parallel_error(parallel_lifecycle):
+    actions = [
+        Action("a", Step.PULL),
+        Action("b", Step.PULL),
+        Action("a", Step.BUILD),
+        Action("b", Step.BUILD),
+    ]
+    executor = (
+        parallel_lifecycle._lcm.action_executor.return_value.__enter__.return_value
+    )
+    error = craft_parts.PartsError("Pull failed")
+
+    def execute(action, stdout, stderr):
+        if action.part_name == "a":
+            raise error
+
+    executor.execute.side_effect = execute
+
+    with pytest.raises(craft_parts.PartsError) as exc_info:
+        parallel_lifecycle._exec(actions)
+
+    assert exc_info.value is error
+    assert mock.call(actions[2], stdout=mock.ANY, stderr=mock.ANY) not in (
+        executor.execute.mock_calls
+    )
+
+
+def test_exec_serial_by_default(fake_parts_lifecycle, monkeypatch):
+    monkeypatch.setenv("CRAFT_PARALLEL_BUILD_COUNT", "2")
+    actions = [Action("a", Step.PULL), Action("b", Step.PULL)]
+    executor = (
+        fake_parts_lifecycle._lcm.action_executor.return_value.__enter__.return_value
+    )
+    threads = []
+    executor.execute.side_effect = lambda *_, **__: threads.append(
+        threading.current_thread()
+    )
+
+    fake_parts_lifecycle._exec(actions)
+
+    assert threads == [threading.main_thread()] * 2
+
+
 @pytest.mark.parametrize(
     ("actions", "expected"),
     [
@@ -589,6 +742,229 @@ def test_run_resets_requires_repack_between_runs(
     assert fake_parts_lifecycle.requires_repack is False
 
 
+@pytest.fixture
+def plan_cache_lifecycle(
+    fake_parts_lifecycle, fake_services, fake_platform, fake_host_architecture, tmp_path
+):
+    fake_services.get("build_plan").set_platforms(fake_platform)
+    skip_if_build_plan_empty(fake_services.get("build_plan"))
+    source_dir = tmp_path / "source"
+    (source_dir / "subdir").mkdir(parents=True)
+    (source_dir / "subdir" / "file").write_text("content")
+    (source_dir / "ignored.craft").touch()
+    state_dir = tmp_path / "work" / "parts" / "some-part" / "state"
+    state_dir.mkdir(parents=True)
+    (state_dir / "pull").write_text("state")
+    fake_parts_lifecycle._project.parts["some-part"]["source"] = str(source_dir)
+    fake_parts_lifecycle._app = dataclasses.replace(
+        fake_parts_lifecycle._app, source_ignore_patterns=["*.craft"]
+    )
+    fake_parts_lifecycle._lcm.plan.return_value = [
+        Action(
+            "some-part",
+            Step.PULL,
+            action_type=ActionType.SKIP,
+            reason="already ran",
+            project_vars=craft_parts.ProjectVarInfo.unmarshal(
+                {"version": {"value": "1.0", "updated": True}}
+            ),
+        ),
+        Action("some-part", Step.BUILD, action_type=ActionType.SKIP),
+    ]
+    return fake_parts_lifecycle
+
+
+def test_plan_cache_reuses_skipped_plan(plan_cache_lifecycle, tmp_path, emitter):
+    lcm = plan_cache_lifecycle._lcm
+    executor = lcm.action_executor.return_value.__enter__.return_value
+
+    plan_cache_lifecycle.run("build")
+    (tmp_path / "source" / "ignored.craft").write_text("changed")
+    plan_cache_lifecycle.run("build")
+
+    lcm.plan.assert_called_once_with(Step.BUILD, part_names=None)
+    assert executor.execute.mock_calls == [
+        mock.call(action, stdout=mock.ANY, stderr=mock.ANY)
+        for action in lcm.plan.return_value * 2
+    ]
+    emitter.assert_debug("Nothing changed since the last run, reusing its plan")
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        pytest.param(
+            lambda path: (path / "source/subdir/file").write_text("new"),
+            id="source-file",
+        ),
+        pytest.param(lambda path: (path / "source/new").touch(), id="new-source-file"),
+        pytest.param(
+            lambda path: (path / "work/parts/some-part/state/build").touch(),
+            id="state",
+        ),
+    ],
+)
+def test_plan_cache_invalidated(plan_cache_lifecycle, tmp_path, change):
+    plan_cache_lifecycle.run("build")
+    change(tmp_path)
+    plan_cache_lifecycle.run("build")
+
+    assert plan_cache_lifecycle._lcm.plan.call_count == 2
+
+
+def test_plan_cache_other_step(plan_cache_lifecycle):
+    plan_cache_lifecycle.run("build")
+    plan_cache_lifecycle.run("pull")
+
+    assert plan_cache_lifecycle._lcm.plan.mock_calls == [
+        mock.call(Step.BUILD, part_names=None),
+        mock.call(Step.PULL, part_names=None),
+    ]
+
+
+def test_plan_cache_not_saved_with_work(plan_cache_lifecycle, tmp_path):
+    lcm = plan_cache_lifecycle._lcm
+    lcm.plan.return_value = [Action("some-part", Step.PULL)]
+
+    plan_cache_lifecycle.run("pull")
+    plan_cache_lifecycle.run("pull")
+
+    assert lcm.plan.call_count == 2
+    assert not (tmp_path / "work/parts/.plan-cache.json").exists()
+
+
+def test_run_timings(
+    mocker,
+    fake_parts_lifecycle,
+    fake_services,
+    fake_platform,
+    fake_host_architecture,
+    tmp_path,
+    emitter,
+):
+    mocker.patch.object(emit, "get_mode", return_value=EmitterMode.DEBUG)
+    fake_services.get("build_plan").set_platforms(fake_platform)
+    skip_if_build_plan_empty(fake_services.get("build_plan"))
+    actions = [
+        Action("my-part", Step.PULL),
+        Action("your-part", Step.PULL, action_type=ActionType.SKIP),
+        Action("my-part", Step.BUILD),
+    ]
+    fake_parts_lifecycle._lcm.plan.return_value = actions
+
+    fake_parts_lifecycle.run("build")
+
+    spans = fake_parts_lifecycle.timings.spans
+    assert [(span.name, span.category, span.args) for span in spans] == [
+        ("Validate build plan", "lifecycle", {}),
+        ("Plan build", "lifecycle", {}),
+        ("Pulling my-part", "pull", {"part": "my-part", "action": "run"}),
+        (
+            "Skipping pull for your-part",
+            "pull",
+            {"part": "your-part", "action": "skip"},
+        ),
+        ("Building my-part", "build", {"part": "my-part", "action": "run"}),
+        ("Execute actions", "lifecycle", {}),
+    ]
+    (summary,) = (
+        call.args[1]
+        for call in emitter.interactions
+        if call.args[0] == "verbose" and call.args[1].startswith("Lifecycle timings:")
+    )
+    # Parts are sorted by the time they took, so check each row on its own.
+    for row in (
+        r" +Part +pull +build +total",
+        r" +my-part +\d+\.\d{3}s +\d+\.\d{3}s +\d+\.\d{3}s",
+        r" +your-part +\d+\.\d{3}s +- +\d+\.\d{3}s",
+        r"  Validate build plan: \d+\.\d{3}s",
+    ):
+        assert re.search(f"^{row}$", summary, re.MULTILINE)
+    trace = json.loads((tmp_path / "lifecycle.trace.json").read_text())
+    assert [event["name"] for event in trace["traceEvents"]] == [
+        "thread_name",
+        *(span.name for span in spans),
+    ]
+
+
+@pytest.mark.parametrize("mode", [EmitterMode.QUIET, EmitterMode.VERBOSE])
+def test_run_timings_no_trace(
+    mocker,
+    fake_parts_lifecycle,
+    fake_services,
+    fake_platform,
+    fake_host_architecture,
+    tmp_path,
+    mode,
+):
+    """The trace is only written in debug and trace modes."""
+    mocker.patch.object(emit, "get_mode", return_value=mode)
+    fake_services.get("build_plan").set_platforms(fake_platform)
+    skip_if_build_plan_empty(fake_services.get("build_plan"))
+    fake_parts_lifecycle._lcm.plan.return_value = [Action("my-part", Step.PULL)]
+
+    fake_parts_lifecycle.run("pull")
+
+    assert not (tmp_path / "lifecycle.trace.json").exists()
+
+
+def test_run_timings_reset(
+    fake_parts_lifecycle, fake_services, fake_platform, fake_host_architecture
+):
+    fake_services.get("build_plan").set_platforms(fake_platform)
+    skip_if_build_plan_empty(fake_services.get("build_plan"))
+    fake_parts_lifecycle._lcm.plan.return_value = [Action("my-part", Step.PULL)]
+
+    fake_parts_lifecycle.run("pull")
+    fake_parts_lifecycle.run("pull")
+
+    assert [span.category for span in fake_parts_lifecycle.timings.spans] == [
+        "lifecycle",
+        "lifecycle",
+        "pull",
+        "lifecycle",
+    ]
+
+
+def test_run_timings_error(
+    mocker,
+    fake_parts_lifecycle,
+    fake_services,
+    fake_platform,
+    fake_host_architecture,
+    tmp_path,
+):
+    mocker.patch.object(emit, "get_mode", return_value=EmitterMode.DEBUG)
+    fake_services.get("build_plan").set_platforms(fake_platform)
+    skip_if_build_plan_empty(fake_services.get("build_plan"))
+    lcm = fake_parts_lifecycle._lcm
+    lcm.plan.return_value = [Action("my-part", Step.PULL)]
+    executor = lcm.action_executor.return_value.__enter__.return_value
+    executor.execute.side_effect = OSError("boom")
+
+    with pytest.raises(PartsLifecycleError):
+        fake_parts_lifecycle.run("pull")
+
+    assert "Pulling my-part" in (tmp_path / "lifecycle.trace.json").read_text()
+
+
+def test_get_trace_path(fake_parts_lifecycle):
+    assert lifecycle.LifecycleService._get_trace_path(fake_parts_lifecycle) == (
+        emit.log_filepath.with_suffix(".trace.json")
+    )
+
+
+def test_timed_post_prime(fake_parts_lifecycle, mocker):
+    mocker.patch.object(fake_parts_lifecycle, "post_prime", return_value=False)
+    step_info = mock.Mock(spec=StepInfo, part_name="my-part")
+
+    assert not fake_parts_lifecycle._timed_post_prime(step_info)
+
+    fake_parts_lifecycle.post_prime.assert_called_once_with(step_info)
+    (span,) = fake_parts_lifecycle.timings.spans
+    assert (span.name, span.category) == ("Post-prime my-part", "post-prime")
+
+
 def test_run_keeps_requires_repack_true_when_exec_fails(
     fake_parts_lifecycle,
     fake_services,
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import threading
+import time
 from typing import TYPE_CHECKING
 
 import pytest
 from craft_application.lint import (
+    AbstractFileLinter,
+    CacheStats,
+    FileEntry,
     IgnoreConfig,
+    IgnoreMatcher,
     IgnoreSpec,
     LintContext,
     LinterIssue,
@@ -89,6 +95,27 @@ def test_ignore_by_glob_cli(fake_services, fake_project, tmp_path: Path) -> None
     assert int(svc.summary()) == 0
 
 
+def test_ignore_config_compiled_once(
+    mocker, fake_services, fake_project, tmp_path: Path
+) -> None:
+    project_service = fake_services.get("project")
+    project_service.set(fake_project)
+    svc = fake_services.get("linter")
+    ctx = _make_ctx(tmp_path, fake_project)
+    cli_cfg: IgnoreConfig = {
+        "dummy.pre": IgnoreSpec(ids=set(), by_filename={"D001": {"*/README.*"}}),
+    }
+    spy_compile = mocker.spy(IgnoreMatcher, "from_spec")
+
+    loaded = svc.load_ignore_config(project_dir=tmp_path, cli_ignores=cli_cfg)
+    loaded["dummy.pre"].by_filename.clear()
+
+    assert svc._ignore_cfg == cli_cfg
+    assert list(svc.run(Stage.PRE, ctx)) == []
+    assert list(svc.run(Stage.PRE, ctx)) == []
+    assert spy_compile.call_count == 1
+
+
 def test_post_filter_hook_drops_issue(
     fake_services, fake_project, tmp_path: Path
 ) -> None:
@@ -143,3 +170,213 @@ def test_normalize_ignore_config_keeps_wildcard_ids() -> None:
     spec = cfg["dummy.pre"]
     assert spec.ids == "*"
     assert spec.by_filename == {"D001": {"*.md"}}
+
+
+def _make_post_linter(
+    name: str, *, parallel_safe: bool, delay: float = 0, barrier=None, log=None
+) -> type[AbstractLinter]:
+    def run(self, ctx: LintContext):
+        if log is not None:
+            log.append(f"start {name}")
+        if barrier is not None:
+            barrier.wait()
+        time.sleep(delay)
+        for index in range(2):
+            yield LinterIssue(
+                id=f"{name}-{index}",
+                message=threading.current_thread().name,
+                severity=Severity.WARNING,
+                filename=f"{name}.txt",
+            )
+        if log is not None:
+            log.append(f"end {name}")
+
+    return type(
+        f"_Linter[{name}]",
+        (AbstractLinter,),
+        {"name": name, "stage": Stage.POST, "parallel_safe": parallel_safe, "run": run},
+    )
+
+
+def test_run_parallel_safe_linters(
+    linter_registry_guard, fake_services, fake_project, tmp_path: Path
+) -> None:
+    # Both linters must be running at the same time to get past the barrier.
+    barrier = threading.Barrier(2, timeout=10)
+    slow = _make_post_linter("slow", parallel_safe=True, delay=0.1, barrier=barrier)
+    fast = _make_post_linter("fast", parallel_safe=True, barrier=barrier)
+    svc = fake_services.get("linter")
+
+    with linter_registry_guard(slow, fast):
+        issues = list(svc.run(Stage.POST, _make_ctx(tmp_path, fake_project)))
+
+    # Issues are in registration order, not in the order the linters finished.
+    assert [issue.id for issue in issues] == ["slow-0", "slow-1", "fast-0", "fast-1"]
+    assert all(issue.message.startswith("testcraft-lint") for issue in issues)
+    assert svc.issues_by_linter == {"slow": issues[:2], "fast": issues[2:]}
+
+
+def test_run_unsafe_linters_run_alone(
+    linter_registry_guard, fake_services, fake_project, tmp_path: Path
+) -> None:
+    log: list[str] = []
+    linters = [
+        _make_post_linter("safe-1", parallel_safe=True, delay=0.05, log=log),
+        _make_post_linter("safe-2", parallel_safe=True, log=log),
+        _make_post_linter("unsafe", parallel_safe=False, log=log),
+        _make_post_linter("safe-3", parallel_safe=True, log=log),
+    ]
+    svc = fake_services.get("linter")
+
+    with linter_registry_guard(*linters):
+        issues = list(svc.run(Stage.POST, _make_ctx(tmp_path, fake_project)))
+
+    assert [issue.id for issue in issues] == [
+        f"{name}-{index}"
+        for name in ("safe-1", "safe-2", "unsafe", "safe-3")
+        for index in range(2)
+    ]
+    assert issues[4].message == threading.current_thread().name
+    unsafe_start = log.index("start unsafe")
+    assert set(log[:unsafe_start]) == {
+        "start safe-1",
+        "end safe-1",
+        "start safe-2",
+        "end safe-2",
+    }
+    assert log[unsafe_start:] == ["start unsafe", "end unsafe", *log[-2:]]
+
+
+def test_run_parallel_filters(
+    linter_registry_guard, fake_services, fake_project, tmp_path: Path
+) -> None:
+    class Policy(LinterService):
+        def post_filter_issues(self, linter: AbstractLinter, issues, ctx):
+            return (i for i in issues if i.id != "two-1")
+
+    linters = [
+        _make_post_linter("one", parallel_safe=True),
+        _make_post_linter("two", parallel_safe=True),
+    ]
+    svc = Policy(app=fake_services.app, services=fake_services)
+    svc.load_ignore_config(
+        project_dir=tmp_path,
+        cli_ignores={"one": IgnoreSpec(ids=set(), by_filename={"one-0": {"one.*"}})},
+    )
+
+    with linter_registry_guard(*linters):
+        issues = list(svc.run(Stage.POST, _make_ctx(tmp_path, fake_project)))
+
+    assert [issue.id for issue in issues] == ["one-1", "two-0"]
+
+
+def test_run_parallel_error(
+    linter_registry_guard, fake_services, fake_project, tmp_path: Path
+) -> None:
+    class _BrokenLinter(AbstractLinter):
+        name = "broken"
+        stage = Stage.POST
+        parallel_safe = True
+
+        def run(self, ctx: LintContext):
+            raise RuntimeError("linter broke")
+
+    linters = [_make_post_linter("ok", parallel_safe=True), _BrokenLinter]
+    svc = fake_services.get("linter")
+
+    with linter_registry_guard(*linters):
+        issues = svc.run(Stage.POST, _make_ctx(tmp_path, fake_project))
+        assert next(issues).id == "ok-0"
+        assert next(issues).id == "ok-1"
+        with pytest.raises(RuntimeError, match="linter broke"):
+            next(issues)
+
+
+def _make_file_linter(
+    name: str, *, parallel_safe: bool = False, cacheable: bool = True
+) -> type[AbstractFileLinter]:
+    def lint_file(self, ctx: LintContext, entry: FileEntry):
+        yield LinterIssue(
+            id=f"{name}-{entry.path.name}",
+            message=f"{entry.size} bytes",
+            severity=Severity.WARNING,
+            filename=str(entry.path),
+        )
+
+    return type(
+        f"_FileLinter[{name}]",
+        (AbstractFileLinter,),
+        {
+            "name": name,
+            "stage": Stage.POST,
+            "parallel_safe": parallel_safe,
+            "cacheable": cacheable,
+            "lint_file": lint_file,
+        },
+    )
+
+
+@pytest.mark.parametrize("parallel_safe", [False, True])
+def test_run_cached(
+    mocker,
+    linter_registry_guard,
+    fake_services,
+    tmp_path: Path,
+    parallel_safe: bool,
+) -> None:
+    linters = [
+        _make_file_linter("files", parallel_safe=parallel_safe),
+        _make_file_linter("more-files", parallel_safe=parallel_safe),
+        _make_file_linter("uncached", parallel_safe=parallel_safe, cacheable=False),
+    ]
+    artifact_dir = tmp_path / "prime"
+    artifact_dir.mkdir()
+    (artifact_dir / "one").write_text("1")
+    (artifact_dir / "two").write_text("22")
+    ctx = LintContext(project_dir=tmp_path, artifact_dirs=[artifact_dir])
+    svc = fake_services.get("linter")
+    svc.cache_issues = True
+
+    with linter_registry_guard(*linters):
+        first = list(svc.run(Stage.POST, ctx))
+        (artifact_dir / "two").write_text("changed")
+        svc.load_ignore_config(
+            project_dir=tmp_path,
+            cli_ignores={"files": IgnoreSpec(ids={"files-one"}, by_filename={})},
+        )
+        spy_lint = mocker.spy(linters[0], "lint_file")
+        ctx = LintContext(project_dir=tmp_path, artifact_dirs=[artifact_dir])
+        second = list(svc.run(Stage.POST, ctx))
+
+    assert svc.get_cache_path(ctx) == tmp_path / "parts" / ".lint-cache.json"
+    assert svc.get_cache_path(ctx).is_file()
+    assert [issue.message for issue in first] == ["1 bytes", "2 bytes"] * 3
+    assert [(issue.id, issue.message) for issue in second] == [
+        ("files-two", "7 bytes"),
+        ("more-files-one", "1 bytes"),
+        ("more-files-two", "7 bytes"),
+        ("uncached-one", "1 bytes"),
+        ("uncached-two", "7 bytes"),
+    ]
+    assert spy_lint.call_count == 1
+    assert svc.cache_stats == {
+        "files": CacheStats(hits=1, misses=1),
+        "more-files": CacheStats(hits=1, misses=1),
+    }
+
+
+def test_run_cache_disabled(
+    linter_registry_guard, fake_services, tmp_path: Path
+) -> None:
+    artifact_dir = tmp_path / "prime"
+    artifact_dir.mkdir()
+    (artifact_dir / "file").write_text("file")
+    ctx = LintContext(project_dir=tmp_path, artifact_dirs=[artifact_dir])
+    svc = fake_services.get("linter")
+
+    with linter_registry_guard(_make_file_linter("files")):
+        issues = list(svc.run(Stage.POST, ctx))
+
+    assert [issue.id for issue in issues] == ["files-file"]
+    assert svc.cache_stats == {}
+    assert not svc.get_cache_path(ctx).exists()
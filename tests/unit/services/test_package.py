@@ -18,11 +18,15 @@
 from __future__ import annotations
 
 import pathlib
+import stat
+import sys
+import threading
 from typing import TYPE_CHECKING
 
 import pytest
 from craft_application import errors, models, util
 from craft_application.services import package
+from craft_parts.dirs import ProjectDirs
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -258,6 +262,100 @@ def test_pack_artifacts_only_packs_needed_artifacts(
     assert service.packed == [(None, artifacts[None])]
 
 
+class ConcurrentPackageService(MultiArtifactPackageService):
+    concurrent_pack = True
+
+    def __init__(self, *args, failing: set[str | None] = frozenset(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.barrier = threading.Barrier(len(self._artifacts), timeout=10)
+        self.failing = failing
+
+    def _pack(self, *, name: str | None = None, path: Path) -> None:
+        # Every artifact must be packing at once to get past the barrier.
+        self.barrier.wait()
+        if name in self.failing:
+            raise errors.ArtifactCreationError(f"Failed to pack {name}")
+        super()._pack(name=name, path=path)
+
+
+@pytest.fixture
+def fake_project_dirs(fake_services, tmp_path, mocker):
+    """Give the lifecycle service project dirs with a work dir of tmp_path."""
+    dirs = ProjectDirs(work_dir=tmp_path)
+    fake_services._services["lifecycle"] = mocker.Mock(
+        project_info=mocker.Mock(dirs=dirs)
+    )
+    return dirs
+
+
+@pytest.fixture
+def concurrent_artifacts(fake_project_dirs, tmp_path, mocker):
+    mocker.patch.object(ConcurrentPackageService, "needs_packing", return_value=True)
+    mocker.patch.object(
+        ConcurrentPackageService, "_prime_dir_for", return_value=tmp_path / "prime"
+    )
+    return {
+        None: tmp_path / "main.tar.zst",
+        "tools": tmp_path / "tools.tar.zst",
+        "docs": tmp_path / "docs.tar.zst",
+    }
+
+
+def test_pack_artifacts_concurrently(
+    app_metadata, fake_project, fake_services, concurrent_artifacts
+):
+    service = ConcurrentPackageService(
+        app_metadata, fake_services, artifacts=concurrent_artifacts
+    )
+
+    result = service.pack_artifacts()
+
+    assert result == {None: True, "tools": True, "docs": True}
+    assert sorted(service.packed, key=str) == sorted(
+        concurrent_artifacts.items(), key=str
+    )
+
+
+def test_pack_artifacts_concurrently_errors(
+    app_metadata, fake_project, fake_services, concurrent_artifacts, emitter
+):
+    service = ConcurrentPackageService(
+        app_metadata,
+        fake_services,
+        artifacts=concurrent_artifacts,
+        failing={None, "docs"},
+    )
+
+    with pytest.raises(errors.PackArtifactsError) as exc_info:
+        service.pack_artifacts()
+
+    assert exc_info.value.packed == {None: False, "tools": True, "docs": False}
+    assert {name: str(error) for name, error in exc_info.value.failures.items()} == {
+        None: "Failed to pack None",
+        "docs": "Failed to pack docs",
+    }
+    assert exc_info.value.args[0] == "Could not pack 2 artifacts."
+    assert service.packed == [("tools", concurrent_artifacts["tools"])]
+    # Only the artifact that was packed is counted.
+    assert [
+        call.args[1]
+        for call in emitter.interactions
+        if call.args[0] == "progress" and call.args[1].startswith("Packed ")
+    ] == ["Packed 1/3 artifacts"]
+
+
+def test_pack_artifacts_concurrently_nothing_to_pack(
+    app_metadata, fake_project, fake_services, tmp_path, mocker
+):
+    mocker.patch.object(ConcurrentPackageService, "needs_packing", return_value=False)
+    service = ConcurrentPackageService(
+        app_metadata, fake_services, artifacts={None: tmp_path / "main.tar.zst"}
+    )
+
+    assert service.pack_artifacts() == {None: False}
+    assert service.packed == []
+
+
 def test_package_files_without_partition_filter(
     app_metadata, fake_project, fake_services
 ):
@@ -377,6 +475,209 @@ def test_package_files_override_base_registration(
     ]
 
 
+class ManifestPackageService(DecoratedPackageService):
+    def __init__(self, *args, asset: Path, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.asset = asset
+        self.metadata_content = "metadata"
+
+    @package.package_file("metadata.yaml")
+    def _metadata(self, partition: str | None = None) -> str:
+        return self.metadata_content
+
+    def _gen_extra_assets(self, partition_name=None):
+        return [(self.asset, self.asset.parent / "prime" / "asset")]
+
+
+@pytest.fixture
+def manifest_service(
+    app_metadata, fake_project, fake_services, fake_project_dirs, tmp_path, mocker
+):
+    prime_dir = tmp_path / "prime"
+    (prime_dir / "sub").mkdir(parents=True)
+    (prime_dir / "sub" / "file").write_text("data")
+    (tmp_path / "asset").write_text("asset")
+    (tmp_path / "artifact.tar").write_text("packed")
+    service = ManifestPackageService(
+        app_metadata, fake_services, asset=tmp_path / "asset"
+    )
+    mocker.patch.object(service, "_prime_dir_for", return_value=prime_dir)
+    service._materialize_package_files(None)
+    service._materialize_extra_assets(None)
+    return service
+
+
+def test_pack_manifest_missing(manifest_service, tmp_path):
+    assert (
+        manifest_service._pack_manifest_changed(None, tmp_path / "artifact.tar") is None
+    )
+
+
+def test_pack_manifest_unchanged(manifest_service, tmp_path, mocker):
+    artifact = tmp_path / "artifact.tar"
+    manifest_service._write_pack_manifest(None, artifact)
+    read_bytes = mocker.patch.object(pathlib.Path, "read_bytes")
+
+    assert manifest_service._pack_manifest_changed(None, artifact) is False
+    assert (tmp_path / "parts" / ".pack-manifest-default.json").is_file()
+    read_bytes.assert_not_called()
+
+
+def test_pack_manifest_destructive(manifest_service, tmp_path):
+    """In destructive mode, the work dir is the project dir and must stay unchanged."""
+    artifact = tmp_path / "artifact.tar"
+    project_files = {path.name for path in tmp_path.iterdir()}
+    prime_digest = package._get_tree_digest(tmp_path / "prime")
+
+    manifest_service._write_pack_manifest(None, artifact)
+
+    assert {path.name for path in tmp_path.iterdir()} == project_files | {"parts"}
+    assert package._get_tree_digest(tmp_path / "prime") == prime_digest
+    assert [path.name for path in (tmp_path / "parts").iterdir()] == [
+        ".pack-manifest-default.json"
+    ]
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        pytest.param(
+            lambda path, _: (path / "prime/sub/file").write_text("changed"),
+            id="prime-file",
+        ),
+        pytest.param(lambda path, _: (path / "prime/new").touch(), id="prime-new"),
+        pytest.param(
+            lambda path, _: (path / "prime/metadata.yaml").unlink(),
+            id="package-file-removed",
+        ),
+        pytest.param(
+            lambda _, service: setattr(service, "metadata_content", "new"),
+            id="package-file-content",
+        ),
+        pytest.param(
+            lambda path, _: (path / "asset").write_text("new asset"), id="asset"
+        ),
+        pytest.param(
+            lambda path, _: (path / "artifact.tar").write_text("other"),
+            id="artifact",
+        ),
+    ],
+)
+def test_pack_manifest_changed(manifest_service, tmp_path, change):
+    artifact = tmp_path / "artifact.tar"
+    manifest_service._write_pack_manifest(None, artifact)
+
+    change(tmp_path, manifest_service)
+
+    assert manifest_service._pack_manifest_changed(None, artifact) is True
+
+
+@pytest.mark.parametrize("content", ["not json", "[]", '{"version": 0, "prime": ""}'])
+def test_pack_manifest_unusable(manifest_service, tmp_path, content):
+    (tmp_path / "parts").mkdir()
+    (tmp_path / "parts" / ".pack-manifest-default.json").write_text(content)
+
+    assert (
+        manifest_service._pack_manifest_changed(None, tmp_path / "artifact.tar") is None
+    )
+
+
+@pytest.fixture
+def write_asset_service(app_metadata, fake_project, fake_services):
+    return FakePackageService(app_metadata, fake_services)
+
+
+@pytest.mark.parametrize("source", ["text", b"bytes"])
+def test_write_asset_content(write_asset_service, tmp_path, source):
+    destination = tmp_path / "prime" / "meta" / "file"
+
+    write_asset_service._write_asset(source, destination)
+
+    expected = source.encode() if isinstance(source, str) else source
+    assert destination.read_bytes() == expected
+    assert [path.name for path in destination.parent.iterdir()] == ["file"]
+
+
+def test_write_asset_content_keeps_mode(write_asset_service, tmp_path):
+    destination = tmp_path / "file"
+    destination.write_text("old")
+    destination.chmod(0o755)
+
+    write_asset_service._write_asset("new", destination)
+
+    assert destination.read_text() == "new"
+    assert stat.S_IMODE(destination.stat().st_mode) == 0o755
+
+
+def test_write_asset_none(write_asset_service, tmp_path):
+    destination = tmp_path / "file"
+    destination.touch()
+
+    write_asset_service._write_asset(None, destination)
+
+    assert not destination.exists()
+
+
+@pytest.mark.parametrize("mode", [0o750, 0o640, 0o555])
+def test_write_asset_path(write_asset_service, tmp_path, mode):
+    source = tmp_path / "source"
+    source.write_bytes(b"binary" * 1000)
+    source.chmod(mode)
+    destination = tmp_path / "prime" / "asset"
+    destination.parent.mkdir()
+    destination.write_text("old")
+
+    write_asset_service._write_asset(source, destination)
+
+    assert destination.read_bytes() == b"binary" * 1000
+    assert stat.S_IMODE(destination.stat().st_mode) == mode
+    assert not destination.samefile(source)
+    assert [path.name for path in destination.parent.iterdir()] == ["asset"]
+
+
+def test_write_asset_path_changed_later(write_asset_service, tmp_path):
+    """Changing the packed copy of a read-only asset leaves the source alone."""
+    source = tmp_path / "source"
+    source.write_text("content")
+    source.chmod(0o444)
+    destination = tmp_path / "asset"
+
+    write_asset_service._write_asset(source, destination)
+    destination.chmod(0o644)
+    destination.write_text("changed")
+
+    assert source.read_text() == "content"
+    assert stat.S_IMODE(source.stat().st_mode) == 0o444
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Linux-only copy methods")
+def test_write_asset_path_streamed(write_asset_service, tmp_path, mocker):
+    source = tmp_path / "source"
+    source.write_bytes(b"x" * 100_000)
+    mocker.patch.object(package.fcntl, "ioctl", side_effect=OSError("No clones"))
+    copy_file_range = mocker.patch("os.copy_file_range", side_effect=OSError)
+    destination = tmp_path / "asset"
+
+    write_asset_service._write_asset(source, destination)
+
+    copy_file_range.assert_called_once()
+    assert destination.read_bytes() == b"x" * 100_000
+
+
+def test_write_asset_cleans_up_on_error(write_asset_service, tmp_path, mocker):
+    source = tmp_path / "source"
+    source.write_text("content")
+    destination = tmp_path / "prime" / "asset"
+    mocker.patch.object(pathlib.Path, "replace", side_effect=OSError("No space"))
+
+    with pytest.raises(OSError, match="No space"):
+        write_asset_service._write_asset(source, destination)
+    with pytest.raises(OSError, match="No space"):
+        write_asset_service._write_asset("text", destination)
+
+    assert [path.name for path in destination.parent.iterdir()] == []
+
+
 def test_pack_state_compatibility_views_from_canonical_shape():
     state = models.PackState(
         artifacts=[
@@ -24,6 +24,7 @@ from unittest import mock
 
 import craft_platforms
 import freezegun
+import pydantic
 import pytest
 import pytest_mock
 from craft_application import _const, errors, models, util
@@ -1109,6 +1110,59 @@ def test_deep_update(fake_project_file, real_project_service: ProjectService):
     )
 
 
+def test_deep_update_only_validates_updated_fields(
+    mocker, fake_project_file, real_project_service: ProjectService
+):
+    real_project_service.configure(platform=None, build_for=None)
+    original = real_project_service.get()
+    spy_unmarshal = mocker.spy(models.Project, "unmarshal")
+
+    real_project_service.deep_update(
+        {"version": "2.0", "parts": {"some-part": {"source": "new-source"}}}
+    )
+
+    spy_unmarshal.assert_not_called()
+    project = real_project_service.get()
+    assert project.version == "2.0"
+    assert project.parts["some-part"]["source"] == "new-source"
+    assert project.parts["some-part"]["plugin"] == "nil"
+    assert (
+        project.marshal()
+        == models.Project.unmarshal(
+            ProjectService._deep_update(
+                original.marshal(),
+                {"version": "2.0", "parts": {"some-part": {"source": "new-source"}}},
+            )
+        ).marshal()
+    )
+    # The previous model is left untouched.
+    assert original.version != "2.0"
+
+
+def test_deep_update_invalid_value(
+    fake_project_file, real_project_service: ProjectService
+):
+    real_project_service.configure(platform=None, build_for=None)
+    original = real_project_service.get()
+
+    with pytest.raises(pydantic.ValidationError):
+        real_project_service.deep_update({"version": "2.0", "name": "-invalid-"})
+
+    assert real_project_service.get() is original
+
+
+def test_deep_update_unknown_key(
+    fake_project_file, real_project_service: ProjectService
+):
+    real_project_service.configure(platform=None, build_for=None)
+    original = real_project_service.get()
+
+    with pytest.raises(pydantic.ValidationError, match="not-a-field"):
+        real_project_service.deep_update({"not-a-field": "value"})
+
+    assert real_project_service.get() is original
+
+
 @pytest.mark.parametrize(
     ("pro_services", "expect_called"),
     [
@@ -20,6 +20,7 @@ import pathlib
 import pkgutil
 import re
 import subprocess
+import threading
 import uuid
 from typing import Any, NamedTuple
 from unittest import mock
@@ -27,20 +28,23 @@ from unittest import mock
 import craft_application
 import craft_platforms
 import craft_providers
+import pygit2
 import pytest
 import pytest_subprocess
-from craft_application import errors
+from craft_application import errors, util
 from craft_application.services import provider
 from craft_application.services.provider import (
     _find_git_root,
     _get_build_root,
     _get_managed_cwd,
+    _WorkDirInfo,
 )
 from craft_application.services.service_factory import ServiceFactory
 from craft_application.util import ProServices, snap_config
 from craft_cli import emit
 from craft_providers import bases, lxd, multipass
 from craft_providers.actions.snap_installer import Snap
+from craft_providers.executor import get_instance_name
 from snap_http.types import SnapdResponse
 
 
@@ -461,6 +465,87 @@ def test_setup_snaps_uses_tracking_channel(
     )
 
 
+def test_host_snaps_queried_once(monkeypatch, provider_service):
+    """snapd is queried once, however many snaps are looked up."""
+    mock_get = mock.Mock(
+        return_value=SnapdResponse(
+            type="sync",
+            status_code=200,
+            status="OK",
+            result=[
+                *({"name": f"snap-{i}", "confinement": "strict"} for i in range(500)),
+                {
+                    "name": "testcraft",
+                    "confinement": "classic",
+                    "base": "core24",
+                    "tracking-channel": "latest/edge",
+                },
+                {"name": "core24", "confinement": "strict"},
+            ],
+        )
+    )
+    monkeypatch.setattr("snap_http.http.get", mock_get)
+
+    assert provider_service.enqueue_snap_injection("testcraft")
+    assert not provider_service.enqueue_snap_injection("not-installed")
+    assert provider_service._get_snap_store_channel("testcraft") == "latest/edge"
+    assert provider_service._get_snap_store_channel("not-installed") is None
+
+    mock_get.assert_called_once()
+    assert provider_service.snaps == [
+        Snap(name="core24", channel=None),
+        Snap(name="testcraft", channel=None, classic=True),
+    ]
+
+
+@pytest.mark.parametrize("include_base", [True, False])
+def test_enqueue_snap_injection_base_once(monkeypatch, provider_service, include_base):
+    """The base is only injected if requested and not already being installed."""
+    monkeypatch.setattr(
+        "snap_http.http.get",
+        mock.Mock(
+            return_value=SnapdResponse(
+                type="sync",
+                status_code=200,
+                status="OK",
+                result=[
+                    {"name": "app-1", "confinement": "strict", "base": "core24"},
+                    {"name": "app-2", "confinement": "strict", "base": "core24"},
+                    {"name": "core24", "confinement": "strict"},
+                ],
+            )
+        ),
+    )
+
+    provider_service.enqueue_snap_injection("app-1", include_base=include_base)
+    provider_service.enqueue_snap_injection("app-2", include_base=include_base)
+
+    assert [snap.name for snap in provider_service.snaps] == [
+        *(["core24"] if include_base else []),
+        "app-1",
+        "app-2",
+    ]
+
+
+def test_enqueue_snap_injection_no_base(monkeypatch, provider_service):
+    """A snap without a base, such as a base snap itself, is injected alone."""
+    monkeypatch.setattr(
+        "snap_http.http.get",
+        mock.Mock(
+            return_value=SnapdResponse(
+                type="sync",
+                status_code=200,
+                status="OK",
+                result=[{"name": "core24", "confinement": "strict"}],
+            )
+        ),
+    )
+
+    assert provider_service.enqueue_snap_injection("core24")
+
+    assert provider_service.snaps == [Snap(name="core24", channel=None)]
+
+
 @pytest.mark.parametrize(
     "additional_snaps",
     [
@@ -869,6 +954,30 @@ def test_instance(
         emitter.assert_progress("Launching managed .+ instance...", regex=True)
 
 
+def test_instance_finalizes_proxy(
+    tmp_path, fake_services, provider_service, fake_build_info, mock_provider
+):
+    proxy_cert = tmp_path / "proxy.pem"
+    proxy_cert.write_text("cert")
+    fake_services.get("proxy").configure(proxy_cert, "http://proxy")
+
+    with provider_service.instance(fake_build_info, work_dir=tmp_path) as instance:
+        pass
+
+    # The bashrc and the snapd configuration are sent together.
+    instance.push_file_io.assert_called_once_with(
+        destination=pathlib.Path("/tmp/craft-instance-preparation.tar"),
+        content=mock.ANY,
+        file_mode="600",
+    )
+    (run_call,) = instance.execute_run.mock_calls
+    assert run_call.args[0][2].endswith(
+        "systemctl restart snapd\n"
+        "snap set system proxy.http=http://proxy\n"
+        "snap set system proxy.https=http://proxy"
+    )
+
+
 @pytest.mark.parametrize("clean_existing", [True, False])
 def test_instance_clean_existing(
     tmp_path,
@@ -896,6 +1005,187 @@ def test_instance_clean_existing(
         )
 
 
+@pytest.fixture
+def warm_build_infos():
+    arch = craft_platforms.DebianArchitecture.from_host()
+    base = craft_platforms.DistroBase("ubuntu", "24.04")
+    return [
+        craft_platforms.BuildInfo(f"platform-{index}", arch, arch, base)
+        for index in range(3)
+    ]
+
+
+def test_warm_instances_disabled(provider_service, mock_provider, warm_build_infos):
+    provider_service.warm_instances(warm_build_infos)
+
+    mock_provider.launched_environment.assert_not_called()
+
+
+def test_instance_uses_warm_instance(
+    monkeypatch, tmp_path, emitter, provider_service, mock_provider, warm_build_infos
+):
+    monkeypatch.setenv("CRAFT_INSTANCE_WARM_POOL", "1")
+    instance = mock_provider.launched_environment.return_value.__enter__.return_value
+    prepare_instance = mock.Mock()
+
+    provider_service.warm_instances(warm_build_infos)
+    (warming,) = provider_service._warm_pool.values()
+    warming.result()
+    assert mock_provider.launched_environment.call_count == 1
+
+    with provider_service.instance(
+        warm_build_infos[0], work_dir=tmp_path, prepare_instance=prepare_instance
+    ) as actual:
+        assert actual is instance
+        # Using the warm instance starts warming the next one.
+        (warming,) = provider_service._warm_pool.values()
+        warming.result()
+
+    prepare_instance.assert_called_once_with(instance)
+    provider_service.close_warm_pool()
+    assert mock_provider.launched_environment.call_count == 2
+    assert not provider_service._warm_pool
+    emitter.assert_debug(
+        r"Using warm instance 'testcraft-full-project-platform-0-\d+'", regex=True
+    )
+
+
+def test_instance_discards_warm_instance(
+    monkeypatch, tmp_path, provider_service, mock_provider, warm_build_infos
+):
+    monkeypatch.setenv("CRAFT_INSTANCE_WARM_POOL", "1")
+    launched_environment = mock_provider.launched_environment.return_value
+
+    provider_service.warm_instances(warm_build_infos[:1])
+    (warming,) = provider_service._warm_pool.values()
+    warming.result()
+    with provider_service.instance(
+        warm_build_infos[0], work_dir=tmp_path, clean_existing=True
+    ):
+        # The warm instance was stopped before cleaning and relaunching.
+        launched_environment.__exit__.assert_called_once()
+        mock_provider.clean_project_environments.assert_called_once()
+
+    assert mock_provider.launched_environment.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"allow_unstable": False}, {"use_base_instance": False}],
+)
+def test_instance_warm_instance_other_options(
+    monkeypatch,
+    tmp_path,
+    emitter,
+    provider_service,
+    mock_provider,
+    warm_build_infos,
+    options,
+):
+    monkeypatch.setenv("CRAFT_INSTANCE_WARM_POOL", "1")
+    launched_environment = mock_provider.launched_environment.return_value
+
+    provider_service.warm_instances(warm_build_infos[:1])
+    (warming,) = provider_service._warm_pool.values()
+    warming.result()
+    with provider_service.instance(warm_build_infos[0], work_dir=tmp_path, **options):
+        # The warm instance was stopped before launching with the caller's options.
+        launched_environment.__exit__.assert_called_once()
+
+    assert mock_provider.launched_environment.call_count == 2
+    assert (
+        mock_provider.launched_environment.call_args.kwargs.items()
+        >= {
+            "allow_unstable": True,
+            "use_base_instance": True,
+            **options,
+        }.items()
+    )
+    emitter.assert_debug(r"Not using warm instance '.+' with other options", regex=True)
+
+
+def test_instance_warm_instance_proxy_configured_once(
+    monkeypatch, tmp_path, provider_service, mock_provider, warm_build_infos
+):
+    """The proxy configuration the warm pool applied isn't applied again."""
+    monkeypatch.setenv("CRAFT_INSTANCE_WARM_POOL", "1")
+    proxy_cert = tmp_path / "cert.pem"
+    proxy_cert.write_text("cert")
+    proxy = provider_service._services.get("proxy")
+    proxy.configure(proxy_cert=proxy_cert, http_proxy="test-proxy")
+    launched_environment = mock.MagicMock()
+    instance = launched_environment.__enter__.return_value
+
+    def launch(**kwargs):
+        kwargs["prepare_instance"](instance)
+        return launched_environment
+
+    mock_provider.launched_environment.side_effect = launch
+    provider_service.warm_instances(warm_build_infos[:1])
+    (warming,) = provider_service._warm_pool.values()
+    warming.result()
+    scripts = [call.args[0][2] for call in instance.execute_run.mock_calls if call.args]
+    env = {}
+
+    def prepare_instance(instance):
+        env.update(proxy.configure_instance(instance))
+
+    with provider_service.instance(
+        warm_build_infos[0], work_dir=tmp_path, prepare_instance=prepare_instance
+    ):
+        pass
+
+    assert env["http_proxy"] == "test-proxy"
+    assert [
+        call.args[0][2] for call in instance.execute_run.mock_calls if call.args
+    ] == scripts
+    assert sum("apt update" in script for script in scripts) == 1
+
+
+def test_instance_warm_instance_failed(
+    monkeypatch, tmp_path, emitter, provider_service, mock_provider, warm_build_infos
+):
+    monkeypatch.setenv("CRAFT_INSTANCE_WARM_POOL", "1")
+    mock_provider.launched_environment.side_effect = [
+        craft_providers.ProviderError("Launch failed"),
+        mock.MagicMock(),
+    ]
+
+    provider_service.warm_instances(warm_build_infos[:1])
+    with provider_service.instance(warm_build_infos[0], work_dir=tmp_path):
+        pass
+
+    assert mock_provider.launched_environment.call_count == 2
+    emitter.assert_debug(r"Could not warm instance .+: Launch failed", regex=True)
+
+
+def test_instance_warmed_while_paused(
+    monkeypatch, tmp_path, provider_service, mock_provider, warm_build_infos
+):
+    """Instances are warmed in the background while the emitter is paused."""
+    monkeypatch.setenv("CRAFT_INSTANCE_WARM_POOL", "1")
+    paused = threading.Event()
+    mock_provider.ensure_provider_is_available.side_effect = paused.wait
+    launched_environment = mock.MagicMock()
+
+    def launch(**kwargs):
+        kwargs["prepare_instance"](launched_environment.__enter__.return_value)
+        return launched_environment
+
+    mock_provider.launched_environment.side_effect = launch
+
+    provider_service.warm_instances(warm_build_infos[:1])
+    (warming,) = provider_service._warm_pool.values()
+    with emit.pause():
+        paused.set()
+        assert warming.exception(timeout=10) is None
+
+    with provider_service.instance(warm_build_infos[0], work_dir=tmp_path) as actual:
+        assert actual is launched_environment.__enter__.return_value
+
+    assert mock_provider.launched_environment.call_count == 1
+
+
 def test_load_bashrc(emitter):
     """Test that we are able to load the bashrc file from the craft-application package."""
     bashrc = pkgutil.get_data("craft_application", "misc/instance_bashrc")
@@ -1099,7 +1389,139 @@ def test_clean_instances(provider_service, tmp_path, mocker, arch, expected_plat
         mock.call(instance_name=f"testcraft-full-project-{platform}-{work_dir_inode}")
         for platform in expected_platforms
     ]
-    assert mock_clean.mock_calls == expected_mock_calls
+    # Instances are cleaned concurrently, so they may finish in any order.
+    assert mock_clean.call_count == len(expected_mock_calls)
+    mock_clean.assert_has_calls(expected_mock_calls, any_order=True)
+
+
+def test_clean_instances_concurrently(provider_service, mocker, emitter):
+    mocker.patch.object(
+        craft_platforms.DebianArchitecture,
+        "from_host",
+        return_value=craft_platforms.DebianArchitecture.AMD64,
+    )
+    # All four instances must be cleaned at once to pass the barrier.
+    barrier = threading.Barrier(4, timeout=5)
+    mocker.patch.object(
+        provider_service.get_provider(),
+        "clean_project_environments",
+        side_effect=lambda instance_name: barrier.wait(),
+    )
+
+    provider_service.clean_instances()
+
+    emitter.assert_progress("Cleaning build environments")
+    emitter.assert_progress("Cleaned 4/4 build environments")
+
+
+def test_clean_instances_error(provider_service, mocker):
+    mocker.patch.object(
+        craft_platforms.DebianArchitecture,
+        "from_host",
+        return_value=craft_platforms.DebianArchitecture.AMD64,
+    )
+    mock_clean = mocker.patch.object(
+        provider_service.get_provider(),
+        "clean_project_environments",
+        side_effect=[None, craft_providers.ProviderError("Delete failed"), None, None],
+    )
+
+    with pytest.raises(craft_providers.ProviderError, match="Delete failed"):
+        provider_service.clean_instances()
+
+    # The error doesn't stop the other instances from being cleaned.
+    assert mock_clean.call_count == 4
+
+
+def test_clean_instances_all_platforms(
+    tmp_path, provider_service, mock_provider, emitter
+):
+    inode = tmp_path.stat().st_ino
+    names = [
+        f"testcraft-full-project-platform-{inode}",
+        f"testcraft-full-project-old-platform-{inode}",
+        # Another copy of the project.
+        f"testcraft-full-project-platform-{inode + 1}",
+        # Another project whose name starts the same way.
+        f"testcraft-full-project-extra-platform-{inode}1",
+        f"testcraft-full-project-{inode}",
+    ]
+    instances = []
+    for name in names:
+        instance = mock.Mock()
+        instance.name = name
+        instances.append(instance)
+    mock_provider.is_provider_installed.return_value = True
+    mock_provider.list_instances.return_value = instances
+
+    provider_service.clean_instances(all_platforms=True)
+
+    mock_provider.list_instances.assert_called_once_with(
+        instance_name_prefix="testcraft-full-project-"
+    )
+    mock_provider.clean_project_environments.assert_not_called()
+    for instance in instances[:2]:
+        instance.delete.assert_called_once_with()
+    for instance in instances[2:]:
+        instance.delete.assert_not_called()
+    emitter.assert_progress("Cleaned 2/2 build environments")
+
+
+def test_clean_instances_all_platforms_shortened_names(
+    tmp_path, mocker, fake_base, provider_service, mock_provider, emitter
+):
+    """Names craft-providers shortens are matched through the build plan."""
+    arch = craft_platforms.DebianArchitecture.from_host()
+    build_plan = [
+        craft_platforms.BuildInfo(
+            platform=platform, build_on=arch, build_for=arch, build_base=fake_base
+        )
+        for platform in ("ubuntu-22.04", "a-platform-with-a-very-long-name-" * 2)
+    ]
+    mocker.patch.object(
+        provider_service._services.get("build_plan"),
+        "create_build_plan",
+        return_value=build_plan,
+    )
+    inode = tmp_path.stat().st_ino
+    planned_names = [
+        get_instance_name(
+            f"testcraft-full-project-{info.platform}-{inode}",
+            craft_providers.ProviderError,
+        )
+        for info in build_plan
+    ]
+    other_name = get_instance_name(
+        f"testcraft-full-project-ubuntu-22.04-{inode + 1}",
+        craft_providers.ProviderError,
+    )
+    instances = []
+    for name in [*planned_names, other_name]:
+        instance = mock.Mock()
+        instance.name = name
+        instances.append(instance)
+    mock_provider.is_provider_installed.return_value = True
+    mock_provider.list_instances.return_value = instances
+
+    provider_service.clean_instances(all_platforms=True)
+
+    assert not any(name.endswith(f"-{inode}") for name in planned_names)
+    for instance in instances[:2]:
+        instance.delete.assert_called_once_with()
+    instances[2].delete.assert_not_called()
+    emitter.assert_progress(
+        "Not cleaning 1 instances with shortened names that may belong to other "
+        f"projects: {other_name}",
+        permanent=True,
+    )
+
+
+def test_clean_instances_all_platforms_not_installed(provider_service, mock_provider):
+    mock_provider.is_provider_installed.return_value = False
+
+    provider_service.clean_instances(all_platforms=True)
+
+    mock_provider.list_instances.assert_not_called()
 
 
 @pytest.mark.parametrize("fetch", [False, True])
@@ -1128,7 +1550,8 @@ def test_run_managed(
         "CRAFT_PLATFORM": fake_build_info.platform,
     }
 
-    instance_context.execute_run.assert_called_once_with(
+    # The command runs last, once the instance is set up.
+    instance_context.execute_run.assert_called_with(
         ["testcraft", "pack", "--verbose"],
         cwd=default_app_metadata.managed_instance_project_path,
         check=True,
@@ -1138,6 +1561,37 @@ def test_run_managed(
     instance_context.prepare_instance.assert_called_once_with(mock.ANY)
 
 
+@pytest.mark.parametrize("complete", [True, False])
+def test_run_managed_streams_logs(
+    mocker,
+    monkeypatch,
+    provider_service,
+    fake_services,
+    fake_build_info,
+    mock_provider,
+    emitter,
+    complete,
+):
+    fake_services.get_class("fetch").is_active.return_value = False  # ty: ignore[unresolved-attribute]
+    monkeypatch.setattr("sys.argv", ["[unused]", "pack"])
+    mock_stream = mocker.patch.object(util, "InstanceLogStream")
+    mock_stream.return_value.complete = complete
+    instance = mock_provider.launched_environment.return_value.__enter__.return_value
+    instance.temporarily_pull_file.return_value.__enter__.return_value = None
+
+    provider_service.run_managed(fake_build_info, enable_fetch_service=False)
+
+    mock_stream.assert_called_once_with(
+        instance, pathlib.PosixPath("/tmp/testcraft.log"), emit.log_filepath
+    )
+    mock_stream.return_value.__enter__.assert_called_once_with()
+    # The log is only pulled at the end if it couldn't be streamed.
+    assert instance.temporarily_pull_file.called is not complete
+    if complete:
+        emitter.assert_debug("Logs were streamed from the managed instance.")
+    assert not provider_service._streamed_logs
+
+
 def test_configure_instance_with_pro(mocker, provider_service):
     """Ensure Pro is installed and configured in the instance."""
     mock_instance = mocker.MagicMock(spec=lxd.LXDInstance)
@@ -1199,9 +1653,9 @@ class TestFindGitRoot:
     ) -> None:
         if not git_is_available:
             monkeypatch.setattr(
-                provider.subprocess,
-                "run",
-                mock.Mock(side_effect=FileNotFoundError("git not found")),
+                provider.pygit2,
+                "discover_repository",
+                mock.Mock(side_effect=pygit2.GitError("libgit2 error")),
             )
         assert _find_git_root(tmp_path) is None
 
@@ -1215,44 +1669,68 @@ class TestFindGitRoot:
         subdir.mkdir()
         assert _find_git_root(subdir) == tmp_path
 
+    def test_returns_none_for_bare_repo(self, tmp_path: pathlib.Path) -> None:
+        pygit2.init_repository(tmp_path, bare=True)
+        assert _find_git_root(tmp_path) is None
+
+
+def test_work_dir_info_resolved_once(
+    mocker, tmp_path: pathlib.Path, provider_service, fake_build_info
+) -> None:
+    subprocess.run(["git", "init", str(tmp_path)], check=True, capture_output=True)
+    spy_find = mocker.spy(provider, "_find_git_root")
+    spy_stat = mocker.spy(pathlib.Path, "stat")
+
+    for _ in range(3):
+        info = provider_service._get_work_dir_info(tmp_path)
+        assert info.git_root == tmp_path
+        provider_service._get_instance_name(tmp_path, fake_build_info, "project")
+
+    assert spy_find.call_count == 1
+    assert spy_stat.call_count == 1
+
 
 class TestGetBuildRoot:
     def test_returns_work_dir_when_disabled(self, tmp_path: pathlib.Path) -> None:
-        assert _get_build_root(tmp_path, use_git_root=False) == tmp_path
+        assert _get_build_root(_WorkDirInfo(tmp_path), use_git_root=False) == tmp_path
 
     def test_returns_work_dir_when_not_in_git_repo(
         self, tmp_path: pathlib.Path
     ) -> None:
-        assert _get_build_root(tmp_path, use_git_root=True) == tmp_path
+        assert _get_build_root(_WorkDirInfo(tmp_path), use_git_root=True) == tmp_path
 
     def test_returns_git_root_in_monorepo(self, tmp_path: pathlib.Path) -> None:
         subprocess.run(["git", "init", str(tmp_path)], check=True, capture_output=True)
         subdir = tmp_path / "charm-a"
         subdir.mkdir()
-        assert _get_build_root(subdir, use_git_root=True) == tmp_path
+        assert _get_build_root(_WorkDirInfo(subdir), use_git_root=True) == tmp_path
 
     def test_returns_work_dir_when_already_at_git_root(
         self, tmp_path: pathlib.Path
     ) -> None:
         subprocess.run(["git", "init", str(tmp_path)], check=True, capture_output=True)
-        assert _get_build_root(tmp_path, use_git_root=True) == tmp_path
+        assert _get_build_root(_WorkDirInfo(tmp_path), use_git_root=True) == tmp_path
 
 
 class TestGetManagedCwd:
     _default = pathlib.PurePosixPath("/root/project")
 
     def test_returns_default_when_disabled(self, tmp_path: pathlib.Path) -> None:
-        result = _get_managed_cwd(tmp_path, self._default, use_git_root=False)
+        result = _get_managed_cwd(
+            _WorkDirInfo(tmp_path), self._default, use_git_root=False
+        )
         assert result == self._default
 
     def test_returns_default_when_not_in_git_repo(self, tmp_path: pathlib.Path) -> None:
-        result = _get_managed_cwd(tmp_path, self._default, use_git_root=True)
+        result = _get_managed_cwd(
+            _WorkDirInfo(tmp_path), self._default, use_git_root=True
+        )
         assert result == self._default
 
     def test_returns_default_when_at_git_root(self, tmp_path: pathlib.Path) -> None:
         subprocess.run(["git", "init", str(tmp_path)], check=True, capture_output=True)
         assert (
-            _get_managed_cwd(tmp_path, self._default, use_git_root=True)
+            _get_managed_cwd(_WorkDirInfo(tmp_path), self._default, use_git_root=True)
             == self._default
         )
 
@@ -1261,7 +1739,10 @@ class TestGetManagedCwd:
         charm_dir = tmp_path / "charms" / "charm-a"
         charm_dir.mkdir(parents=True)
         expected = self._default / "charms" / "charm-a"
-        assert _get_managed_cwd(charm_dir, self._default, use_git_root=True) == expected
+        assert (
+            _get_managed_cwd(_WorkDirInfo(charm_dir), self._default, use_git_root=True)
+            == expected
+        )
 
     def test_returns_default_when_git_root_is_not_parent(
         self, monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
@@ -1272,7 +1753,9 @@ class TestGetManagedCwd:
         unrelated_root.mkdir()
         monkeypatch.setattr(provider, "_find_git_root", lambda _path: unrelated_root)
 
-        result = _get_managed_cwd(charm_dir, self._default, use_git_root=True)
+        result = _get_managed_cwd(
+            _WorkDirInfo(charm_dir), self._default, use_git_root=True
+        )
 
         assert result == self._default
 
@@ -1314,7 +1797,7 @@ def test_run_managed_git_build_root_sets_cwd(
 
     managed_project_path = provider_service._app.managed_instance_project_path
     expected_cwd = managed_project_path / "charms" / "charm-a"
-    instance_context.execute_run.assert_called_once_with(
+    instance_context.execute_run.assert_called_with(
         mock.ANY,
         cwd=expected_cwd,
         check=True,
@@ -17,11 +17,12 @@
 
 import pathlib
 import subprocess
+import tarfile
 from unittest import mock
 from unittest.mock import call
 
 import pytest
-from craft_application import services
+from craft_application import services, util
 from craft_providers.lxd import LXDInstance
 
 
@@ -33,9 +34,37 @@ def proxy_service(app, fake_services, fake_project):
     )
 
 
-def test_configure_build_instance(mocker, proxy_service, new_dir):
+def _get_pushed_files(mock_instance) -> dict[str, bytes]:
+    """Get the files in the preparation archive pushed to an instance."""
+    (push_call,) = mock_instance.push_file_io.mock_calls
+    assert push_call.kwargs["destination"] == pathlib.Path(
+        "/tmp/craft-instance-preparation.tar"
+    )
+    content = push_call.kwargs["content"]
+    content.seek(0)
+    with tarfile.open(fileobj=content) as tar:
+        return {
+            member.name: tar.extractfile(member).read() for member in tar.getmembers()
+        }
+
+
+def _get_script(*commands: str) -> str:
+    return "\n".join(
+        [
+            (
+                "command -v tar >/dev/null || "
+                "{ echo 'craft-instance-preparation: tar not found' >&2; exit 1; }"
+            ),
+            "tar -xf /tmp/craft-instance-preparation.tar -C /",
+            "rm -f /tmp/craft-instance-preparation.tar",
+            *commands,
+        ]
+    )
+
+
+def test_configure_build_instance(mocker, proxy_service, new_dir, emitter):
     proxy_cert = pathlib.Path("test.pem")
-    proxy_cert.touch()
+    proxy_cert.write_text("my-cert")
     proxy_service.configure(
         proxy_cert=pathlib.Path("test.pem"), http_proxy="test-proxy"
     )
@@ -50,6 +79,18 @@ def test_configure_build_instance(mocker, proxy_service, new_dir):
         "GOPROXY": "direct",
     }
 
+    # Files are pushed to the instance in a single archive.
+    assert _get_pushed_files(mock_instance) == {
+        "usr/local/share/ca-certificates/local-ca.crt": b"my-cert",
+        "etc/apt/apt.conf.d/99proxy": (
+            b'Acquire::http::Proxy "test-proxy";\nAcquire::https::Proxy "test-proxy";\n'
+        ),
+        "root/.pip/pip.conf": (
+            b"[global]\ncert=/usr/local/share/ca-certificates/local-ca.crt"
+        ),
+    }
+    mock_instance.push_file.assert_not_called()
+
     proxy_service.finalize_instance_configuration(mock_instance)
 
     # Execution calls on the instance
@@ -60,64 +101,88 @@ def test_configure_build_instance(mocker, proxy_service, new_dir):
         "text": True,
     }
     assert mock_instance.execute_run.mock_calls == [
-        call(
-            ["mkdir", "-p", "/usr/local/share/ca-certificates"],
-            **default_args,
-        ),
-        call(
-            ["/bin/sh", "-c", "/usr/sbin/update-ca-certificates > /dev/null"],
-            **default_args,
-        ),
         call(
             ["test", "-d", "/etc/apt"],
             **default_args,
         ),
         call(
-            ["/bin/rm", "-Rf", "/var/lib/apt/lists"],
+            [
+                "/bin/sh",
+                "-ec",
+                _get_script(
+                    "/bin/sh -c '/usr/sbin/update-ca-certificates > /dev/null'",
+                    "/bin/rm -Rf /var/lib/apt/lists",
+                    "apt update",
+                ),
+            ],
             **default_args,
         ),
         call(
-            ["apt", "update"],
-            **default_args,
-        ),
-        call(
-            ["mkdir", "-p", "/root/.pip"],
-            **default_args,
-        ),
-        call(
-            ["systemctl", "restart", "snapd"],
-            **default_args,
-        ),
-        call(
-            ["snap", "set", "system", "proxy.http=test-proxy"],
-            **default_args,
-        ),
-        call(
-            ["snap", "set", "system", "proxy.https=test-proxy"],
+            [
+                "/bin/sh",
+                "-ec",
+                (
+                    "systemctl restart snapd\n"
+                    "snap set system proxy.http=test-proxy\n"
+                    "snap set system proxy.https=test-proxy"
+                ),
+            ],
             **default_args,
         ),
     ]
+    emitter.assert_progress("Refreshing Apt package listings")
 
-    # Files pushed to the instance
-    assert mock_instance.push_file.mock_calls == [
-        call(
-            source=proxy_cert,
-            destination=pathlib.Path("/usr/local/share/ca-certificates/local-ca.crt"),
-        )
-    ]
 
-    assert mock_instance.push_file_io.mock_calls == [
-        call(
-            destination=pathlib.Path("/etc/apt/apt.conf.d/99proxy"),
-            content=mocker.ANY,
-            file_mode="0644",
-        ),
-        call(
-            destination=pathlib.Path("/root/.pip/pip.conf"),
-            content=mocker.ANY,
-            file_mode="0644",
-        ),
-    ]
+def test_configure_with_preparation(proxy_service, new_dir):
+    """Configuration is only added to a preparation that's passed in."""
+    proxy_cert = pathlib.Path("test.pem")
+    proxy_cert.write_text("my-cert")
+    proxy_service.configure(proxy_cert=proxy_cert, http_proxy="test-proxy")
+    mock_instance = mock.MagicMock(spec_set=LXDInstance)
+    preparation = util.InstancePreparation()
+
+    proxy_service.configure_instance(mock_instance, preparation)
+    proxy_service.finalize_instance_configuration(mock_instance, preparation)
+
+    # Only the check for apt has run.
+    mock_instance.push_file_io.assert_not_called()
+    assert len(mock_instance.execute_run.mock_calls) == 1
+
+    preparation.apply(mock_instance)
+
+    assert set(_get_pushed_files(mock_instance)) == {
+        "usr/local/share/ca-certificates/local-ca.crt",
+        "etc/apt/apt.conf.d/99proxy",
+        "root/.pip/pip.conf",
+    }
+    assert mock_instance.execute_run.mock_calls[1].args[0][2] == _get_script(
+        "/bin/sh -c '/usr/sbin/update-ca-certificates > /dev/null'",
+        "/bin/rm -Rf /var/lib/apt/lists",
+        "apt update",
+        "systemctl restart snapd",
+        "snap set system proxy.http=test-proxy",
+        "snap set system proxy.https=test-proxy",
+    )
+
+
+def test_configure_once(proxy_service, new_dir, emitter):
+    """An instance is only configured once."""
+    proxy_cert = pathlib.Path("test.pem")
+    proxy_cert.write_text("my-cert")
+    proxy_service.configure(proxy_cert=proxy_cert, http_proxy="test-proxy")
+    mock_instance = mock.MagicMock(spec_set=LXDInstance)
+
+    env = proxy_service.configure_instance(mock_instance)
+    mock_instance.reset_mock()
+
+    assert proxy_service.configure_instance(mock_instance) == env
+    mock_instance.push_file_io.assert_not_called()
+    mock_instance.execute_run.assert_not_called()
+    emitter.assert_debug("Proxy already configured in instance.")
+    # Another instance is configured as usual.
+    other_instance = mock.MagicMock(spec_set=LXDInstance)
+    assert proxy_service.configure_instance(other_instance) == env
+    other_instance.push_file_io.assert_called_once()
 
 
 def test_configure_skip_apt(mocker, proxy_service, new_dir, emitter):
@@ -137,11 +202,14 @@ def test_configure_skip_apt(mocker, proxy_service, new_dir, emitter):
     mock_instance.execute_run.side_effect = _has_apt
 
     proxy_service.configure_instance(mock_instance)
-    proxy_service.finalize_instance_configuration(mock_instance)
 
     emitter.assert_debug(
         "Not configuring the proxy for apt because apt isn't available in the instance."
     )
+    assert set(_get_pushed_files(mock_instance)) == {
+        "usr/local/share/ca-certificates/local-ca.crt",
+        "root/.pip/pip.conf",
+    }
     # Execution calls on the instance
     default_args = {
         "check": True,
@@ -150,52 +218,22 @@ def test_configure_skip_apt(mocker, proxy_service, new_dir, emitter):
         "text": True,
     }
     assert mock_instance.execute_run.mock_calls == [
-        call(
-            ["mkdir", "-p", "/usr/local/share/ca-certificates"],
-            **default_args,
-        ),
-        call(
-            ["/bin/sh", "-c", "/usr/sbin/update-ca-certificates > /dev/null"],
-            **default_args,
-        ),
         call(
             ["test", "-d", "/etc/apt"],
             **default_args,
         ),
         call(
-            ["mkdir", "-p", "/root/.pip"],
-            **default_args,
-        ),
-        call(
-            ["systemctl", "restart", "snapd"],
-            **default_args,
-        ),
-        call(
-            ["snap", "set", "system", "proxy.http=test-proxy"],
-            **default_args,
-        ),
-        call(
-            ["snap", "set", "system", "proxy.https=test-proxy"],
+            [
+                "/bin/sh",
+                "-ec",
+                _get_script(
+                    "/bin/sh -c '/usr/sbin/update-ca-certificates > /dev/null'"
+                ),
+            ],
             **default_args,
         ),
     ]
 
-    # Files pushed to the instance
-    assert mock_instance.push_file.mock_calls == [
-        call(
-            source=proxy_cert,
-            destination=pathlib.Path("/usr/local/share/ca-certificates/local-ca.crt"),
-        )
-    ]
-
-    assert mock_instance.push_file_io.mock_calls == [
-        call(
-            destination=pathlib.Path("/root/.pip/pip.conf"),
-            content=mocker.ANY,
-            file_mode="0644",
-        ),
-    ]
-
 
 def test_not_configured(proxy_service, emitter):
     """No-op if the ProxyService isn't configured."""
@@ -17,6 +17,7 @@
 
 import datetime
 import pathlib
+import threading
 from unittest import mock
 
 import launchpadlib.errors
@@ -357,6 +358,33 @@ def test_create_new_recipe_build_path(remote_build_service, mock_lp_project):
     )
 
 
+def test_lp_login_is_lazy(app_metadata, fake_services, fake_launchpad, mocker):
+    mock_get_client = mocker.patch.object(
+        services.RemoteBuildService, "_get_lp_client", return_value=fake_launchpad
+    )
+    service = services.RemoteBuildService(app_metadata, fake_services)
+
+    service.setup()
+    mock_get_client.assert_not_called()
+
+    assert service.lp is fake_launchpad
+    assert service.lp is fake_launchpad
+    mock_get_client.assert_called_once_with()
+
+
+def test_get_build_states_skips_refreshing_fresh_builds(remote_build_service):
+    build = mock.Mock(arch_tag="riscv64")
+    build.get_state.return_value = launchpad.models.BuildState.PENDING
+    remote_build_service._builds = [build]
+    remote_build_service._builds_are_fresh = True
+
+    remote_build_service._get_build_states()
+    build.lp_refresh.assert_not_called()
+
+    remote_build_service._get_build_states()
+    build.lp_refresh.assert_called_once_with()
+
+
 def test_not_setup(remote_build_service):
     with pytest.raises(RuntimeError):
         all(remote_build_service.monitor_builds())
@@ -487,6 +515,153 @@ def test_fetch_artifacts_url_decode(tmp_path, remote_build_service, mocker):
     )
 
 
+def test_fetch_build_outputs(tmp_path, remote_build_service, mocker):
+    mock_datetime = mocker.patch("datetime.datetime")
+    mock_datetime.now().isoformat.return_value = "2024-01-01T12:34:56"
+    remote_build_service._name = "appname-project-checksum"
+    remote_build_service._builds = [
+        mock.Mock(
+            arch_tag=arch,
+            build_log_url=f"https://example.com/{arch}.txt",
+            get_artifact_urls=mock.Mock(
+                return_value=[f"https://example.com/files/test_{arch}.charm"]
+            ),
+        )
+        for arch in ("amd64", "riscv64")
+    ]
+    remote_build_service._is_setup = True
+    remote_build_service.request = mock.Mock()
+    remote_build_service.request.download_files.side_effect = lambda files: files
+
+    outputs = remote_build_service.fetch_build_outputs("riscv64", tmp_path).result()
+
+    assert outputs == services.remotebuild.BuildOutputs(
+        arch="riscv64",
+        log=tmp_path / "appname-project-checksum_riscv64_2024-01-01T12:34:56.txt",
+        artifacts=[tmp_path / "test_riscv64.charm"],
+    )
+    assert remote_build_service.request.download_files.mock_calls == [
+        mock.call({"https://example.com/riscv64.txt": outputs.log}),
+        mock.call(
+            {"https://example.com/files/test_riscv64.charm": outputs.artifacts[0]}
+        ),
+    ]
+    remote_build_service._builds[0].get_artifact_urls.assert_not_called()
+
+
+def test_fetch_build_outputs_no_log(tmp_path, remote_build_service):
+    remote_build_service._builds = [
+        mock.Mock(
+            arch_tag="amd64",
+            build_log_url=None,
+            get_artifact_urls=mock.Mock(return_value=[]),
+        )
+    ]
+    remote_build_service._is_setup = True
+    remote_build_service.request = mock.Mock()
+    remote_build_service.request.download_files.side_effect = lambda files: files
+
+    outputs = remote_build_service.fetch_build_outputs("amd64", tmp_path).result()
+
+    assert outputs == services.remotebuild.BuildOutputs(
+        arch="amd64", log=None, artifacts=[]
+    )
+
+
+def test_fetch_build_outputs_errors(tmp_path, remote_build_service):
+    with pytest.raises(RuntimeError):
+        remote_build_service.fetch_build_outputs("amd64", tmp_path)
+
+    remote_build_service._builds = [mock.Mock(arch_tag="amd64")]
+    remote_build_service._is_setup = True
+    with pytest.raises(ValueError, match="No build found for architecture 's390x'"):
+        remote_build_service.fetch_build_outputs("s390x", tmp_path)
+
+
+def test_stop_fetching(remote_build_service):
+    # Stopping before any fetch has started is a no-op.
+    remote_build_service.stop_fetching()
+
+    executor = mock.Mock()
+    remote_build_service._download_executor = executor
+    remote_build_service.stop_fetching()
+
+    executor.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+    assert remote_build_service._download_executor is None
+
+
+def test_cancel_builds(remote_build_service):
+    builds = [mock.Mock(arch_tag=arch) for arch in ("amd64", "arm64", "riscv64")]
+    remote_build_service._builds = builds
+    remote_build_service._is_setup = True
+
+    remote_build_service.cancel_builds()
+
+    for build in builds:
+        build.cancel.assert_called_once_with()
+
+
+def test_cancel_builds_concurrently(remote_build_service):
+    """All builds are cancelled at the same time, up to max_requests."""
+    remote_build_service.max_requests = 3
+    barrier = threading.Barrier(3, timeout=5)
+    builds = [mock.Mock(cancel=barrier.wait) for _ in range(3)]
+    remote_build_service._builds = builds
+    remote_build_service._is_setup = True
+
+    remote_build_service.cancel_builds()
+
+    assert not barrier.broken
+
+
+def test_cancel_builds_errors(remote_build_service):
+    builds = [mock.Mock() for _ in range(3)]
+    builds[0].cancel.side_effect = launchpad.errors.BuildError("amd64 failed")
+    builds[2].cancel.side_effect = launchpad.errors.BuildError("riscv64 failed")
+    remote_build_service._builds = builds
+    remote_build_service._is_setup = True
+
+    with pytest.raises(errors.CancelFailedError) as exc_info:
+        remote_build_service.cancel_builds()
+
+    assert exc_info.value.details == "amd64 failed\nriscv64 failed"
+    builds[1].cancel.assert_called_once_with()
+
+
+def test_cancel_builds_unexpected_error(remote_build_service):
+    builds = [mock.Mock(), mock.Mock()]
+    builds[1].cancel.side_effect = ValueError("oops")
+    remote_build_service._builds = builds
+    remote_build_service._is_setup = True
+
+    with pytest.raises(ValueError, match="oops"):
+        remote_build_service.cancel_builds()
+
+
+def test_cancel_builds_no_builds(remote_build_service):
+    remote_build_service._is_setup = True
+
+    remote_build_service.cancel_builds()
+
+
+def test_cancel_builds_not_setup(remote_build_service):
+    with pytest.raises(RuntimeError):
+        remote_build_service.cancel_builds()
+
+
+def test_cleanup(remote_build_service):
+    calls = mock.Mock()
+    remote_build_service._recipe = calls.recipe
+    remote_build_service._repository = calls.repository
+
+    remote_build_service.cleanup()
+
+    assert calls.mock_calls == [
+        mock.call.recipe.delete(),
+        mock.call.repository.delete(),
+    ]
+
+
 @pytest.mark.parametrize("architectures", [["amd64"], None])
 @pytest.mark.parametrize("build_path", [None, "subdir"])
 @pytest.mark.usefixtures("mock_push_url")
@@ -114,3 +114,30 @@ def test_download_files_with_progress(tmp_path, emitter, request_service, downlo
 
     for url, path in results.items():
         assert path.read_bytes() == downloads[url]
+
+
+@responses.activate
+def test_download_files(tmp_path, emitter, request_service):
+    downloads = {
+        "http://example/empty.txt": b"",
+        "http://example/file": b"abc",
+    }
+    for url, data in downloads.items():
+        responses.add(
+            responses.GET, url, body=data, headers={"Content-Length": str(len(data))}
+        )
+
+    results = request_service.download_files(
+        {"http://example/empty.txt": tmp_path, "http://example/file": tmp_path / "f"}
+    )
+
+    assert results == {
+        "http://example/empty.txt": tmp_path / "empty.txt",
+        "http://example/file": tmp_path / "f",
+    }
+    for url, path in results.items():
+        assert path.read_bytes() == downloads[url]
+    assert not any(
+        interaction.args[0] in ("progress_bar", "advance")
+        for interaction in emitter.interactions
+    )
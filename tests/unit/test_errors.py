@@ -27,6 +27,7 @@ from craft_application.errors import (
     InvalidUbuntuProBaseError,
     InvalidUbuntuProServiceError,
     InvalidUbuntuProStatusError,
+    PackArtifactsError,
     PartsLifecycleError,
     UbuntuProAttachedError,
     UbuntuProClientNotFoundError,
@@ -169,6 +170,40 @@ def test_validation_error_from_pydantic_model():
     assert message == expected
 
 
+@pytest.mark.parametrize(
+    ("failures", "message", "details"),
+    [
+        pytest.param(
+            {None: ValueError("boom")},
+            "Could not pack the default artifact.",
+            "default: boom",
+            id="default",
+        ),
+        pytest.param(
+            {"tools": ValueError("boom")},
+            "Could not pack artifact 'tools'.",
+            "tools: boom",
+            id="named",
+        ),
+        pytest.param(
+            {None: ValueError("boom"), "tools": OSError("bang")},
+            "Could not pack 2 artifacts.",
+            "default: boom\ntools: bang",
+            id="multiple",
+        ),
+    ],
+)
+def test_pack_artifacts_error(failures, message, details):
+    packed = dict.fromkeys(failures, False)
+
+    err = PackArtifactsError(packed, failures)
+
+    assert str(err) == message
+    assert err.details == details
+    assert err.packed is packed
+    assert err.failures is failures
+
+
 def test_ubuntu_pro_client_not_found_error():
     err = UbuntuProClientNotFoundError("/usr/bin/pro")
 
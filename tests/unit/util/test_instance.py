@@ -0,0 +1,291 @@
+# This file is part of craft-application.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for instance utilities."""
+
+import pathlib
+import subprocess
+import tarfile
+import time
+from unittest import mock
+
+import craft_providers
+import pytest
+from craft_application.util import (
+    DeferredMessages,
+    InstanceLogStream,
+    InstancePreparation,
+)
+
+
+@pytest.fixture
+def mock_instance():
+    return mock.MagicMock(spec=craft_providers.Executor)
+
+
+def test_empty(mock_instance):
+    preparation = InstancePreparation()
+
+    preparation.apply(mock_instance)
+
+    assert not preparation
+    assert mock_instance.mock_calls == []
+
+
+def test_single_file(mock_instance, emitter):
+    preparation = InstancePreparation()
+    preparation.add_file(pathlib.Path("/root/.bashrc"), b"bashrc", mode=0o600)
+
+    preparation.apply(mock_instance)
+
+    mock_instance.push_file_io.assert_called_once_with(
+        destination=pathlib.Path("/root/.bashrc"), content=mock.ANY, file_mode="600"
+    )
+    assert mock_instance.push_file_io.call_args.kwargs["content"].read() == b"bashrc"
+    mock_instance.execute_run.assert_called_once_with(
+        ["/bin/sh", "-ec", "mkdir -p /root"],
+        check=True,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    emitter.assert_debug(r"Pushed '/root/.bashrc' in \d+\.\d{3}s", regex=True)
+
+
+def test_single_file_new_directory(tmp_path):
+    """A single file's parent directory is created first."""
+    host_instance = mock.MagicMock(spec=craft_providers.Executor)
+    host_instance.execute_run.side_effect = subprocess.run
+    host_instance.push_file_io.side_effect = lambda destination, content, file_mode: (
+        destination.write_bytes(content.read())
+    )
+    destination = tmp_path / "new" / "dir" / "file"
+    preparation = InstancePreparation()
+    preparation.add_file(destination, b"content")
+
+    preparation.apply(host_instance)
+
+    assert destination.read_bytes() == b"content"
+
+
+def test_files_and_commands(mock_instance, emitter):
+    preparation = InstancePreparation()
+    preparation.add_file(pathlib.Path("/etc/one.conf"), b"one")
+    preparation.add_file(pathlib.PurePosixPath("/usr/bin/two"), b"two", mode=0o755)
+    preparation.add_command(["echo", "hello world"])
+    preparation.add_command(["update-things"])
+
+    preparation.apply(mock_instance)
+
+    mock_instance.push_file_io.assert_called_once_with(
+        destination=pathlib.Path("/tmp/craft-instance-preparation.tar"),
+        content=mock.ANY,
+        file_mode="600",
+    )
+    content = mock_instance.push_file_io.call_args.kwargs["content"]
+    content.seek(0)
+    with tarfile.open(fileobj=content) as tar:
+        members = {member.name: member for member in tar.getmembers()}
+        assert {name: member.mode for name, member in members.items()} == {
+            "etc/one.conf": 0o644,
+            "usr/bin/two": 0o755,
+        }
+        assert tar.extractfile(members["usr/bin/two"]).read() == b"two"
+
+    mock_instance.execute_run.assert_called_once_with(
+        [
+            "/bin/sh",
+            "-ec",
+            (
+                "command -v tar >/dev/null || "
+                "{ echo 'craft-instance-preparation: tar not found' >&2; exit 1; }\n"
+                "tar -xf /tmp/craft-instance-preparation.tar -C /\n"
+                "rm -f /tmp/craft-instance-preparation.tar\n"
+                "echo 'hello world'\n"
+                "update-things"
+            ),
+        ],
+        check=True,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    emitter.assert_debug(
+        r"Archived 2 files for the instance \(\d+ bytes\) in \d+\.\d{3}s", regex=True
+    )
+    emitter.assert_debug(r"Ran 2 commands in the instance in \d+\.\d{3}s", regex=True)
+    # Applying again doesn't send anything.
+    assert not preparation
+
+
+def test_commands_only(mock_instance):
+    preparation = InstancePreparation()
+    preparation.add_command(["true"])
+
+    preparation.apply(mock_instance)
+
+    mock_instance.push_file_io.assert_not_called()
+    mock_instance.execute_run.assert_called_once_with(
+        ["/bin/sh", "-ec", "true"],
+        check=True,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+
+
+def test_files_without_tar(mock_instance, emitter):
+    mock_instance.execute_run.side_effect = [
+        subprocess.CalledProcessError(
+            1, "sh", stderr="craft-instance-preparation: tar not found\n"
+        ),
+        None,
+        None,
+    ]
+    preparation = InstancePreparation()
+    preparation.add_file(pathlib.Path("/etc/one.conf"), b"one")
+    preparation.add_file(pathlib.Path("/usr/bin/two"), b"two", mode=0o755)
+    preparation.add_command(["update-things"])
+
+    preparation.apply(mock_instance)
+
+    assert [
+        call.args[0][2] for call in mock_instance.execute_run.call_args_list[1:]
+    ] == [
+        "rm -f /tmp/craft-instance-preparation.tar\nmkdir -p /etc /usr/bin",
+        "update-things",
+    ]
+    assert mock_instance.push_file_io.call_args_list[1:] == [
+        mock.call(
+            destination=pathlib.Path("/etc/one.conf"),
+            content=mock.ANY,
+            file_mode="644",
+        ),
+        mock.call(
+            destination=pathlib.Path("/usr/bin/two"),
+            content=mock.ANY,
+            file_mode="755",
+        ),
+    ]
+    emitter.assert_debug("The instance has no tar, pushing the files one at a time")
+
+
+def test_command_fails(mock_instance):
+    error = subprocess.CalledProcessError(1, "sh", stderr="update failed\n")
+    mock_instance.execute_run.side_effect = error
+    preparation = InstancePreparation()
+    preparation.add_file(pathlib.Path("/etc/one.conf"), b"one")
+    preparation.add_command(["update-things"])
+
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        preparation.apply(mock_instance)
+
+    assert exc_info.value is error
+    mock_instance.execute_run.assert_called_once()
+
+
+def test_command_progress(mock_instance, emitter):
+    preparation = InstancePreparation()
+    preparation.add_command(["true"])
+    preparation.add_command(["apt", "update"], progress="Refreshing")
+
+    preparation.apply(mock_instance)
+    preparation.add_command(["true"])
+    preparation.apply(mock_instance)
+
+    emitter.assert_progress("Refreshing")
+    assert [call for call in emitter.interactions if call.args[0] == "progress"] == [
+        mock.call("progress", "Refreshing")
+    ]
+
+
+def test_deferred_messages(mock_instance, emitter):
+    messages = DeferredMessages()
+    preparation = InstancePreparation(messages)
+    preparation.messages.progress("Preparing")
+    preparation.add_command(["true"])
+
+    preparation.apply(mock_instance)
+    assert emitter.interactions == []
+    messages.replay()
+
+    emitter.assert_interactions(
+        [
+            mock.call("progress", "Preparing"),
+            mock.call("debug", mock.ANY),
+        ]
+    )
+
+
+@pytest.fixture
+def local_instance():
+    """An "instance" that runs its commands on the host."""
+    instance = mock.MagicMock(spec=craft_providers.Executor)
+    instance.execute_popen.side_effect = subprocess.Popen
+    return instance
+
+
+def _wait_for(condition) -> None:
+    deadline = time.monotonic() + 10
+    while not condition():
+        assert time.monotonic() < deadline, "Timed out"
+        time.sleep(0.01)
+
+
+def test_log_stream(tmp_path, local_instance):
+    source = tmp_path / "instance.log"
+    source.write_text("existing line\n")
+    destination = tmp_path / "host.log"
+    destination.write_text("host line\n")
+
+    with InstanceLogStream(local_instance, source, destination) as stream:
+        _wait_for(lambda: destination.read_text().count("\n") == 2)
+        with source.open("a") as log:
+            log.write("streamed line\nunfinished ")
+        _wait_for(lambda: "streamed line" in destination.read_text())
+        # The rest of this is only fetched once the stream closes.
+        with source.open("a") as log:
+            log.write("line\n" + "last line without a newline")
+
+    assert stream.complete
+    assert destination.read_text() == (
+        "host line\n"
+        ":: existing line\n"
+        ":: streamed line\n"
+        ":: unfinished line\n"
+        ":: last line without a newline\n"
+    )
+
+
+def test_log_stream_missing_log(tmp_path, local_instance):
+    destination = tmp_path / "host.log"
+
+    with InstanceLogStream(
+        local_instance, tmp_path / "missing.log", destination
+    ) as stream:
+        pass
+
+    assert not stream.complete
+    assert not destination.exists()
+
+
+def test_log_stream_error(tmp_path):
+    instance = mock.MagicMock(spec=craft_providers.Executor)
+    instance.execute_popen.side_effect = craft_providers.ProviderError("No exec")
+
+    with InstanceLogStream(instance, tmp_path / "log", tmp_path / "host") as stream:
+        pass
+
+    assert not stream.complete
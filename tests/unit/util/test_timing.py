@@ -0,0 +1,118 @@
+# This file is part of craft-application.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for timing utilities."""
+
+import json
+import os
+import threading
+
+import pytest
+from craft_application.util import Timings, TimingSpan
+
+
+def test_span():
+    timings = Timings()
+
+    with timings.span("Pulling my-part", category="pull", part="my-part"):
+        pass
+
+    (span,) = timings.spans
+    assert span == TimingSpan(
+        name="Pulling my-part",
+        category="pull",
+        start=pytest.approx(span.start),
+        duration=pytest.approx(span.duration),
+        thread="MainThread",
+        args={"part": "my-part"},
+    )
+    assert span.start >= 0
+    assert span.duration >= 0
+
+
+def test_span_error():
+    timings = Timings()
+
+    with pytest.raises(ValueError, match="oops"):
+        with timings.span("Failing", category="test"):
+            raise ValueError("oops")
+
+    assert [span.name for span in timings.spans] == ["Failing"]
+
+
+def test_clear():
+    timings = Timings()
+    with timings.span("Old", category="test"):
+        pass
+
+    timings.clear()
+
+    assert timings.spans == []
+
+
+def test_chrome_trace(tmp_path):
+    timings = Timings()
+    with timings.span("Outer", category="lifecycle"):
+        with timings.span("Inner", category="pull", part="my-part"):
+            pass
+
+    trace_path = tmp_path / "log" / "trace.json"
+    timings.write_chrome_trace(trace_path)
+
+    trace = json.loads(trace_path.read_text())
+    assert trace["displayTimeUnit"] == "ms"
+    metadata, inner, outer = trace["traceEvents"]
+    assert metadata == {
+        "name": "thread_name",
+        "ph": "M",
+        "pid": os.getpid(),
+        "tid": 0,
+        "args": {"name": "MainThread"},
+    }
+    assert inner == {
+        "name": "Inner",
+        "cat": "pull",
+        "ph": "X",
+        "ts": inner["ts"],
+        "dur": inner["dur"],
+        "pid": os.getpid(),
+        "tid": 0,
+        "args": {"part": "my-part"},
+    }
+    assert outer["ts"] <= inner["ts"]
+    assert outer["ts"] + outer["dur"] >= inner["ts"] + inner["dur"]
+
+
+def test_chrome_trace_threads():
+    timings = Timings()
+
+    def work() -> None:
+        with timings.span("Threaded", category="build"):
+            pass
+
+    thread = threading.Thread(target=work, name="lifecycle_0")
+    thread.start()
+    thread.join()
+    with timings.span("Main", category="lifecycle"):
+        pass
+
+    events = timings.get_chrome_trace()["traceEvents"]
+    assert [(event["name"], event["tid"]) for event in events] == [
+        ("thread_name", 0),
+        ("Threaded", 0),
+        ("thread_name", 1),
+        ("Main", 1),
+    ]
+    assert events[0]["args"] == {"name": "lifecycle_0"}